@@ -0,0 +1,125 @@
+import asyncio
+import time
+import torch
+import numpy as np
+from typing import Dict, List
+import pandas as pd
+from rt_fads.serving.executor import InferenceExecutor
+from rt_fads.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ExecutorBenchmarker:
+    """Compare handler latency with and without the inference executor
+
+    Each simulated request runs a forward pass followed by a gradient-based
+    explanation, mirroring the ``/predict`` handler. In ``inline`` mode the
+    work runs directly on the event loop; in ``executor`` mode it is awaited
+    on an ``InferenceExecutor``.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        input_dim = config.get('input_dim', 128)
+        hidden_dim = config.get('hidden_dim', 256)
+
+        self.model = torch.nn.Sequential(
+            torch.nn.Linear(input_dim, hidden_dim),
+            torch.nn.ReLU(),
+            torch.nn.Linear(hidden_dim, hidden_dim),
+            torch.nn.ReLU(),
+            torch.nn.Linear(hidden_dim, 1)
+        ).eval()
+        self.sample = torch.randn(1, input_dim)
+
+    def _score(self, x: torch.Tensor) -> float:
+        """Forward pass for a single transaction"""
+        with torch.no_grad():
+            return torch.sigmoid(self.model(x)).item()
+
+    def _explain(self, x: torch.Tensor) -> torch.Tensor:
+        """Integrated-gradients style explanation"""
+        steps = self.config.get('explanation_steps', 20)
+        alphas = torch.linspace(0, 1, steps).view(-1, 1)
+        scaled = (alphas * x).requires_grad_(True)
+        self.model(scaled).sum().backward()
+        return (scaled.grad.mean(dim=0) * x[0]).detach()
+
+    async def _client(
+        self,
+        num_requests: int,
+        executor: InferenceExecutor = None
+    ) -> List[float]:
+        """Issue sequential requests and record their latencies"""
+        latencies = []
+        for _ in range(num_requests):
+            start_time = time.perf_counter()
+            if executor is None:
+                self._score(self.sample)
+                self._explain(self.sample)
+                # Yield to the loop like a real handler between requests
+                await asyncio.sleep(0)
+            else:
+                await executor.run(self._score, self.sample)
+                await executor.run(self._explain, self.sample)
+            latencies.append(time.perf_counter() - start_time)
+        return latencies
+
+    async def _run_level(
+        self,
+        concurrency: int,
+        use_executor: bool
+    ) -> Dict[str, float]:
+        """Run all clients for one concurrency level"""
+        executor = (
+            InferenceExecutor.from_config(self.config)
+            if use_executor else None
+        )
+        num_requests = self.config.get('requests_per_client', 20)
+
+        start_time = time.perf_counter()
+        results = await asyncio.gather(*(
+            self._client(num_requests, executor)
+            for _ in range(concurrency)
+        ))
+        elapsed = time.perf_counter() - start_time
+
+        if executor is not None:
+            executor.shutdown()
+
+        latencies = np.concatenate(results) * 1000
+        return {
+            'mode': 'executor' if use_executor else 'inline',
+            'concurrency': concurrency,
+            'p50_latency_ms': np.percentile(latencies, 50),
+            'p99_latency_ms': np.percentile(latencies, 99),
+            'throughput': len(latencies) / elapsed
+        }
+
+    def run(
+        self,
+        concurrency_levels: List[int] = [1, 16, 128]
+    ) -> pd.DataFrame:
+        """Run the benchmark for every concurrency level and mode"""
+        results = []
+        for concurrency in concurrency_levels:
+            for use_executor in (False, True):
+                result = asyncio.run(
+                    self._run_level(concurrency, use_executor)
+                )
+                logger.info(f"Benchmark result: {result}")
+                results.append(result)
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = ExecutorBenchmarker({
+        'input_dim': 128,
+        'hidden_dim': 256,
+        'inference_workers': 4,
+        'intra_op_threads': 1,
+        'max_in_flight': 64
+    })
+    print(benchmarker.run().to_string(index=False))
@@ -0,0 +1,128 @@
+import time
+import torch
+import numpy as np
+from typing import Dict, Tuple
+import pandas as pd
+import networkx as nx
+from rt_fads.data.graph_builder import GraphBuilder
+from rt_fads.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def legacy_build_graph(
+    data: pd.DataFrame,
+    config: Dict
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """Row-by-row NetworkX builder that ``GraphBuilder`` replaced"""
+    graph = nx.DiGraph()
+    for _, row in data.iterrows():
+        features = [row[config['amount_col']]]
+        if config['timestamp_col'] in row:
+            timestamp = pd.to_datetime(row[config['timestamp_col']])
+            features.extend([timestamp.hour, timestamp.day_of_week,
+                             timestamp.day, timestamp.month])
+        graph.add_edge(
+            row[config['source_col']],
+            row[config['target_col']],
+            features=np.array(features)
+        )
+
+    edges = list(graph.edges())
+    edge_index = torch.tensor(
+        [[e[0] for e in edges], [e[1] for e in edges]],
+        dtype=torch.long
+    )
+    edge_attr = torch.tensor(
+        [graph[e[0]][e[1]]['features'] for e in edges],
+        dtype=torch.float
+    )
+    return edge_index, edge_attr
+
+
+class GraphBuilderBenchmarker:
+    """Graph construction time of the columnar builder
+
+    Synthetic transactions between ``num_edges / edges_per_account``
+    accounts are built at each size and edge mode. The legacy row-by-row
+    NetworkX builder is timed once at ``legacy_edges`` transactions, since
+    it takes minutes at the larger sizes.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.builder_config = {
+            'source_col': 'source',
+            'target_col': 'target',
+            'amount_col': 'amount',
+            'timestamp_col': 'timestamp'
+        }
+
+    def _generate(self, num_edges: int) -> pd.DataFrame:
+        """Generate synthetic transactions"""
+        rng = np.random.default_rng(self.config.get('seed', 0))
+        num_accounts = max(2, num_edges // self.config.get(
+            'edges_per_account', 10
+        ))
+        return pd.DataFrame({
+            'source': rng.integers(0, num_accounts, num_edges),
+            'target': rng.integers(0, num_accounts, num_edges),
+            'amount': rng.exponential(100.0, num_edges),
+            'timestamp': pd.Timestamp('2024-01-01') + pd.to_timedelta(
+                rng.integers(0, 86400, num_edges), unit='s'
+            )
+        })
+
+    def _time(self, fn, data: pd.DataFrame) -> Dict:
+        start_time = time.perf_counter()
+        edge_index, _ = fn(data)
+        elapsed = time.perf_counter() - start_time
+        return {
+            'transactions': len(data),
+            'edges': edge_index.shape[1],
+            'seconds': elapsed,
+            'transactions_per_s': len(data) / elapsed
+        }
+
+    def run(self) -> pd.DataFrame:
+        """Time the legacy builder once and each edge mode per size"""
+        results = []
+
+        legacy_data = self._generate(self.config.get('legacy_edges', 100000))
+        results.append({
+            'builder': 'legacy',
+            'edge_mode': 'last',
+            **self._time(
+                lambda data: legacy_build_graph(data, self.builder_config),
+                legacy_data
+            )
+        })
+
+        for num_edges in self.config.get(
+            'sizes', [1000000, 10000000, 50000000]
+        ):
+            data = self._generate(num_edges)
+            for edge_mode in self.config.get(
+                'edge_modes', GraphBuilder.EDGE_MODES
+            ):
+                builder = GraphBuilder({
+                    **self.builder_config,
+                    'edge_mode': edge_mode
+                })
+                results.append({
+                    'builder': 'columnar',
+                    'edge_mode': edge_mode,
+                    **self._time(builder.build_graph, data)
+                })
+                del builder
+            del data
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = GraphBuilderBenchmarker({
+        'sizes': [1000000, 10000000, 50000000],
+        'legacy_edges': 100000
+    })
+    print(benchmarker.run().to_string(index=False))
@@ -0,0 +1,208 @@
+import time
+import numpy as np
+from typing import Dict, Tuple
+import pandas as pd
+import networkx as nx
+from rt_fads.data.graph_features import (
+    GraphFeatures,
+    IncrementalGraphFeatures,
+    clustering,
+    pagerank
+)
+from rt_fads.data.graph_store import IncrementalGraphStore
+from rt_fads.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class GraphFeaturesBenchmarker:
+    """Accuracy and time of graph features against NetworkX
+
+    For each graph size, PageRank and clustering are computed with
+    ``GraphFeatures`` (at each clustering wedge budget) and, up to
+    ``networkx_max_edges``, with NetworkX as the reference. Warm-start
+    iterations are measured after appending ``update_fraction`` more
+    edges.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.rng = np.random.default_rng(config.get('seed', 0))
+
+    def _generate(self, num_edges: int) -> Tuple[np.ndarray, int]:
+        """Random edges with a heavy-tailed degree distribution"""
+        num_nodes = max(2, num_edges // self.config.get(
+            'edges_per_node', 10
+        ))
+        weights = 1.0 / np.arange(1, num_nodes + 1) ** 0.8
+        weights /= weights.sum()
+        edges = self.rng.choice(num_nodes, size=(2, num_edges), p=weights)
+        return np.unique(edges, axis=1), num_nodes
+
+    def run(self) -> pd.DataFrame:
+        """Compare each method per graph size"""
+        results = []
+
+        for num_edges in self.config.get('sizes', [100000, 1000000]):
+            edges, num_nodes = self._generate(num_edges)
+            reference = None
+            if edges.shape[1] <= self.config.get('networkx_max_edges',
+                                                 1000000):
+                graph = nx.DiGraph()
+                graph.add_nodes_from(range(num_nodes))
+                graph.add_edges_from(edges.T.tolist())
+
+                start_time = time.perf_counter()
+                ranks = nx.pagerank(graph)
+                pagerank_seconds = time.perf_counter() - start_time
+                start_time = time.perf_counter()
+                coefficients = nx.clustering(graph.to_undirected())
+                clustering_seconds = time.perf_counter() - start_time
+
+                reference = (
+                    np.array([ranks[n] for n in range(num_nodes)]),
+                    np.array([coefficients[n] for n in range(num_nodes)])
+                )
+                results.append({
+                    'edges': edges.shape[1],
+                    'method': 'networkx',
+                    'pagerank_seconds': pagerank_seconds,
+                    'clustering_seconds': clustering_seconds
+                })
+
+            start_time = time.perf_counter()
+            ranks, iterations = pagerank(edges, num_nodes)
+            pagerank_seconds = time.perf_counter() - start_time
+
+            num_updates = max(1, int(
+                edges.shape[1] * self.config.get('update_fraction', 0.01)
+            ))
+            features = GraphFeatures({})
+            features.compute(edges[:, :-num_updates], np.arange(num_nodes))
+            features.compute(edges, np.arange(num_nodes))
+            warm_iterations = features.pagerank_iterations
+
+            for max_wedges in self.config.get('max_wedges', [64, 256]):
+                start_time = time.perf_counter()
+                coefficients = clustering(
+                    edges,
+                    num_nodes,
+                    max_wedges=max_wedges,
+                    rng=self.rng
+                )
+                clustering_seconds = time.perf_counter() - start_time
+
+                row = {
+                    'edges': edges.shape[1],
+                    'method': f'numpy_w{max_wedges}',
+                    'pagerank_seconds': pagerank_seconds,
+                    'clustering_seconds': clustering_seconds,
+                    'pagerank_iterations': iterations,
+                    'warm_start_iterations': warm_iterations
+                }
+                if reference is not None:
+                    row['pagerank_max_error'] = np.abs(
+                        ranks - reference[0]
+                    ).max()
+                    row['clustering_mean_error'] = np.abs(
+                        coefficients - reference[1]
+                    ).mean()
+                results.append(row)
+
+        return pd.DataFrame(results)
+
+
+class IncrementalFeaturesBenchmarker:
+    """Refresh time and error of streaming PageRank against batch runs
+
+    A rolling store is filled with ``num_edges`` transactions over one
+    window, then ``num_batches`` batches of ``batch_size`` transactions
+    are streamed, each also expiring about as many. Errors are L1
+    distances to a tightly converged batch PageRank.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+
+    def _transactions(self, num_rows: int) -> pd.DataFrame:
+        rng = np.random.default_rng(self.config.get('seed', 0))
+        num_accounts = max(2, self.config.get('num_edges', 2000000)
+                           // self.config.get('edges_per_node', 10))
+        weights = 1.0 / np.arange(1, num_accounts + 1) ** 0.8
+        weights /= weights.sum()
+        # Spaced so that num_edges transactions span the 30-day window
+        spacing = 30 * 86400 / self.config.get('num_edges', 2000000)
+        return pd.DataFrame({
+            'source': rng.choice(num_accounts, num_rows, p=weights),
+            'target': rng.choice(num_accounts, num_rows, p=weights),
+            'amount': rng.exponential(100.0, num_rows),
+            'timestamp': pd.Timestamp('2024-01-01') + pd.to_timedelta(
+                np.arange(num_rows) * spacing, unit='s'
+            )
+        })
+
+    def run(self) -> pd.DataFrame:
+        """Stream batches at each push tolerance"""
+        num_edges = self.config.get('num_edges', 2000000)
+        batch_size = self.config.get('batch_size', 1000)
+        num_batches = self.config.get('num_batches', 20)
+        data = self._transactions(num_edges + batch_size * num_batches)
+        results = []
+
+        for tol in self.config.get('push_tols', [1e-2, 1e-3, 1e-4]):
+            store = IncrementalGraphStore({
+                'source_col': 'source',
+                'target_col': 'target',
+                'amount_col': 'amount',
+                'timestamp_col': 'timestamp',
+                'initial_capacity': num_edges + batch_size
+            })
+            store.add_transactions(data.iloc[:num_edges])
+            features = IncrementalGraphFeatures(
+                store,
+                {'pagerank_push_tol': tol}
+            )
+            features.refresh()
+
+            seconds = []
+            for offset in range(num_edges, len(data), batch_size):
+                store.add_transactions(data.iloc[offset:offset + batch_size])
+                start_time = time.perf_counter()
+                features.refresh()
+                seconds.append(time.perf_counter() - start_time)
+
+            edge_index = store.edge_index.numpy()
+            exact, _ = pagerank(edge_index, store.num_nodes, tol=1e-12,
+                                max_iter=1000)
+            start_time = time.perf_counter()
+            batch, _ = pagerank(edge_index, store.num_nodes)
+            batch_seconds = time.perf_counter() - start_time
+
+            results.append({
+                'push_tol': tol,
+                'graph_edges': store.num_edges,
+                'refresh_ms': np.mean(seconds) * 1000,
+                'refresh_error': np.abs(features.pagerank - exact).sum(),
+                'batch_ms': batch_seconds * 1000,
+                'batch_error': np.abs(batch - exact).sum()
+            })
+            store.listeners.clear()
+            del features, store
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = GraphFeaturesBenchmarker({
+        'sizes': [100000, 1000000, 10000000],
+        'networkx_max_edges': 1000000,
+        'max_wedges': [64, 256]
+    })
+    print(benchmarker.run().to_string(index=False))
+
+    incremental = IncrementalFeaturesBenchmarker({
+        'num_edges': 2000000,
+        'batch_size': 1000,
+        'push_tols': [1e-2, 1e-3, 1e-4]
+    })
+    print(incremental.run().to_string(index=False))
@@ -0,0 +1,99 @@
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, Sequence
+import pandas as pd
+
+OPTIONAL_DEPENDENCIES = (
+    'secretflow', 'captum', 'horovod', 'networkx', 'sklearn',
+    'prometheus_client'
+)
+
+_IMPORT_TIME_LINE = re.compile(
+    r'import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)'
+)
+
+
+def measure_import_time(
+    module: str,
+    preload: Sequence[str] = ()
+) -> Dict[str, float]:
+    """
+    Measure module import times with ``python -X importtime``
+
+    Args:
+        module: Module to import in a fresh interpreter
+        preload: Modules imported first and excluded from the measurement,
+            e.g. ``torch`` which every entry point needs anyway
+
+    Returns:
+        Cumulative import time in seconds of every module imported while
+        importing ``module``, keyed by module name
+    """
+    statement = ''.join(f'import {name}; ' for name in preload)
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c',
+         f'{statement}import sys; '
+         'sys.stderr.write("rt-fads-import-start\\n"); '
+         f'import {module}'],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True
+    )
+
+    times = {}
+    _, _, measured = result.stderr.partition('rt-fads-import-start\n')
+    for line in measured.splitlines():
+        match = _IMPORT_TIME_LINE.match(line)
+        if match:
+            times[match.group(4)] = int(match.group(2)) / 1e6
+    return times
+
+
+class ImportTimeBenchmarker:
+    """Cold import cost of rt_fads modules with ``python -X importtime``
+
+    Each module is imported in a fresh interpreter after ``preload``
+    (the core libraries every entry point needs), so the reported time is
+    what the module itself adds to startup. Optional dependencies pulled
+    in along the way are listed per module.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.modules = config.get('modules', [
+            'rt_fads.api.server',
+            'rt_fads.serving.registry',
+            'rt_fads.monitoring.metrics_collector',
+            'rt_fads.training.trainer',
+            'rt_fads.training.distributed',
+            'rt_fads.data.graph_builder',
+            'rt_fads.data.preprocessing',
+            'rt_fads.features.feature_engineering',
+            'rt_fads.interpretability.explainer',
+            'rt_fads.utils.metrics'
+        ])
+        self.preload = config.get('preload', ['torch', 'numpy', 'pandas'])
+
+    def run(self) -> pd.DataFrame:
+        """Measure every module and the optional dependencies it loads"""
+        results = []
+        for module in self.modules:
+            times = measure_import_time(module, self.preload)
+            results.append({
+                'module': module,
+                'import_ms': times.get(module, 0.0) * 1000,
+                'optional_dependencies': ', '.join(
+                    name for name in OPTIONAL_DEPENDENCIES if name in times
+                )
+            })
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = ImportTimeBenchmarker({})
+    print(benchmarker.run().to_string(index=False))
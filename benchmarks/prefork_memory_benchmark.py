@@ -0,0 +1,91 @@
+import json
+import os
+import tempfile
+import torch
+from typing import Dict, List
+import pandas as pd
+from rt_fads.serving.prefork import memory_report, share_weights
+from rt_fads.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class PreforkMemoryBenchmarker:
+    """Per-worker memory with private versus shared model weights
+
+    ``private`` mimics the current deployment: every worker loads its own
+    copy of the checkpoint. ``shared`` freezes the weights once in the
+    parent with ``share_weights`` and forks workers that map them.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.num_workers = config.get('workers', 4)
+        self.tmpdir = tempfile.mkdtemp()
+        self.checkpoint_path = os.path.join(self.tmpdir, 'model.pt')
+        self.shared_path = os.path.join(self.tmpdir, 'shared.pt')
+        torch.save(self._build_model().state_dict(), self.checkpoint_path)
+
+    def _build_model(self) -> torch.nn.Module:
+        """Build a stand-in model with the configured weight size"""
+        hidden_dim = self.config.get('hidden_dim', 2048)
+        layers = []
+        for _ in range(self.config.get('num_layers', 12)):
+            layers.extend([torch.nn.Linear(hidden_dim, hidden_dim),
+                           torch.nn.ReLU()])
+        return torch.nn.Sequential(*layers).eval()
+
+    def _worker(self, model: torch.nn.Module) -> Dict:
+        """Load (if needed), run one forward pass and report memory"""
+        if model is None:
+            model = self._build_model()
+            model.load_state_dict(torch.load(self.checkpoint_path))
+        with torch.no_grad():
+            model(torch.randn(1, self.config.get('hidden_dim', 2048)))
+        return memory_report()
+
+    def _run_mode(self, shared: bool) -> List[Dict]:
+        """Fork workers for one mode and collect their reports"""
+        model = None
+        if shared:
+            model = share_weights(self._build_model(), self.shared_path)
+
+        read_fd, write_fd = os.pipe()
+        pids = []
+        for _ in range(self.num_workers):
+            pid = os.fork()
+            if pid == 0:
+                os.close(read_fd)
+                report = self._worker(model)
+                os.write(write_fd, (json.dumps(report) + '\n').encode())
+                os._exit(0)
+            pids.append(pid)
+
+        os.close(write_fd)
+        with os.fdopen(read_fd) as reports:
+            results = [json.loads(line) for line in reports]
+        for pid in pids:
+            os.waitpid(pid, 0)
+        return results
+
+    def run(self) -> pd.DataFrame:
+        """Run both modes and summarize per-worker memory"""
+        results = []
+        for shared in (False, True):
+            for report in self._run_mode(shared):
+                results.append({
+                    'mode': 'shared' if shared else 'private',
+                    **report
+                })
+
+        df = pd.DataFrame(results)
+        return df.groupby('mode')[['rss_mb', 'pss_mb', 'uss_mb']].mean()
+
+
+if __name__ == "__main__":
+    benchmarker = PreforkMemoryBenchmarker({
+        'workers': 4,
+        'hidden_dim': 2048,
+        'num_layers': 12
+    })
+    print(benchmarker.run().to_string())
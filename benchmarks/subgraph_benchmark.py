@@ -0,0 +1,89 @@
+import time
+import numpy as np
+from typing import Dict
+import pandas as pd
+from rt_fads.data.graph_store import IncrementalGraphStore
+from rt_fads.data.subgraph import SubgraphSampler
+from rt_fads.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class SubgraphBenchmarker:
+    """Latency of 2-hop subgraph extraction for single transactions
+
+    A rolling graph of ``num_edges`` synthetic transactions is built once,
+    then the source and target accounts of random transactions are used as
+    seeds, as when scoring one transaction online.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        num_edges = config.get('num_edges', 10000000)
+        num_accounts = config.get('num_accounts', 1000000)
+        batch_size = config.get('append_batch_size', 1000000)
+
+        self.store = IncrementalGraphStore({
+            'source_col': 'source',
+            'target_col': 'target',
+            'amount_col': 'amount',
+            'timestamp_col': 'timestamp',
+            'initial_capacity': num_edges
+        })
+        rng = np.random.default_rng(config.get('seed', 0))
+        start = pd.Timestamp('2024-01-01')
+        for offset in range(0, num_edges, batch_size):
+            size = min(batch_size, num_edges - offset)
+            seconds = offset + np.arange(size)
+            self.store.add_transactions(pd.DataFrame({
+                'source': rng.integers(0, num_accounts, size),
+                'target': rng.integers(0, num_accounts, size),
+                'amount': rng.exponential(100.0, size),
+                'timestamp': start + pd.to_timedelta(
+                    seconds * 30 * 86400 // num_edges, unit='s'
+                )
+            }))
+
+    def run(self) -> pd.DataFrame:
+        """Time extraction per fan-out configuration"""
+        rng = np.random.default_rng(self.config.get('seed', 0) + 1)
+        num_queries = self.config.get('num_queries', 1000)
+        edge_index = self.store.edge_index.numpy()
+        results = []
+
+        for fanouts in self.config.get('fanouts', [[10, 10], [25, 10]]):
+            sampler = SubgraphSampler({'fanouts': fanouts})
+            latencies = np.empty(num_queries)
+            num_edges = np.empty(num_queries)
+            for i in range(num_queries):
+                edge = rng.integers(0, self.store.num_edges)
+                seeds = edge_index[:, edge]
+                seed_time = self.store.timestamps[edge]
+
+                start_time = time.perf_counter()
+                subgraph = sampler.sample(
+                    self.store,
+                    seeds,
+                    [seed_time, seed_time]
+                )
+                latencies[i] = time.perf_counter() - start_time
+                num_edges[i] = len(subgraph.edge_ids)
+
+            results.append({
+                'fanouts': fanouts,
+                'graph_edges': self.store.num_edges,
+                'subgraph_edges': num_edges.mean(),
+                'p50_ms': np.percentile(latencies, 50) * 1000,
+                'p99_ms': np.percentile(latencies, 99) * 1000
+            })
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = SubgraphBenchmarker({
+        'num_edges': 100000000,
+        'num_accounts': 10000000,
+        'fanouts': [[10, 10], [25, 10]]
+    })
+    print(benchmarker.run().to_string(index=False))
@@ -0,0 +1,85 @@
+import time
+import numpy as np
+from typing import Dict
+import pandas as pd
+from rt_fads.data.temporal_index import TemporalNeighborIndex
+from rt_fads.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TemporalIndexBenchmarker:
+    """Latency of "last K transactions before t" lookups
+
+    Compares single and batched queries on a ``TemporalNeighborIndex``
+    with filtering a transaction table, the only option without an index.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        num_edges = config.get('num_edges', 10000000)
+        self.num_accounts = config.get('num_accounts', 1000000)
+
+        rng = np.random.default_rng(config.get('seed', 0))
+        self.edge_index = rng.integers(0, self.num_accounts, (2, num_edges))
+        self.timestamps = np.sort(rng.integers(0, 30 * 86400, num_edges))
+
+        start_time = time.perf_counter()
+        self.index = TemporalNeighborIndex.from_edges(
+            self.edge_index,
+            self.timestamps,
+            self.num_accounts
+        )
+        self.build_seconds = time.perf_counter() - start_time
+
+    def run(self) -> pd.DataFrame:
+        """Time each lookup method per ``k``"""
+        rng = np.random.default_rng(self.config.get('seed', 0) + 1)
+        num_queries = self.config.get('num_queries', 10000)
+        nodes = rng.integers(0, self.num_accounts, num_queries)
+        before = rng.integers(0, 30 * 86400, num_queries)
+        transactions = pd.DataFrame({
+            'source': self.edge_index[0],
+            'target': self.edge_index[1],
+            'timestamp': self.timestamps
+        })
+        results = []
+
+        for k in self.config.get('k', [10, 100]):
+            start_time = time.perf_counter()
+            for node, bound in zip(nodes.tolist(), before.tolist()):
+                self.index.neighbors[self.index.window(node, bound, k)]
+            single = (time.perf_counter() - start_time) / num_queries
+
+            start_time = time.perf_counter()
+            self.index.query(nodes, before, k)
+            batched = (time.perf_counter() - start_time) / num_queries
+
+            num_scans = self.config.get('num_scans', 20)
+            start_time = time.perf_counter()
+            for node, bound in zip(nodes[:num_scans], before[:num_scans]):
+                transactions[
+                    (transactions['source'] == node)
+                    & (transactions['timestamp'] < bound)
+                ].nlargest(k, 'timestamp')
+            scan = (time.perf_counter() - start_time) / num_scans
+
+            results.append({
+                'k': k,
+                'graph_edges': self.edge_index.shape[1],
+                'build_s': self.build_seconds,
+                'single_us': single * 1e6,
+                'batched_us': batched * 1e6,
+                'scan_us': scan * 1e6
+            })
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = TemporalIndexBenchmarker({
+        'num_edges': 10000000,
+        'num_accounts': 1000000,
+        'k': [10, 100]
+    })
+    print(benchmarker.run().to_string(index=False))
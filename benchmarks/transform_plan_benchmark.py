@@ -0,0 +1,98 @@
+import time
+import numpy as np
+from typing import Dict
+import pandas as pd
+from rt_fads.data.preprocessing import FeatureProcessor
+from rt_fads.utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class TransformPlanBenchmarker:
+    """Latency of serving-time feature transforms
+
+    Compares ``FeatureProcessor.transform`` on a DataFrame with the
+    compiled ``TransformPlan`` on dicts, for single transactions and
+    small batches.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.processor = FeatureProcessor({
+            'numerical_features': ['amount', 'balance'],
+            'categorical_features': ['category', 'channel'],
+            'account_features': ['source_account', 'target_account'],
+            'scene_features': ['scene'],
+            'timestamp_col': 'timestamp'
+        })
+        self.processor.fit_transform(pd.DataFrame(
+            self._rows(config.get('num_fit_rows', 100000))
+        ))
+        self.plan = self.processor.export_plan()
+
+    def _rows(self, num_rows: int, seed: int = 0):
+        rng = np.random.default_rng(seed)
+        num_accounts = self.config.get('num_accounts', 10000)
+        timestamps = pd.Timestamp('2024-01-01') + pd.to_timedelta(
+            rng.integers(0, 365 * 86400, num_rows),
+            unit='s'
+        )
+        return [{
+            'amount': float(rng.lognormal(4.0, 1.5)),
+            'balance': float(rng.normal(1e5, 1e4)),
+            'category': str(rng.choice(['food', 'travel', 'fuel'])),
+            'channel': int(rng.integers(0, 5)),
+            'source_account': f'acct-{rng.integers(0, num_accounts)}',
+            'target_account': f'acct-{rng.integers(0, num_accounts)}',
+            'timestamp': timestamp.isoformat(),
+            'prev_timestamp': (timestamp - pd.Timedelta(hours=2)).isoformat(),
+            'scene': int(rng.integers(0, 3)),
+            'node_in_degree': int(rng.integers(0, 20)),
+            'node_out_degree': int(rng.integers(0, 20)),
+            'clustering_coef': float(rng.random()),
+            'pagerank': float(rng.random())
+        } for timestamp in timestamps]
+
+    def run(self) -> pd.DataFrame:
+        """Time both paths per batch size"""
+        num_batches = self.config.get('num_batches', 1000)
+        results = []
+
+        for batch_size in self.config.get('batch_sizes', [1, 32]):
+            rows = self._rows(num_batches * batch_size, seed=1)
+            batches = [
+                rows[i:i + batch_size]
+                for i in range(0, len(rows), batch_size)
+            ]
+            timings = {}
+            for name, transform in [
+                ('dataframe',
+                 lambda b: self.processor.transform(pd.DataFrame(b))),
+                ('plan', self.plan.transform)
+            ]:
+                latencies = np.empty(len(batches))
+                for i, batch in enumerate(batches):
+                    start_time = time.perf_counter()
+                    transform(batch)
+                    latencies[i] = time.perf_counter() - start_time
+                timings[name] = latencies
+
+            results.append({
+                'batch_size': batch_size,
+                'dataframe_p50_us': np.percentile(timings['dataframe'], 50)
+                * 1e6,
+                'plan_p50_us': np.percentile(timings['plan'], 50) * 1e6,
+                'plan_p99_us': np.percentile(timings['plan'], 99) * 1e6,
+                'speedup': np.median(timings['dataframe'])
+                / np.median(timings['plan'])
+            })
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = TransformPlanBenchmarker({
+        'num_batches': 1000,
+        'batch_sizes': [1, 32]
+    })
+    print(benchmarker.run().to_string(index=False))
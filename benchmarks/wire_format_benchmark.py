@@ -0,0 +1,76 @@
+import json
+import timeit
+import numpy as np
+from typing import Dict
+import pandas as pd
+from rt_fads.api.server import PredictionRequest
+from rt_fads.features.schema import FeatureSchema
+from rt_fads.serving.wire_format import decode_frame, encode_frame
+
+
+class WireFormatBenchmarker:
+    """Per-request parse cost of JSON versus binary frame payloads
+
+    The JSON path measures pydantic parsing of a ``PredictionRequest`` plus
+    schema vectorization; the frame path measures ``decode_frame``. Both
+    end with the same float32 row handed to the batcher.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.schema = FeatureSchema(
+            [f'f{i}' for i in range(config.get('feature_dim', 64))],
+            [f's{i}' for i in range(config.get('scene_dim', 16))],
+            [f't{i}' for i in range(config.get('temporal_dim', 16))]
+        )
+
+        row = np.random.randn(self.schema.width).astype(np.float32)
+        self.json_body = json.dumps({
+            'transaction_id': 'txn-000001',
+            **{
+                block: {
+                    name: float(row[offset])
+                    for name, offset in self.schema.offsets[block].items()
+                }
+                for block in self.schema.columns
+            }
+        }).encode('utf-8')
+        self.frame_body = encode_frame('txn-000001', row, self.schema)
+
+    def _parse_json(self) -> np.ndarray:
+        request = PredictionRequest.parse_raw(self.json_body)
+        return self.schema.vectorize({
+            'features': request.features,
+            'scene_info': request.scene_info,
+            'temporal_info': request.temporal_info
+        })
+
+    def _parse_frame(self) -> np.ndarray:
+        return decode_frame(self.frame_body, self.schema).row
+
+    def run(self, number: int = 10000) -> pd.DataFrame:
+        """Measure parse cost per request for both paths"""
+        np.testing.assert_array_equal(self._parse_json(), self._parse_frame())
+
+        results = []
+        for name, fn, body in (
+            ('json', self._parse_json, self.json_body),
+            ('frame', self._parse_frame, self.frame_body)
+        ):
+            seconds = min(timeit.repeat(fn, number=number, repeat=5))
+            results.append({
+                'format': name,
+                'payload_bytes': len(body),
+                'parse_us_per_request': seconds / number * 1e6
+            })
+
+        return pd.DataFrame(results)
+
+
+if __name__ == "__main__":
+    benchmarker = WireFormatBenchmarker({
+        'feature_dim': 64,
+        'scene_dim': 16,
+        'temporal_dim': 16
+    })
+    print(benchmarker.run().to_string(index=False))
@@ -1,17 +1,50 @@
 from ..utils.logger import setup_logger
 from ..monitoring import MetricsCollector
 from ..models import MTHGNN
+from ..serving.batching import MicroBatcher
+from ..serving.executor import InferenceExecutor
+from ..serving.columnar import ColumnarBatch, decode_columnar
+from ..features.schema import BLOCKS, FeatureSchema
+from ..serving.explanations import (
+    DeferredExplainer,
+    ExplanationMode,
+    ExplanationStore
+)
+from ..serving.wire_format import FRAME_CONTENT_TYPE, decode_frame
+from ..serving.registry import (
+    ModelRegistry,
+    ModelVersion,
+    resolve_model_path
+)
+from ..serving.shadow import ShadowScorer
+from ..serving.cascade import CascadeScorer, DecisionStage
+from ..serving.cache import PredictionCache
+from ..serving.admission import (
+    DEADLINE_HEADER,
+    Admission,
+    AdmissionController
+)
+import hmac
+import os
 import time
+import numpy as np
 import torch
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi import FastAPI, HTTPException, BackgroundTasks
+from fastapi import (
+    FastAPI,
+    HTTPException,
+    BackgroundTasks,
+    Depends,
+    Request
+)
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import JSONResponse, Response
 from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
 import uvicorn
 
 from rt_fads.models import MTHGNN
-from rt_fads.privacy import SecureComputation
 from rt_fads.utils.logger import setup_logger
 
 logger = setup_logger()
@@ -66,9 +99,25 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Initialize global components
-model = None
-metrics_collector = MetricsCollector()
+
+def _load_model(checkpoint: Dict) -> torch.nn.Module:
+    """Rebuild MT-HGNN from a checkpoint written by ``MTHGNNTrainer``"""
+    model = MTHGNN(checkpoint['config'])
+    model.load_state_dict(checkpoint['model_state_dict'])
+    return model
+
+
+# Initialize global components; the metrics collector imports Prometheus,
+# so it is created by init_serving or at startup rather than on import
+metrics_collector: Optional[MetricsCollector] = None
+registry = ModelRegistry(_load_model)
+serving_config: Dict = {}
+batcher: Optional[MicroBatcher] = None
+executor: Optional[InferenceExecutor] = None
+explainer: Optional[DeferredExplainer] = None
+shadow_scorer: Optional[ShadowScorer] = None
+admission: Optional[AdmissionController] = None
+prediction_cache: Optional[PredictionCache] = None
 
 
 class PredictionRequest(BaseModel):
@@ -78,6 +127,7 @@ class PredictionRequest(BaseModel):
     scene_info: Dict[str, float]
     temporal_info: Dict[str, float]
     edge_info: Optional[Dict[str, List[float]]] = None
+    explanation_mode: Optional[ExplanationMode] = None
 
 
 class PredictionResponse(BaseModel):
@@ -85,65 +135,649 @@ class PredictionResponse(BaseModel):
     transaction_id: str
     fraud_probability: float
     risk_level: str
-    explanation: Dict[str, float]
+    explanation: Optional[Dict[str, float]] = None
+    explanation_mode: ExplanationMode
+    model_version: str
+    decision_stage: DecisionStage = DecisionStage.FULL_MODEL
+    degraded: bool = False
     processing_time: float
 
 
+class ExplanationResponse(BaseModel):
+    """Deferred explanation response model"""
+    transaction_id: str
+    status: str
+    explanation: Optional[Dict[str, float]] = None
+
+
+class ModelLoadRequest(BaseModel):
+    """Model hot-swap request model"""
+    path: str
+    version: Optional[str] = None
+    shadow: bool = False
+
+
 @app.post("/predict", response_model=PredictionResponse)
 async def predict(
-    request: PredictionRequest,
+    http_request: Request,
     background_tasks: BackgroundTasks
 ):
-    """Make fraud prediction for a transaction"""
+    """
+    Make fraud prediction for a transaction
+
+    Accepts a JSON ``PredictionRequest`` or, for low-overhead clients, a
+    binary frame with content type ``application/x-rt-fads-frame`` (see
+    ``encode_frame``). Clients may send their remaining latency budget in
+    the ``X-Request-Deadline-Ms`` header; requests that cannot meet it are
+    served without explanation or rejected with a 503. Repeats of a
+    transaction ID are answered from the prediction cache.
+    """
     start_time = time.time()
 
+    # Shed load before doing any work for the request
+    decision = admission.admit(_deadline_ms(http_request))
+    if decision.admission == Admission.REJECT:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": f"Request shed: {decision.reason}"},
+            headers={"Retry-After": str(decision.retry_after)}
+        )
+
     try:
-        # Convert input to tensors
-        features = torch.tensor([list(request.features.values())])
-        scene_info = torch.tensor([list(request.scene_info.values())])
-        temporal_info = torch.tensor([list(request.temporal_info.values())])
-
-        # Make prediction
-        with torch.no_grad():
-            prediction = model(
-                features,
-                scene_info=scene_info,
-                temporal_info=temporal_info
+        return await _predict(
+            http_request,
+            background_tasks,
+            start_time,
+            decision.admission == Admission.DEGRADE
+        )
+    finally:
+        admission.release()
+
+
+def _deadline_ms(http_request: Request) -> Optional[float]:
+    """Read the client's remaining latency budget"""
+    value = http_request.headers.get(DEADLINE_HEADER)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid {DEADLINE_HEADER} header: {value}"
+        )
+
+
+async def _predict(
+    http_request: Request,
+    background_tasks: BackgroundTasks,
+    start_time: float,
+    degraded: bool
+) -> PredictionResponse:
+    """Parse and score an admitted prediction request"""
+    body = await http_request.body()
+    content_type = http_request.headers.get('content-type', '')
+
+    # Pin the model version for the whole request
+    model_version = _current_model()
+
+    # Convert input to a schema-ordered float32 row
+    try:
+        if content_type.startswith(FRAME_CONTENT_TYPE):
+            if model_version.feature_schema is None:
+                raise ValueError(
+                    "Binary frames require a checkpoint feature schema"
+                )
+            frame = decode_frame(body, model_version.feature_schema)
+            transaction_id = frame.transaction_id
+            row = frame.row
+            explanation_mode = frame.explanation_mode
+        else:
+            request = PredictionRequest.parse_raw(body)
+            transaction_id = request.transaction_id
+            row = _vectorize(request, model_version)
+            explanation_mode = request.explanation_mode
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    except ValueError as e:
+        raise HTTPException(status_code=422, detail=str(e))
+
+    explanation_mode = explanation_mode or ExplanationMode(
+        serving_config.get('explanation_mode', 'inline')
+    )
+
+    async def compute() -> bytes:
+        response = await _score(
+            transaction_id,
+            row,
+            model_version,
+            explanation_mode,
+            start_time,
+            background_tasks,
+            degraded
+        )
+        return response.json().encode('utf-8')
+
+    # Retries and duplicate deliveries of a transaction share one result
+    # as long as they ask for the same explanation from the same load of
+    # the model; degraded results are not cached so a later retry can be
+    # complete
+    cache_key = PredictionCache.key(
+        transaction_id,
+        f"{model_version.version}@{model_version.loaded_at}",
+        explanation_mode.value
+    )
+    try:
+        body, _ = await prediction_cache.get_or_compute(
+            cache_key,
+            compute,
+            store=not degraded
+        )
+        return Response(content=body, media_type='application/json')
+
+    except Exception as e:
+        logger.error(f"Prediction error: {str(e)}")
+        raise HTTPException(status_code=500, detail=str(e))
+
+
+async def _score(
+    transaction_id: str,
+    row: np.ndarray,
+    model_version: ModelVersion,
+    explanation_mode: Optional[ExplanationMode],
+    start_time: float,
+    background_tasks: BackgroundTasks,
+    degraded: bool = False
+) -> PredictionResponse:
+    """Score a single vectorized transaction"""
+    # Make prediction as part of a micro-batch
+    submitted_at = time.time()
+    fraud_prob, decision_stage, scoring_time, scored_at = (
+        await batcher.submit((row, model_version))
+    )
+    admission.observe_queueing(scored_at - submitted_at)
+    risk_level = _determine_risk_level(fraud_prob)
+
+    # Generate explanation according to the requested mode
+    explanation_mode = explanation_mode or ExplanationMode(
+        serving_config.get('explanation_mode', 'inline')
+    )
+    if degraded or decision_stage == DecisionStage.FIRST_STAGE:
+        explanation_mode = ExplanationMode.NONE
+    explanation = None
+    if explanation_mode != ExplanationMode.NONE:
+        # Explainers may attribute gradients to their inputs, so give
+        # them their own copy rather than a view over the request body
+        inputs = model_version.feature_schema.split(
+            torch.tensor(row).unsqueeze(0)
+        )
+        explain_fn = model_version.model.explain_prediction
+        if explanation_mode == ExplanationMode.INLINE:
+            explain_start = time.time()
+            explanation = await executor.run(explain_fn, *inputs)
+            admission.observe_explanation(time.time() - explain_start)
+        elif not explainer.submit(
+            transaction_id,
+            explain_fn,
+            *inputs
+        ):
+            logger.warning(
+                "Explanation backlog full, skipping explanation for "
+                f"{transaction_id}"
             )
 
-        # Process prediction
-        fraud_prob = torch.sigmoid(prediction).item()
-        risk_level = _determine_risk_level(fraud_prob)
+    # Calculate processing time
+    processing_time = time.time() - start_time
+
+    # Record metrics in background
+    background_tasks.add_task(
+        metrics_collector.record_prediction,
+        start_time,
+        fraud_prob > 0.5,
+        processing_time,
+        model_version.version
+    )
+
+    # Mirror a sample of traffic to the shadow candidate; the task only
+    # enqueues and runs after the response has been sent
+    shadow_version = registry.shadow
+    if (shadow_version is not None and not degraded
+            and shadow_scorer.should_sample()):
+        background_tasks.add_task(
+            shadow_scorer.submit,
+            shadow_version,
+            row,
+            fraud_prob,
+            scoring_time
+        )
+
+    return PredictionResponse(
+        transaction_id=transaction_id,
+        fraud_probability=fraud_prob,
+        risk_level=risk_level,
+        explanation=explanation,
+        explanation_mode=explanation_mode,
+        model_version=model_version.version,
+        decision_stage=decision_stage,
+        degraded=degraded,
+        processing_time=processing_time
+    )
+
+
+@app.get(
+    "/explanations/{transaction_id}",
+    response_model=ExplanationResponse
+)
+async def get_explanation(transaction_id: str):
+    """Fetch a deferred explanation"""
+    entry = explainer.store.get(transaction_id)
+    if entry is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No explanation for transaction {transaction_id}"
+        )
+
+    response = ExplanationResponse(
+        transaction_id=transaction_id,
+        status=entry['status'],
+        explanation=entry['explanation']
+    )
+    if entry['status'] == ExplanationStore.PENDING:
+        return JSONResponse(status_code=202, content=response.dict())
+    return response
 
-        # Generate explanation
-        explanation = model.explain_prediction(
+
+def _current_model() -> ModelVersion:
+    """Get the model version new requests are served with"""
+    model_version = registry.current
+    if model_version is None:
+        raise HTTPException(status_code=503, detail="No model loaded")
+    return model_version
+
+
+def _vectorize(
+    request: PredictionRequest,
+    model_version: ModelVersion
+) -> np.ndarray:
+    """Convert a request into a float32 row using the feature schema"""
+    blocks = {
+        'features': request.features,
+        'scene_info': request.scene_info,
+        'temporal_info': request.temporal_info
+    }
+    schema = model_version.feature_schema
+    if schema is None:
+        schema = _pin_schema(
+            model_version,
+            FeatureSchema.from_blocks(blocks),
+            f"request {request.transaction_id}"
+        )
+    return schema.vectorize(blocks)
+
+
+def _pin_schema(
+    model_version: ModelVersion,
+    schema: FeatureSchema,
+    source: str
+) -> FeatureSchema:
+    """
+    Adopt an inferred schema for a version whose checkpoint has none
+
+    Checkpoints without a schema fall back to the first request's key
+    order, which is then enforced for every later request on both the
+    single and batch routes.
+    """
+    model_version.feature_schema = schema
+    logger.warning(
+        f"No feature schema in checkpoint, inferred column order from "
+        f"{source}"
+    )
+    return schema
+
+
+def _forward(
+    model_version: ModelVersion,
+    features: torch.Tensor,
+    scene_info: torch.Tensor,
+    temporal_info: torch.Tensor
+) -> torch.Tensor:
+    """Fraud probabilities for a batch of inputs"""
+    with torch.no_grad():
+        prediction = model_version.model(
             features,
-            scene_info,
-            temporal_info
+            scene_info=scene_info,
+            temporal_info=temporal_info
+        )
+
+    return torch.sigmoid(prediction).view(len(features), -1)[:, -1]
+
+
+def _cascade_score(
+    model_version: ModelVersion,
+    rows: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Score rows through the first stage, escalating to the full model"""
+    def full_fn(subset: np.ndarray) -> np.ndarray:
+        return _forward(
+            model_version,
+            *model_version.feature_schema.split(torch.from_numpy(subset))
+        ).numpy()
+
+    if model_version.first_stage is None:
+        return full_fn(rows), np.ones(len(rows), dtype=bool)
+
+    cascade = CascadeScorer(
+        model_version.first_stage,
+        serving_config.get('cascade_band', 0.3)
+    )
+    fraud_probs, escalated = cascade.score(rows, full_fn)
+    metrics_collector.record_cascade(
+        int(len(rows) - escalated.sum()),
+        int(escalated.sum())
+    )
+    return fraud_probs, escalated
+
+
+def _decision_stage(escalated: bool) -> DecisionStage:
+    return (
+        DecisionStage.FULL_MODEL if escalated
+        else DecisionStage.FIRST_STAGE
+    )
+
+
+def _predict_batch(
+    items: List[Tuple[np.ndarray, ModelVersion]]
+) -> List[Tuple[float, DecisionStage, float, float]]:
+    """
+    Run one cascade pass per model version over a micro-batch
+
+    Returns:
+        Fraud probability, deciding stage, the seconds spent scoring the
+        request's group and the time its scoring started, for every item
+    """
+    start_time = time.time()
+
+    # Around a hot swap a batch can mix versions; each request is scored
+    # by the version it started with
+    groups: Dict[int, List[int]] = {}
+    for i, (_, model_version) in enumerate(items):
+        groups.setdefault(id(model_version), []).append(i)
+
+    results = [None] * len(items)
+    for indices in groups.values():
+        model_version = items[indices[0]][1]
+        rows = np.stack([items[i][0] for i in indices])
+        group_start = time.time()
+        fraud_probs, escalated = _cascade_score(model_version, rows)
+        scoring_time = time.time() - group_start
+        for i, fraud_prob, is_escalated in zip(
+            indices,
+            fraud_probs.tolist(),
+            escalated.tolist()
+        ):
+            results[i] = (
+                fraud_prob,
+                _decision_stage(is_escalated),
+                scoring_time,
+                group_start
+            )
+
+    admission.observe_scoring(time.time() - start_time)
+    return results
+
+
+@app.post("/predict/batch")
+async def predict_batch(
+    http_request: Request,
+    background_tasks: BackgroundTasks
+):
+    """
+    Make fraud predictions for a columnar batch of transactions
+
+    Accepts JSON, msgpack or Arrow IPC bodies (see ``decode_columnar``)
+    and scores the whole batch with a single forward pass. Batches go
+    through the same admission control as ``/predict``, counting every
+    row against the in-flight budget.
+    """
+    start_time = time.time()
+    model_version = _current_model()
+    body = await http_request.body()
+
+    # Decoding and pinning an inferred schema run without yielding to the
+    # event loop, so no other request can pin a different one in between
+    schema = model_version.feature_schema
+    try:
+        batch = decode_columnar(
+            body,
+            http_request.headers.get('content-type', 'application/json'),
+            schema=schema
+        )
+    except NotImplementedError as e:
+        raise HTTPException(status_code=415, detail=str(e))
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if schema is None:
+        _pin_schema(
+            model_version,
+            FeatureSchema(*(batch.columns[block] for block in BLOCKS)),
+            f"a batch of {len(batch)} transactions"
         )
 
-        # Calculate processing time
+    max_rows = serving_config.get('max_batch_rows', 100000)
+    if len(batch) > max_rows:
+        raise HTTPException(
+            status_code=413,
+            detail=f"Batch of {len(batch)} exceeds {max_rows} transactions"
+        )
+
+    # The row count is only known once decoded, so batches are shed after
+    # decoding but before any scoring; batches carry no explanations, so
+    # a degraded batch is served in full
+    decision = admission.admit(_deadline_ms(http_request), rows=len(batch))
+    if decision.admission == Admission.REJECT:
+        return JSONResponse(
+            status_code=503,
+            content={"detail": f"Request shed: {decision.reason}"},
+            headers={"Retry-After": str(decision.retry_after)}
+        )
+
+    try:
+        submitted_at = time.time()
+        fraud_probs, escalated, scored_at = await executor.run(
+            _predict_columnar,
+            batch,
+            model_version
+        )
+        admission.observe_queueing(scored_at - submitted_at)
         processing_time = time.time() - start_time
 
-        # Record metrics in background
         background_tasks.add_task(
-            metrics_collector.record_prediction,
-            start_time,
-            fraud_prob > 0.5,
-            processing_time
+            metrics_collector.record_batch_predictions,
+            len(batch),
+            int((fraud_probs > 0.5).sum()),
+            processing_time,
+            model_version.version
         )
 
-        return PredictionResponse(
-            transaction_id=request.transaction_id,
-            fraud_probability=fraud_prob,
-            risk_level=risk_level,
-            explanation=explanation,
-            processing_time=processing_time
-        )
+        return JSONResponse({
+            'predictions': [
+                {
+                    'transaction_id': transaction_id,
+                    'fraud_probability': fraud_prob,
+                    'risk_level': _determine_risk_level(fraud_prob),
+                    'decision_stage': _decision_stage(is_escalated).value
+                }
+                for transaction_id, fraud_prob, is_escalated in zip(
+                    batch.transaction_ids,
+                    fraud_probs.tolist(),
+                    escalated.tolist()
+                )
+            ],
+            'model_version': model_version.version,
+            'processing_time': processing_time
+        })
 
     except Exception as e:
-        logger.error(f"Prediction error: {str(e)}")
+        logger.error(f"Batch prediction error: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
+    finally:
+        admission.release(len(batch))
+
+
+def _predict_columnar(
+    batch: ColumnarBatch,
+    model_version: ModelVersion
+) -> Tuple[np.ndarray, np.ndarray, float]:
+    """
+    Score a decoded columnar batch through the cascade
+
+    Returns:
+        Fraud probabilities, which rows escalated to the full model and
+        the time scoring started
+    """
+    scored_at = time.time()
+    if model_version.first_stage is not None:
+        fraud_probs, escalated = _cascade_score(
+            model_version,
+            np.hstack([batch.features, batch.scene_info, batch.temporal_info])
+        )
+        return fraud_probs, escalated, scored_at
+
+    fraud_probs = _forward(
+        model_version,
+        torch.from_numpy(batch.features),
+        torch.from_numpy(batch.scene_info),
+        torch.from_numpy(batch.temporal_info)
+    ).numpy()
+    return fraud_probs, np.ones(len(batch), dtype=bool), scored_at
+
+
+def _require_admin(http_request: Request):
+    """
+    Allow only requests bearing the admin token
+
+    The token is read from the environment variable named by the
+    ``admin_token_env`` serving setting. Without one, model management
+    is disabled rather than left open.
+    """
+    token = os.environ.get(
+        serving_config.get('admin_token_env', 'RT_FADS_ADMIN_TOKEN')
+    )
+    if not token:
+        raise HTTPException(
+            status_code=403,
+            detail="Model management is disabled: no admin token set"
+        )
+    scheme, _, credentials = http_request.headers.get(
+        'authorization', ''
+    ).partition(' ')
+    if scheme.lower() != 'bearer' or not hmac.compare_digest(
+        credentials.encode('utf-8'),
+        token.encode('utf-8')
+    ):
+        raise HTTPException(
+            status_code=401,
+            detail="Admin token required",
+            headers={"WWW-Authenticate": "Bearer"}
+        )
+
+
+@app.post(
+    "/models",
+    status_code=202,
+    dependencies=[Depends(_require_admin)]
+)
+async def load_model(request: ModelLoadRequest):
+    """
+    Load a checkpoint in the background and hot-swap it when warm
+
+    Only checkpoints inside the ``model_dir`` serving directory can be
+    loaded, by a path relative to it. Swaps are refused when the
+    ``hot_swap`` serving setting is off, as in prefork workers.
+    """
+    if not serving_config.get('hot_swap', True):
+        raise HTTPException(
+            status_code=409,
+            detail="Hot swaps are disabled in this deployment; restart "
+                   "the server with the new checkpoint"
+        )
+    model_dir = serving_config.get('model_dir')
+    if model_dir is None:
+        raise HTTPException(
+            status_code=403,
+            detail="Model loading is disabled: no model_dir configured"
+        )
+    try:
+        path = resolve_model_path(model_dir, request.path)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not os.path.isfile(path):
+        raise HTTPException(
+            status_code=404,
+            detail=f"No checkpoint at {request.path}"
+        )
+
+    registry.load_async(path, request.version, request.shadow)
+    return {"status": "loading", "path": request.path}
+
+
+@app.delete("/models/shadow", dependencies=[Depends(_require_admin)])
+async def clear_shadow_model():
+    """Stop scoring traffic with the shadow candidate"""
+    registry.clear_shadow()
+    return registry.status()
+
+
+@app.get("/models")
+async def get_models():
+    """Get the served model version and recent history"""
+    return registry.status()
+
+
+@app.on_event("startup")
+async def start_inference():
+    """Start the inference executor and micro-batching scheduler"""
+    global batcher, executor, explainer, shadow_scorer, admission
+    global prediction_cache
+    _init_metrics()
+    executor = InferenceExecutor.from_config(serving_config)
+    explainer = DeferredExplainer.from_config(serving_config)
+    shadow_scorer = ShadowScorer.from_config(
+        serving_config,
+        metrics_collector=metrics_collector
+    )
+    shadow_scorer.start()
+    admission = AdmissionController.from_config(
+        serving_config,
+        metrics_collector=metrics_collector
+    )
+    prediction_cache = PredictionCache.from_config(
+        serving_config,
+        metrics_collector=metrics_collector
+    )
+    batcher = MicroBatcher(
+        _predict_batch,
+        max_batch_size=serving_config.get('max_batch_size', 32),
+        max_wait_ms=serving_config.get('max_wait_ms', 2.0),
+        min_wait_fraction=serving_config.get('min_wait_fraction', 0.25),
+        metrics_collector=metrics_collector,
+        executor=executor
+    )
+    batcher.start()
+
+
+@app.on_event("shutdown")
+async def stop_inference():
+    """Stop the micro-batching scheduler and inference executor"""
+    if batcher is not None:
+        await batcher.stop()
+    if executor is not None:
+        executor.shutdown()
+    if explainer is not None:
+        explainer.shutdown(wait=False)
+    if shadow_scorer is not None:
+        shadow_scorer.stop()
+    registry.shutdown()
 
 
 @app.get("/metrics")
@@ -168,9 +802,23 @@ def _determine_risk_level(probability: float) -> str:
 
 # Model initialization
 
-def init_model(model_path: str):
+def init_model(model_path: str, version: Optional[str] = None):
     """Initialize model from checkpoint"""
-    global model
-    model = MTHGNN.load_from_checkpoint(model_path)
-    model.eval()
+    registry.load(model_path, version)
     logger.info("Model initialized successfully")
+
+
+def init_serving(config: Dict):
+    """Configure serving components from the ``serving`` config section"""
+    global serving_config
+    serving_config = config
+    _init_metrics()
+
+
+def _init_metrics() -> MetricsCollector:
+    """Create the metrics collector once and attach it to the registry"""
+    global metrics_collector
+    if metrics_collector is None:
+        metrics_collector = MetricsCollector()
+        registry.metrics_collector = metrics_collector
+    return metrics_collector
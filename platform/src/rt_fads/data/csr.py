@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+import numpy as np
+
+
+@dataclass
+class CSRGraph:
+    """
+    Compressed sparse adjacency of a directed graph
+
+    The neighbors of node ``i`` are ``indices[indptr[i]:indptr[i + 1]]``
+    and ``edge_ids`` holds the position of each of those edges in the
+    ``edge_index``/``edge_attr`` it was built from. Built by source node
+    this is the CSR (out-edge) layout, by target node the CSC (in-edge)
+    layout.
+    """
+
+    indptr: np.ndarray
+    indices: np.ndarray
+    edge_ids: np.ndarray
+
+    @classmethod
+    def from_edges(
+        cls,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        num_nodes: int
+    ) -> 'CSRGraph':
+        """
+        Compress edges ``rows[e] -> cols[e]`` by row with a counting sort
+
+        Edges of the same row keep their input order.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        counts = np.bincount(rows, minlength=num_nodes)
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        edge_ids = np.argsort(rows, kind='stable')
+        return cls(
+            indptr=indptr,
+            indices=np.asarray(cols, dtype=np.int64)[edge_ids],
+            edge_ids=edge_ids
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    @property
+    def num_edges(self) -> int:
+        return len(self.indices)
+
+    def degree(self) -> np.ndarray:
+        """Number of edges of every node"""
+        return np.diff(self.indptr)
+
+    def neighbors(self, node: int) -> np.ndarray:
+        """Neighbors of a node, as a view"""
+        return self.indices[self.indptr[node]:self.indptr[node + 1]]
+
+    def edges(self, node: int) -> np.ndarray:
+        """Edge positions of a node, as a view"""
+        return self.edge_ids[self.indptr[node]:self.indptr[node + 1]]
@@ -1,5 +1,4 @@
 import pandas as pd
-from secretflow.data import SecureDataFrame
 
 
 class DataProcessor:
@@ -10,6 +9,8 @@ class DataProcessor:
 
     def load_data(self, data_path):
         """Load data securely"""
+        from secretflow.data import SecureDataFrame
+
         df = pd.read_csv(data_path)
         secure_df = SecureDataFrame(df)
         return secure_df
@@ -1,16 +1,58 @@
-import networkx as nx
 import torch
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 import pandas as pd
 import numpy as np
+from .graph_features import GraphFeatures
+from .graph_snapshot import load_snapshot, save_snapshot
+from .interning import AccountInterner
+from .temporal_index import (
+    TemporalNeighborIndex, nanoseconds, parse_timestamps
+)
+from ..utils.lazy import lazy_import
+
+nx = lazy_import('networkx')
 
 
 class GraphBuilder:
-    """Build transaction graph from data"""
+    """
+    Build transaction graph from data
+
+    ``edge_mode`` controls how repeated transfers between two accounts
+    are represented:
+
+    - ``last`` (default): one edge per account pair with the features of
+      its last transaction
+    - ``multi``: one edge per transaction
+    - ``aggregate``: one edge per account pair with the transaction count,
+      amount sum, min, max and last, and the time span in seconds
+
+    With an ``AccountInterner``, node IDs are the interner's IDs instead
+    of being numbered per build, so they agree with the graph store and
+    feature processing sharing it. ``node_ids`` then lists every interned
+    account, including those without edges in the last build.
+    """
 
-    def __init__(self, config: Dict):
+    EDGE_MODES = ('last', 'multi', 'aggregate')
+
+    def __init__(
+        self,
+        config: Dict,
+        interner: Optional[AccountInterner] = None
+    ):
         self.config = config
-        self.graph = nx.DiGraph()
+        self.interner = interner
+        self.edge_mode = config.get('edge_mode', 'last')
+        if self.edge_mode not in self.EDGE_MODES:
+            raise ValueError(f"Unsupported edge mode: {self.edge_mode}")
+
+        self.node_ids: Optional[np.ndarray] = None
+        self.edge_index: Optional[torch.Tensor] = None
+        self.edge_attr: Optional[torch.Tensor] = None
+        self.edge_feature_names: List[str] = []
+        self.edge_timestamps: Optional[np.ndarray] = None
+        self.num_transactions = 0
+        self._graph = None
+        self._features: Optional[GraphFeatures] = None
 
     def build_graph(
         self,
@@ -18,116 +60,301 @@ class GraphBuilder:
     ) -> Tuple[torch.Tensor, torch.Tensor]:
         """
         Build directed graph from transaction data
-        
+
+        Account IDs are factorized into contiguous node IDs in order of
+        first appearance (source before target within a row);
+        ``self.node_ids[i]`` is the account behind node ``i``. Edges are
+        ordered by source node, then by first appearance, and
+        ``self.edge_feature_names`` names the ``edge_attr`` columns.
+        With a timestamp column, ``self.edge_timestamps`` holds the time
+        of each edge's last transaction in nanoseconds.
+
         Returns:
             edge_index: Tensor of shape [2, num_edges]
             edge_attr: Tensor of shape [num_edges, edge_feature_dim]
         """
-        # Clear existing graph
-        self.graph.clear()
-
-        # Add nodes
-        for _, row in data.iterrows():
-            source = row[self.config['source_col']]
-            target = row[self.config['target_col']]
-
-            # Add nodes if they don't exist
-            if source not in self.graph:
-                self.graph.add_node(
-                    source,
-                    features=self._get_node_features(row, 'source')
-                )
-            if target not in self.graph:
-                self.graph.add_node(
-                    target,
-                    features=self._get_node_features(row, 'target')
-                )
-
-            # Add edge
-            self.graph.add_edge(
-                source,
-                target,
-                features=self._get_edge_features(row)
+        source_codes, target_codes = self._factorize_nodes(data)
+
+        if self.edge_mode == 'multi':
+            rows = np.argsort(source_codes, kind='stable')
+            edge_attr = self._edge_features(data, rows)
+        else:
+            edge_codes, last_rows = self._group_edges(
+                source_codes,
+                target_codes
             )
+            # Group edges by source node, keeping first-appearance order
+            order = np.argsort(source_codes[last_rows], kind='stable')
+            rows = last_rows[order]
+            if self.edge_mode == 'last':
+                edge_attr = self._edge_features(data, rows)
+            else:
+                edge_attr = self._aggregate_features(
+                    data,
+                    edge_codes,
+                    last_rows
+                )[order]
+
+        self.edge_index = torch.from_numpy(
+            np.stack([source_codes[rows], target_codes[rows]])
+        )
+        self.edge_attr = torch.from_numpy(edge_attr)
+        self.edge_timestamps = None
+        timestamp_col = self.config.get('timestamp_col')
+        if timestamp_col in data:
+            self.edge_timestamps = nanoseconds(
+                data[timestamp_col].to_numpy()[rows]
+            )
+        self.num_transactions = len(data)
+        self._graph = None
+        return self.edge_index, self.edge_attr
+
+    def temporal_index(self, direction: str = 'out') -> TemporalNeighborIndex:
+        """
+        Time-sorted neighbor index of the last built graph
+
+        Use the ``multi`` edge mode to index every transaction rather
+        than the last one per account pair.
 
-        # Convert to PyTorch tensors
-        edge_index, edge_attr = self._convert_to_tensors()
-        return edge_index, edge_attr
+        Raises:
+            ValueError: If the graph was built without timestamps
+        """
+        if self.edge_timestamps is None:
+            raise ValueError("Graph was built without a timestamp column")
+        return TemporalNeighborIndex.from_edges(
+            self.edge_index.numpy(),
+            self.edge_timestamps,
+            len(self.node_ids),
+            direction
+        )
 
-    def _get_node_features(
+    def _factorize_nodes(
         self,
-        row: pd.Series,
-        node_type: str
-    ) -> np.ndarray:
-        """Extract node features"""
-        features = []
+        data: pd.DataFrame
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Map source and target accounts to contiguous node IDs"""
+        # Interleave so first appearance follows row order, source first
+        accounts = np.column_stack([
+            data[self.config['source_col']].to_numpy(),
+            data[self.config['target_col']].to_numpy()
+        ]).ravel()
+        if self.interner is None:
+            codes, self.node_ids = pd.factorize(accounts)
+        else:
+            codes = self.interner.encode(accounts)
+            self.node_ids = self.interner.accounts()
+        codes = codes.astype(np.int64)
+        return codes[0::2], codes[1::2]
+
+    def _group_edges(
+        self,
+        source_codes: np.ndarray,
+        target_codes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Group transactions by account pair
 
-        # Basic features
-        for feat in self.config[f'{node_type}_features']:
-            if feat in row:
-                features.append(row[feat])
+        Returns:
+            edge_codes: Edge of each transaction, numbered by first
+                appearance
+            last_rows: Row of the last transaction of each edge
+        """
+        pairs = source_codes * max(len(self.node_ids), 1) + target_codes
+        edge_codes, _ = pd.factorize(pairs)
 
-        # Degree features will be added later
-        return np.array(features)
+        last_rows = np.flatnonzero(
+            ~pd.Series(pairs).duplicated(keep='last').to_numpy()
+        )
+        rows = np.empty(len(last_rows), dtype=np.int64)
+        rows[edge_codes[last_rows]] = last_rows
+        return edge_codes, rows
 
-    def _get_edge_features(
+    def _edge_features(
         self,
-        row: pd.Series
+        data: pd.DataFrame,
+        rows: np.ndarray
     ) -> np.ndarray:
-        """Extract edge features"""
-        features = []
-
-        # Transaction amount
-        features.append(row[self.config['amount_col']])
-
-        # Timestamp
-        if self.config['timestamp_col'] in row:
-            timestamp = pd.to_datetime(row[self.config['timestamp_col']])
-            features.extend([
-                timestamp.hour,
-                timestamp.day_of_week,
-                timestamp.day,
-                timestamp.month
-            ])
-
-        # Additional edge features
-        for feat in self.config['edge_features']:
-            if feat in row:
-                features.append(row[feat])
-
-        return np.array(features)
-
-    def _convert_to_tensors(self) -> Tuple[torch.Tensor, torch.Tensor]:
-        """Convert NetworkX graph to PyTorch tensors"""
-        # Get edge indices
-        edges = list(self.graph.edges())
-        edge_index = torch.tensor(
-            [[e[0] for e in edges], [e[1] for e in edges]],
-            dtype=torch.long
+        """Extract edge features for the selected transactions"""
+        features, self.edge_feature_names = edge_features(
+            data,
+            rows,
+            self.config
         )
+        return features
 
-        # Get edge features
-        edge_attr = torch.tensor(
-            [self.graph[e[0]][e[1]]['features'] for e in edges],
-            dtype=torch.float
+    def _aggregate_features(
+        self,
+        data: pd.DataFrame,
+        edge_codes: np.ndarray,
+        last_rows: np.ndarray
+    ) -> np.ndarray:
+        """Reduce the transactions of each edge into aggregate features"""
+        num_edges = len(last_rows)
+        amounts = data[self.config['amount_col']].to_numpy(np.float64)
+
+        # Sort transactions by edge so each edge is one contiguous segment
+        order = np.argsort(edge_codes, kind='stable')
+        counts = np.bincount(edge_codes, minlength=num_edges)
+        starts = np.cumsum(counts) - counts
+
+        columns = [
+            counts,
+            np.bincount(edge_codes, weights=amounts, minlength=num_edges),
+            _segment_reduce(np.minimum, amounts[order], starts),
+            _segment_reduce(np.maximum, amounts[order], starts),
+            amounts[last_rows]
+        ]
+        self.edge_feature_names = ['count', 'amount_sum', 'amount_min',
+                                   'amount_max', 'amount_last']
+
+        timestamp_col = self.config.get('timestamp_col')
+        if timestamp_col in data:
+            nanos = nanoseconds(data[timestamp_col].to_numpy())[order]
+            columns.append(
+                (_segment_reduce(np.maximum, nanos, starts)
+                 - _segment_reduce(np.minimum, nanos, starts)) / 1e9
+            )
+            self.edge_feature_names.append('time_span')
+
+        return np.column_stack(columns).astype(np.float32)
+
+    def save_snapshot(self, path: str):
+        """
+        Write the last built graph to a memory-mappable snapshot
+
+        Edge timestamps are stored with the graph when it has them, so
+        ``temporal_index`` works on a loaded builder.
+        """
+        if self.edge_index is None:
+            raise ValueError("No graph has been built")
+        extra = {}
+        if self.edge_timestamps is not None:
+            extra['edge_timestamps'] = self.edge_timestamps
+        save_snapshot(
+            path,
+            self.edge_index,
+            self.edge_attr,
+            self.node_ids,
+            metadata={
+                'source_col': self.config.get('source_col'),
+                'target_col': self.config.get('target_col'),
+                'edge_mode': self.edge_mode,
+                'edge_feature_names': self.edge_feature_names,
+                'num_transactions': self.num_transactions
+            },
+            extra=extra
         )
 
-        return edge_index, edge_attr
+    @classmethod
+    def load_snapshot(
+        cls,
+        path: str,
+        config: Optional[Dict] = None,
+        verify: bool = False
+    ) -> 'GraphBuilder':
+        """
+        Load a builder from a snapshot instead of rebuilding the graph
+
+        ``edge_index`` and ``edge_attr`` are copy-on-write mappings of
+        the file, so modifying them never changes the snapshot.
+
+        Raises:
+            ValueError: If the snapshot's edge mode differs from ``config``
+        """
+        snapshot = load_snapshot(path, verify=verify)
+        metadata = snapshot.metadata
+        config = config or {}
+        if config.get('edge_mode', metadata['edge_mode']) != (
+            metadata['edge_mode']
+        ):
+            raise ValueError(
+                f"Snapshot edge mode {metadata['edge_mode']} does not "
+                f"match {config['edge_mode']}"
+            )
+
+        builder = cls({**config, 'edge_mode': metadata['edge_mode']})
+        builder.node_ids = snapshot.node_ids
+        builder.edge_index = snapshot.edge_index
+        builder.edge_attr = snapshot.edge_attr
+        builder.edge_feature_names = metadata['edge_feature_names']
+        builder.num_transactions = metadata['num_transactions']
+        if 'edge_timestamps' in snapshot.extra:
+            builder.edge_timestamps = snapshot.extra['edge_timestamps'].numpy()
+        return builder
+
+    @property
+    def graph(self):
+        """NetworkX view of the last built graph, created on first use"""
+        if self._graph is None:
+            self._graph = nx.DiGraph()
+            if self.node_ids is not None:
+                self._graph.add_nodes_from(range(len(self.node_ids)))
+                self._graph.add_edges_from(self.edge_index.t().tolist())
+        return self._graph
 
     def compute_graph_features(self) -> Dict[str, np.ndarray]:
-        """Compute additional graph features"""
-        features = {}
+        """
+        Compute additional graph features
 
-        # Degree centrality
-        features['in_degree'] = list(dict(self.graph.in_degree()).values())
-        features['out_degree'] = list(dict(self.graph.out_degree()).values())
+        Values are ordered by node ID; ``GraphFeatures.compute`` returns
+        them indexed by account instead. PageRank is warm-started from the
+        previous call on this builder.
+        """
+        if self._features is None:
+            self._features = GraphFeatures(self.config)
+        features = self._features.compute(self.edge_index, self.node_ids)
+        return {
+            column: features[column].to_numpy()
+            for column in features.columns
+        }
 
-        # Clustering coefficient
-        features['clustering_coef'] = list(
-            nx.clustering(self.graph.to_undirected()).values()
-        )
 
-        # PageRank
-        features['pagerank'] = list(nx.pagerank(self.graph).values())
+def edge_features(
+    data: pd.DataFrame,
+    rows: np.ndarray,
+    config: Dict
+) -> Tuple[np.ndarray, List[str]]:
+    """
+    Extract per-transaction edge features for the selected rows
 
-        return features
+    Returns:
+        features: Array of shape [len(rows), edge_feature_dim]
+        names: Name of each feature column
+    """
+    columns: List[np.ndarray] = []
+    names = [config['amount_col']]
+
+    # Transaction amount
+    columns.append(data[config['amount_col']].to_numpy()[rows])
+
+    # Timestamp
+    timestamp_col = config.get('timestamp_col')
+    if timestamp_col in data:
+        timestamps = parse_timestamps(data[timestamp_col].to_numpy()[rows])
+        columns.extend([
+            timestamps.hour,
+            timestamps.dayofweek,
+            timestamps.day,
+            timestamps.month
+        ])
+        names.extend(['hour', 'day_of_week', 'day', 'month'])
+
+    # Additional edge features
+    for feat in config.get('edge_features', []):
+        if feat in data:
+            columns.append(data[feat].to_numpy()[rows])
+            names.append(feat)
+
+    return np.column_stack(columns).astype(np.float32), names
+
+
+def _segment_reduce(
+    ufunc: np.ufunc,
+    values: np.ndarray,
+    starts: np.ndarray
+) -> np.ndarray:
+    """Reduce contiguous segments of ``values`` beginning at ``starts``"""
+    # reduceat rejects empty input, which means there are no segments
+    if len(values) == 0:
+        return values[:0]
+    return ufunc.reduceat(values, starts)
@@ -0,0 +1,484 @@
+import torch
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
+import pandas as pd
+import numpy as np
+from .csr import CSRGraph
+from ..utils.logger import setup_logger
+
+if TYPE_CHECKING:
+    from .graph_store import IncrementalGraphStore
+
+logger = setup_logger(__name__)
+
+
+class GraphFeatures:
+    """
+    Structural node features of the transaction graph at scale
+
+    Computes in/out degrees, PageRank and clustering coefficients with
+    vectorized NumPy over the edge list instead of NetworkX. Results are
+    indexed by account ID so they can be joined back to transactions, and
+    each PageRank run starts from the previous result for the accounts
+    that are still present, so recomputing after a small update converges
+    in a few iterations.
+    """
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.alpha = config.get('pagerank_alpha', 0.85)
+        self.tol = config.get('pagerank_tol', 1e-6)
+        self.max_iter = config.get('pagerank_max_iter', 100)
+        self.max_wedges = config.get('clustering_max_wedges', 256)
+        self.rng = np.random.default_rng(config.get('seed', 0))
+
+        self.pagerank: Optional[pd.Series] = None
+        self.pagerank_iterations = 0
+
+    def compute(
+        self,
+        edge_index: torch.Tensor,
+        node_ids: np.ndarray
+    ) -> pd.DataFrame:
+        """
+        Compute node features
+
+        Args:
+            edge_index: Tensor of shape [2, num_edges] of node IDs
+            node_ids: Account behind each node ID
+
+        Returns:
+            DataFrame indexed by account with ``in_degree``,
+            ``out_degree``, ``clustering_coef`` and ``pagerank`` columns
+        """
+        edges = np.asarray(edge_index)
+        index = pd.Index(node_ids)
+        num_nodes = len(index)
+        in_degree, out_degree = degrees(edges, num_nodes)
+
+        init = None
+        if self.pagerank is not None:
+            # Accounts new to the graph start from the uniform rank
+            init = self.pagerank.reindex(
+                index,
+                fill_value=1.0 / max(1, num_nodes)
+            ).to_numpy()
+        ranks, self.pagerank_iterations = pagerank(
+            edges,
+            num_nodes,
+            alpha=self.alpha,
+            tol=self.tol,
+            max_iter=self.max_iter,
+            init=init
+        )
+        self.pagerank = pd.Series(ranks, index=index)
+
+        return pd.DataFrame({
+            'in_degree': in_degree,
+            'out_degree': out_degree,
+            'clustering_coef': clustering(
+                edges,
+                num_nodes,
+                max_wedges=self.max_wedges,
+                rng=self.rng
+            ),
+            'pagerank': ranks
+        }, index=index)
+
+
+class IncrementalGraphFeatures:
+    """
+    Degrees and PageRank kept up to date under an edge stream
+
+    Attaches to an ``IncrementalGraphStore`` and updates in/out degrees on
+    every edge insertion and expiry. PageRank is maintained by residual
+    push on the unnormalized system ``x = (1 - alpha) + alpha * P^T x``
+    with dangling rows left empty, whose normalized solution equals
+    ``nx.pagerank`` with uniform teleport. Scores ``p`` and residuals
+    ``r`` keep ``r = (1 - alpha) + alpha * P^T p - p``; an edge change
+    only rescales the source's score and touches the residuals of both
+    endpoints, and ``refresh`` pushes residuals above the tolerance
+    through the changed neighborhood instead of recomputing the graph.
+
+    After ``refresh`` every node's residual is at most
+    ``pagerank_push_tol * (1 - alpha)`` per out-edge, so the error of the
+    unnormalized scores is bounded by ``pagerank_push_tol`` times the
+    number of edges plus nodes. Scaling by degree keeps hubs from being
+    pushed, and their edge lists walked, on every small change.
+    """
+
+    def __init__(self, store: 'IncrementalGraphStore', config: Dict):
+        self.store = store
+        self.config = config
+        self.alpha = config.get('pagerank_alpha', 0.85)
+        self.threshold = (
+            config.get('pagerank_push_tol', 1e-3) * (1 - self.alpha)
+        )
+        self.num_pushes = 0
+
+        # Per-node arrays grow by doubling; the first num_nodes are used
+        self.num_nodes = 0
+        self._in_degree = np.empty(0, dtype=np.int64)
+        self._out_degree = np.empty(0, dtype=np.int64)
+        self._scores = np.empty(0)
+        self._residuals = np.empty(0)
+
+        # Nodes whose residual may have grown since the last refresh
+        self._pending: List[np.ndarray] = []
+
+        self._initialize()
+        store.listeners.append(self)
+
+    @property
+    def in_degree(self) -> np.ndarray:
+        """In-degree of every node, as a view"""
+        return self._in_degree[:self.num_nodes]
+
+    @property
+    def out_degree(self) -> np.ndarray:
+        """Out-degree of every node, as a view"""
+        return self._out_degree[:self.num_nodes]
+
+    def _initialize(self):
+        """Start from a batch PageRank of the store's current graph"""
+        num_nodes = self.store.num_nodes
+        self._grow(num_nodes)
+        if num_nodes == 0:
+            return
+
+        edge_index = self.store.edge_index.numpy()
+        self.in_degree[:] = self.store.in_degree
+        self.out_degree[:] = self.store.out_degree
+        ranks, _ = pagerank(
+            edge_index,
+            num_nodes,
+            alpha=self.alpha,
+            tol=self.config.get('pagerank_tol', 1e-6),
+            max_iter=self.config.get('pagerank_max_iter', 100)
+        )
+
+        # Scale the normalized ranks to the unnormalized solution and
+        # compute the residuals it leaves exactly
+        dangling = self.out_degree == 0
+        scores = ranks * num_nodes * (1 - self.alpha) / (
+            1 - self.alpha * (1 - ranks[dangling].sum())
+        )
+        inv_degree = np.divide(
+            1.0,
+            self.out_degree,
+            out=np.zeros(num_nodes),
+            where=~dangling
+        )
+        self._scores[:num_nodes] = scores
+        self._residuals[:num_nodes] = (1 - self.alpha) - scores + (
+            self.alpha * np.bincount(
+                edge_index[1],
+                weights=(scores * inv_degree)[edge_index[0]],
+                minlength=num_nodes
+            )
+        )
+        self._pending.append(np.arange(num_nodes))
+
+    def edges_added(self, edges: np.ndarray):
+        """Update degrees and residuals for inserted edges"""
+        self._grow(self.store.num_nodes)
+        counts = np.bincount(edges[0], minlength=self.num_nodes)
+        nodes = np.flatnonzero(counts)
+        degree = self._out_degree[nodes]
+        added = counts[nodes]
+
+        # Scaling the source's score by its new degree keeps the mass
+        # sent along its old edges; a dangling source keeps its score
+        base = np.maximum(degree, 1)
+        unit = self._scores[nodes] / base
+        self._residuals[nodes] -= (degree + added - base) * unit
+        self._scores[nodes] = unit * (degree + added)
+        self._send(edges, nodes, unit, 1.0)
+
+        self.out_degree[:] += counts
+        self.in_degree[:] += np.bincount(
+            edges[1],
+            minlength=self.num_nodes
+        )
+
+    def edges_expired(self, edges: np.ndarray):
+        """Update degrees and residuals for expired edges"""
+        counts = np.bincount(edges[0], minlength=self.num_nodes)
+        nodes = np.flatnonzero(counts)
+        degree = self._out_degree[nodes]
+        remaining = np.maximum(degree - counts[nodes], 1)
+
+        unit = self._scores[nodes] / degree
+        self._residuals[nodes] += (degree - remaining) * unit
+        self._scores[nodes] = unit * remaining
+        self._send(edges, nodes, unit, -1.0)
+
+        self.out_degree[:] -= counts
+        self.in_degree[:] -= np.bincount(
+            edges[1],
+            minlength=self.num_nodes
+        )
+
+    def refresh(self) -> int:
+        """
+        Push residuals above the tolerance to the nodes' out-neighbors
+
+        Pushes run in rounds: every pending node above the tolerance moves
+        its residual into its score and sends ``alpha`` of it along its
+        out-edges, and the receiving nodes are the next round's
+        candidates.
+
+        Returns:
+            Number of pushes
+        """
+        targets = self.store.edge_index.numpy()[1]
+        pushes = 0
+        candidates = self._take_pending()
+        while len(candidates):
+            nodes = candidates[
+                np.abs(self._residuals[candidates]) > self.threshold
+                * np.maximum(self._out_degree[candidates], 1)
+            ]
+            if len(nodes) == 0:
+                break
+            residuals = self._residuals[nodes]
+            self._scores[nodes] += residuals
+            self._residuals[nodes] = 0.0
+            pushes += len(nodes)
+
+            owners, edges = self.store.batch_out_edges(nodes)
+            degree = np.bincount(owners, minlength=len(nodes))
+            shares = self.alpha * residuals / np.maximum(degree, 1)
+            candidates, inverse = np.unique(
+                targets[edges],
+                return_inverse=True
+            )
+            self._residuals[candidates] += np.bincount(
+                inverse,
+                weights=shares[owners],
+                minlength=len(candidates)
+            )
+
+        self.num_pushes += pushes
+        return pushes
+
+    @property
+    def pagerank(self) -> np.ndarray:
+        """Current PageRank of every node, summing to one"""
+        self.refresh()
+        scores = self._scores[:self.num_nodes]
+        return scores / scores.sum()
+
+    def compute(self) -> pd.DataFrame:
+        """
+        Current node features
+
+        Returns:
+            DataFrame indexed by account with ``in_degree``,
+            ``out_degree`` and ``pagerank`` columns
+        """
+        return pd.DataFrame({
+            'in_degree': self.in_degree,
+            'out_degree': self.out_degree,
+            'pagerank': self.pagerank
+        }, index=pd.Index(self.store.node_ids))
+
+    def _send(
+        self,
+        edges: np.ndarray,
+        nodes: np.ndarray,
+        unit: np.ndarray,
+        sign: float
+    ):
+        """Add or remove the mass sent along edges to their targets"""
+        per_node = np.zeros(self.num_nodes)
+        per_node[nodes] = unit
+        self._residuals[:self.num_nodes] += sign * self.alpha * (
+            np.bincount(
+                edges[1],
+                weights=per_node[edges[0]],
+                minlength=self.num_nodes
+            )
+        )
+        self._pending.extend([nodes, edges[1].copy()])
+
+    def _take_pending(self) -> np.ndarray:
+        """Unique nodes touched since the last refresh"""
+        if not self._pending:
+            return np.empty(0, dtype=np.int64)
+        pending = np.unique(np.concatenate(self._pending))
+        self._pending = []
+        return pending
+
+    def _grow(self, num_nodes: int):
+        """Add nodes new to the store, with only their teleport mass"""
+        first = self.num_nodes
+        if num_nodes <= first:
+            return
+
+        capacity = max(1, len(self._scores))
+        while num_nodes > capacity:
+            capacity *= 2
+        if capacity > len(self._scores):
+            self._in_degree = _resize(self._in_degree, capacity)
+            self._out_degree = _resize(self._out_degree, capacity)
+            self._scores = _resize(self._scores, capacity)
+            self._residuals = _resize(self._residuals, capacity)
+
+        self._in_degree[first:num_nodes] = 0
+        self._out_degree[first:num_nodes] = 0
+        self._scores[first:num_nodes] = 0.0
+        self._residuals[first:num_nodes] = 1 - self.alpha
+        self.num_nodes = num_nodes
+        self._pending.append(np.arange(first, num_nodes))
+
+
+def degrees(
+    edge_index: np.ndarray,
+    num_nodes: int
+) -> Tuple[np.ndarray, np.ndarray]:
+    """In- and out-degree of every node, counting parallel edges"""
+    return (
+        np.bincount(edge_index[1], minlength=num_nodes),
+        np.bincount(edge_index[0], minlength=num_nodes)
+    )
+
+
+def pagerank(
+    edge_index: np.ndarray,
+    num_nodes: int,
+    alpha: float = 0.85,
+    tol: float = 1e-6,
+    max_iter: int = 100,
+    init: Optional[np.ndarray] = None
+) -> Tuple[np.ndarray, int]:
+    """
+    PageRank by power iteration over the in-edge (CSC) layout
+
+    Follows ``nx.pagerank``: dangling nodes spread their rank uniformly
+    and iteration stops once the L1 change is below ``num_nodes * tol``.
+    Parallel edges act as edge weights.
+
+    Args:
+        init: Starting ranks, e.g. the previous result; uniform if None
+
+    Returns:
+        Ranks summing to one and the number of iterations run
+    """
+    if num_nodes == 0:
+        return np.empty(0), 0
+
+    csc = CSRGraph.from_edges(edge_index[1], edge_index[0], num_nodes)
+    targets = np.repeat(np.arange(num_nodes), csc.degree())
+    sources = csc.indices
+    out_degree = np.bincount(sources, minlength=num_nodes)
+    dangling = out_degree == 0
+    inv_degree = np.divide(
+        1.0,
+        out_degree,
+        out=np.zeros(num_nodes),
+        where=~dangling
+    )
+
+    if init is None or init.sum() <= 0:
+        ranks = np.full(num_nodes, 1.0 / num_nodes)
+    else:
+        ranks = np.asarray(init, dtype=np.float64) / init.sum()
+
+    for iteration in range(1, max_iter + 1):
+        previous = ranks
+        share = previous * inv_degree
+        ranks = alpha * np.bincount(
+            targets,
+            weights=share[sources],
+            minlength=num_nodes
+        )
+        ranks += (alpha * previous[dangling].sum() + 1 - alpha) / num_nodes
+        if np.abs(ranks - previous).sum() < num_nodes * tol:
+            return ranks, iteration
+
+    logger.warning(f"PageRank did not converge in {max_iter} iterations")
+    return ranks, max_iter
+
+
+def clustering(
+    edge_index: np.ndarray,
+    num_nodes: int,
+    max_wedges: int = 256,
+    rng: Optional[np.random.Generator] = None,
+    chunk_size: int = 1 << 20
+) -> np.ndarray:
+    """
+    Clustering coefficients of the undirected simple graph
+
+    Matches ``nx.clustering(graph.to_undirected())``. A node's
+    coefficient is the fraction of its wedges (pairs of neighbors) that
+    are closed by an edge. Nodes with at most ``max_wedges`` wedges are
+    counted exactly and the others estimated from ``max_wedges`` random
+    wedges, so the cost is O(num_nodes * max_wedges * log(num_edges))
+    however skewed the degrees are.
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+
+    # Undirected simple graph: drop self-loops, directions and duplicates
+    loops = edge_index[0] == edge_index[1]
+    low = np.minimum(edge_index[0], edge_index[1])[~loops]
+    high = np.maximum(edge_index[0], edge_index[1])[~loops]
+    keys = np.unique(low * num_nodes + high)
+    low, high = np.divmod(keys, num_nodes)
+    adjacency = CSRGraph.from_edges(
+        np.concatenate([low, high]),
+        np.concatenate([high, low]),
+        num_nodes
+    )
+
+    def closed(first: np.ndarray, second: np.ndarray) -> np.ndarray:
+        """Whether each pair of nodes is connected"""
+        pair = (np.minimum(first, second) * num_nodes
+                + np.maximum(first, second))
+        position = np.searchsorted(keys, pair)
+        position[position == len(keys)] = 0
+        return keys[position] == pair
+
+    degree = adjacency.degree()
+    wedges = degree * (degree - 1) // 2
+    coefficients = np.zeros(num_nodes)
+
+    # Exact counts, one degree at a time so the wedges form a grid
+    exact = (degree >= 2) & (wedges <= max_wedges)
+    for value in np.unique(degree[exact]):
+        nodes = np.flatnonzero(exact & (degree == value))
+        first, second = np.triu_indices(value, 1)
+        step = max(1, chunk_size // len(first))
+        for offset in range(0, len(nodes), step):
+            chunk = nodes[offset:offset + step]
+            starts = adjacency.indptr[chunk][:, None]
+            closed_wedges = closed(
+                adjacency.indices[starts + first],
+                adjacency.indices[starts + second]
+            ).sum(axis=1)
+            coefficients[chunk] = closed_wedges / len(first)
+
+    # Estimates from uniformly sampled wedges
+    sampled = np.flatnonzero(wedges > max_wedges)
+    step = max(1, chunk_size // max(1, max_wedges))
+    for offset in range(0, len(sampled), step):
+        chunk = sampled[offset:offset + step]
+        chunk_degree = degree[chunk][:, None]
+        first = rng.integers(0, chunk_degree, (len(chunk), max_wedges))
+        second = rng.integers(0, chunk_degree - 1,
+                              (len(chunk), max_wedges))
+        second += second >= first
+        starts = adjacency.indptr[chunk][:, None]
+        coefficients[chunk] = closed(
+            adjacency.indices[starts + first],
+            adjacency.indices[starts + second]
+        ).mean(axis=1)
+
+    return coefficients
+
+
+def _resize(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Copy an array into a larger uninitialized one"""
+    resized = np.empty(capacity, dtype=array.dtype)
+    resized[:len(array)] = array
+    return resized
@@ -0,0 +1,232 @@
+import json
+import os
+import struct
+import zlib
+import torch
+from dataclasses import dataclass, field
+from typing import Dict, Optional
+import numpy as np
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+MAGIC = b'RTFADSGS'
+FORMAT_VERSION = 1
+ALIGNMENT = 64
+
+# Magic, format version, header length, header CRC32
+_PREFIX = struct.Struct('<8sIII')
+
+
+@dataclass
+class GraphSnapshot:
+    """
+    Graph loaded from a snapshot file
+
+    Arrays are copy-on-write mappings of the file: their pages are shared
+    until written, and writes stay private to the process and never
+    reach the file. ``edge_index`` is grouped by source node, so
+    ``edge_index[1]`` is also the CSR neighbor array for ``indptr``.
+    ``extra`` holds any additional arrays the snapshot was written with.
+    """
+
+    indptr: torch.Tensor
+    edge_index: torch.Tensor
+    edge_attr: torch.Tensor
+    node_ids: np.ndarray
+    metadata: Dict
+    extra: Dict[str, torch.Tensor] = field(default_factory=dict)
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.node_ids)
+
+    @property
+    def num_edges(self) -> int:
+        return self.edge_index.shape[1]
+
+
+def save_snapshot(
+    path: str,
+    edge_index: torch.Tensor,
+    edge_attr: torch.Tensor,
+    node_ids: np.ndarray,
+    metadata: Optional[Dict] = None,
+    extra: Optional[Dict[str, np.ndarray]] = None
+):
+    """
+    Write a graph snapshot
+
+    The file is a fixed prefix (magic, format version, header length and
+    CRC32), a JSON header describing the schema and every array, and the
+    arrays themselves at 64-byte aligned offsets. Integer account IDs are
+    stored as int64, other IDs as UTF-8 strings with offsets. The file is
+    written next to ``path`` and renamed into place.
+
+    Args:
+        path: Snapshot file
+        edge_index: Tensor of shape [2, num_edges], grouped by source node
+        edge_attr: Tensor of shape [num_edges, edge_feature_dim]
+        node_ids: Account behind each node ID
+        metadata: JSON-serializable schema information to record
+        extra: Additional int64, float32 or uint8 arrays to store by name
+    """
+    edge_index = np.ascontiguousarray(edge_index, dtype=np.int64)
+    sources = edge_index[0]
+    if len(sources) and (np.diff(sources) < 0).any():
+        raise ValueError("Edges must be grouped by source node")
+
+    num_nodes = len(node_ids)
+    indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+    np.cumsum(np.bincount(sources, minlength=num_nodes), out=indptr[1:])
+
+    arrays = {
+        'indptr': indptr,
+        'edge_index': edge_index,
+        'edge_attr': np.ascontiguousarray(edge_attr, dtype=np.float32)
+    }
+    node_ids = np.asarray(node_ids)
+    if node_ids.dtype.kind in 'iu':
+        node_id_type = 'int'
+        arrays['node_ids'] = node_ids.astype(np.int64)
+    else:
+        node_id_type = 'str'
+        encoded = [str(node_id).encode('utf-8') for node_id in node_ids]
+        offsets = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum([len(value) for value in encoded], out=offsets[1:])
+        arrays['node_id_offsets'] = offsets
+        arrays['node_id_bytes'] = np.frombuffer(
+            b''.join(encoded),
+            dtype=np.uint8
+        )
+    for name, array in (extra or {}).items():
+        array = np.ascontiguousarray(array)
+        if name in arrays or array.dtype not in _TORCH_DTYPES:
+            raise ValueError(f"Cannot store {array.dtype} array {name}")
+        arrays[name] = array
+
+    layout = {}
+    offset = 0
+    checksum = 0
+    for name, array in arrays.items():
+        layout[name] = {
+            'dtype': array.dtype.str,
+            'shape': list(array.shape),
+            'offset': offset
+        }
+        offset = _align(offset + array.nbytes)
+        checksum = zlib.crc32(memoryview(array).cast('B'), checksum)
+
+    header = json.dumps({
+        'format_version': FORMAT_VERSION,
+        'num_nodes': num_nodes,
+        'num_edges': edge_index.shape[1],
+        'node_id_type': node_id_type,
+        'arrays': layout,
+        'extra': list(extra or {}),
+        'checksum': checksum,
+        'metadata': metadata or {}
+    }).encode('utf-8')
+    data_start = _align(_PREFIX.size + len(header))
+
+    temp_path = f"{path}.tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(_PREFIX.pack(MAGIC, FORMAT_VERSION, len(header),
+                             zlib.crc32(header)))
+        f.write(header)
+        for name, array in arrays.items():
+            f.seek(data_start + layout[name]['offset'])
+            f.write(memoryview(array).cast('B'))
+        f.truncate(data_start + offset)
+    os.replace(temp_path, path)
+    logger.info(f"Saved graph snapshot with {num_nodes} nodes and "
+                f"{edge_index.shape[1]} edges to {path}")
+
+
+def load_snapshot(path: str, verify: bool = False) -> GraphSnapshot:
+    """
+    Memory-map a graph snapshot
+
+    Arrays are mapped privately, not read, so loading takes constant
+    time apart from decoding string account IDs, and processes loading
+    the same file share its pages until they write to them. The header
+    is always validated.
+
+    Args:
+        path: Snapshot file
+        verify: Also check the array checksum, which reads every page
+
+    Raises:
+        ValueError: If the file is not a snapshot of a supported version
+            or fails its checksum
+    """
+    with open(path, 'rb') as f:
+        prefix = f.read(_PREFIX.size)
+        if len(prefix) < _PREFIX.size:
+            raise ValueError(f"{path} is not a graph snapshot")
+        magic, version, header_length, header_crc = _PREFIX.unpack(prefix)
+        if magic != MAGIC:
+            raise ValueError(f"{path} is not a graph snapshot")
+        if version != FORMAT_VERSION:
+            raise ValueError(
+                f"Unsupported graph snapshot version {version}"
+            )
+        header = f.read(header_length)
+    if zlib.crc32(header) != header_crc:
+        raise ValueError(f"Corrupt graph snapshot header in {path}")
+    header = json.loads(header)
+
+    data_start = _align(_PREFIX.size + header_length)
+    file_size = os.path.getsize(path)
+    mapped = torch.from_file(
+        path,
+        shared=False,
+        size=file_size,
+        dtype=torch.uint8
+    )
+
+    arrays = {}
+    checksum = 0
+    for name, spec in header['arrays'].items():
+        dtype = np.dtype(spec['dtype'])
+        start = data_start + spec['offset']
+        nbytes = int(np.prod(spec['shape'])) * dtype.itemsize
+        if start + nbytes > file_size:
+            raise ValueError(f"Truncated graph snapshot {path}")
+        raw = mapped[start:start + nbytes]
+        if verify:
+            checksum = zlib.crc32(raw.numpy(), checksum)
+        arrays[name] = raw.view(_TORCH_DTYPES[dtype]).reshape(spec['shape'])
+
+    if verify and checksum != header['checksum']:
+        raise ValueError(f"Graph snapshot checksum mismatch in {path}")
+
+    if header['node_id_type'] == 'int':
+        node_ids = arrays['node_ids'].numpy()
+    else:
+        offsets = arrays['node_id_offsets'].numpy()
+        data = arrays['node_id_bytes'].numpy().tobytes()
+        node_ids = np.array([
+            data[start:end].decode('utf-8')
+            for start, end in zip(offsets[:-1], offsets[1:])
+        ], dtype=object)
+
+    return GraphSnapshot(
+        indptr=arrays['indptr'],
+        edge_index=arrays['edge_index'],
+        edge_attr=arrays['edge_attr'],
+        node_ids=node_ids,
+        metadata=header['metadata'],
+        extra={name: arrays[name] for name in header.get('extra', [])}
+    )
+
+
+_TORCH_DTYPES = {
+    np.dtype(np.int64): torch.int64,
+    np.dtype(np.float32): torch.float32,
+    np.dtype(np.uint8): torch.uint8
+}
+
+
+def _align(offset: int) -> int:
+    return -(-offset // ALIGNMENT) * ALIGNMENT
@@ -0,0 +1,474 @@
+import torch
+from typing import Dict, List, Optional, Tuple
+import pandas as pd
+import numpy as np
+from .csr import CSRGraph
+from .graph_builder import edge_features
+from .interning import AccountInterner
+from .temporal_index import nanoseconds
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class IncrementalGraphStore:
+    """
+    Rolling transaction graph that absorbs new transactions in place
+
+    Every transaction is one edge (the ``multi`` edge mode of
+    ``GraphBuilder``) and edges older than ``window_seconds`` before the
+    latest transaction expire. Edges live in growable arrays in arrival
+    order, so appending is amortized O(1) per transaction and expiry only
+    advances the start of the live window; dead space is reclaimed when
+    the arrays are reallocated.
+
+    Adjacency is kept as per-node linked lists in growable arrays: each
+    node points at its newest out- and in-edge and each edge at the
+    previous edge of the same node. Compressed CSR/CSC copies are built on
+    demand with ``to_csr``/``to_csc`` and cached until the next change.
+
+    Edges are identified by their position in the current ``edge_index``
+    and ``edge_attr`` views; positions shift as edges expire. A view is a
+    snapshot that later changes never write into. Nodes are never removed,
+    so node IDs stay stable while the store lives; ``node_ids[i]`` is the
+    account behind node ``i``. Node IDs come from an ``AccountInterner``
+    that may be shared with feature processing and serving, so a
+    persisted interner keeps them stable across restarts too.
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        interner: Optional[AccountInterner] = None
+    ):
+        self.config = config
+        self.window_ns = int(
+            config.get('window_seconds', 30 * 86400) * 1e9
+        )
+        capacity = max(1, config.get('initial_capacity', 1024))
+
+        self.interner = interner if interner is not None else (
+            AccountInterner(capacity)
+        )
+        self._num_nodes = 0
+        self.edge_feature_names: List[str] = []
+        self.latest_timestamp: Optional[int] = None
+        self.version = 0
+
+        # Edge arrays in arrival order; the live window is [start, end).
+        # Edge IDs are global, edge ``e`` is stored at ``e - offset``
+        self._start = 0
+        self._end = 0
+        self._offset = 0
+        self._edge_index = np.empty((2, capacity), dtype=np.int64)
+        self._edge_attr: Optional[np.ndarray] = None
+        self._timestamps = np.empty(capacity, dtype=np.int64)
+        self._out_next = np.empty(capacity, dtype=np.int64)
+        self._in_next = np.empty(capacity, dtype=np.int64)
+
+        # Per-node newest edge IDs and live degrees
+        self._out_head = np.full(capacity, -1, dtype=np.int64)
+        self._in_head = np.full(capacity, -1, dtype=np.int64)
+        self._out_degree = np.zeros(capacity, dtype=np.int64)
+        self._in_degree = np.zeros(capacity, dtype=np.int64)
+
+        self._compressed: Dict[str, Tuple[int, CSRGraph]] = {}
+
+        # Objects notified of every change through ``edges_added`` and
+        # ``edges_expired``, called with the [2, k] node IDs of the edges
+        self.listeners: List = []
+
+    @property
+    def num_nodes(self) -> int:
+        return self._num_nodes
+
+    @property
+    def node_ids(self) -> np.ndarray:
+        """Account behind every node ID, int64 for integer accounts"""
+        return self.interner.decode(np.arange(self.num_nodes))
+
+    @property
+    def num_edges(self) -> int:
+        return self._end - self._start
+
+    @property
+    def edge_index(self) -> torch.Tensor:
+        """Live edges as a [2, num_edges] view, without copying"""
+        return torch.from_numpy(self._edge_index[:, self._start:self._end])
+
+    @property
+    def edge_attr(self) -> torch.Tensor:
+        """Live edge features as a [num_edges, dim] view, without copying"""
+        if self._edge_attr is None:
+            return torch.empty((0, 0))
+        return torch.from_numpy(self._edge_attr[self._start:self._end])
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Live edge timestamps in nanoseconds, as a view"""
+        return self._timestamps[self._start:self._end]
+
+    @property
+    def out_degree(self) -> np.ndarray:
+        """Live out-degree of every node, as a view"""
+        return self._out_degree[:self.num_nodes]
+
+    @property
+    def in_degree(self) -> np.ndarray:
+        """Live in-degree of every node, as a view"""
+        return self._in_degree[:self.num_nodes]
+
+    def add_transactions(self, data: pd.DataFrame):
+        """
+        Append transactions as edges and expire those outside the window
+
+        Transactions are expected in roughly chronological order: edges
+        expire in arrival order, so an old transaction arriving after a
+        newer one stays until the newer one expires.
+        """
+        num_rows = len(data)
+        if num_rows == 0:
+            return
+
+        source_codes, target_codes = self._intern(data)
+        timestamps = nanoseconds(
+            data[self.config['timestamp_col']].to_numpy()
+        )
+        features, names = edge_features(
+            data,
+            np.arange(num_rows),
+            self.config
+        )
+        if self._edge_attr is None:
+            self.edge_feature_names = names
+            self._edge_attr = np.empty(
+                (len(self._timestamps), features.shape[1]),
+                dtype=np.float32
+            )
+        elif names != self.edge_feature_names:
+            raise ValueError(
+                f"Edge features {names} do not match "
+                f"{self.edge_feature_names}"
+            )
+
+        self._reserve(num_rows)
+        positions = slice(self._end, self._end + num_rows)
+        self._edge_index[0, positions] = source_codes
+        self._edge_index[1, positions] = target_codes
+        self._edge_attr[positions] = features
+        self._timestamps[positions] = timestamps
+
+        edge_ids = self._offset + np.arange(
+            self._end,
+            self._end + num_rows,
+            dtype=np.int64
+        )
+        self._link(self._out_head, self._out_next, source_codes, edge_ids)
+        self._link(self._in_head, self._in_next, target_codes, edge_ids)
+        self._out_degree[:self.num_nodes] += np.bincount(
+            source_codes,
+            minlength=self.num_nodes
+        )
+        self._in_degree[:self.num_nodes] += np.bincount(
+            target_codes,
+            minlength=self.num_nodes
+        )
+
+        self._end += num_rows
+        for listener in self.listeners:
+            listener.edges_added(self._edge_index[:, positions])
+        latest = int(timestamps.max())
+        if self.latest_timestamp is None or latest > self.latest_timestamp:
+            self.latest_timestamp = latest
+        self.version += 1
+        self.expire()
+
+    def expire(self, now=None) -> int:
+        """
+        Expire edges older than the window before ``now``
+
+        Args:
+            now: Reference time, defaults to the latest transaction
+
+        Returns:
+            Number of expired edges
+        """
+        if now is not None:
+            reference = pd.Timestamp(now).value
+        elif self.latest_timestamp is not None:
+            reference = self.latest_timestamp
+        else:
+            return 0
+
+        # Scan growing blocks from the start so the cost follows the
+        # number of expired edges rather than the window size
+        cutoff = reference - self.window_ns
+        num_expired = 0
+        block = 64
+        while self._start + num_expired < self._end:
+            first = self._start + num_expired
+            live = self._timestamps[first:min(first + block, self._end)]
+            live = live >= cutoff
+            if live.any():
+                num_expired += int(np.argmax(live))
+                break
+            num_expired += len(live)
+            block *= 2
+        if num_expired == 0:
+            return 0
+
+        expired = self._edge_index[:, self._start:self._start + num_expired]
+        self._out_degree[:self.num_nodes] -= np.bincount(
+            expired[0],
+            minlength=self.num_nodes
+        )
+        self._in_degree[:self.num_nodes] -= np.bincount(
+            expired[1],
+            minlength=self.num_nodes
+        )
+        self._start += num_expired
+        self.version += 1
+        for listener in self.listeners:
+            listener.edges_expired(expired)
+        return num_expired
+
+    def out_edges(
+        self,
+        node: int,
+        limit: Optional[int] = None,
+        before: Optional[int] = None
+    ) -> np.ndarray:
+        """
+        Positions of a node's live out-edges, newest first
+
+        Args:
+            node: Node ID
+            limit: Return at most this many edges
+            before: Only return edges with timestamps (in nanoseconds)
+                strictly before this
+        """
+        return self._walk(self._out_head, self._out_next, node, limit,
+                          before)
+
+    def in_edges(
+        self,
+        node: int,
+        limit: Optional[int] = None,
+        before: Optional[int] = None
+    ) -> np.ndarray:
+        """Positions of a node's live in-edges, newest first"""
+        return self._walk(self._in_head, self._in_next, node, limit,
+                          before)
+
+    def batch_out_edges(
+        self,
+        nodes: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Live out-edges of many nodes at once
+
+        Returns:
+            owners: Index into ``nodes`` of each edge's source
+            edges: Edge positions
+        """
+        return self._walk_many(self._out_head, self._out_next, nodes)
+
+    def lookup(self, accounts) -> np.ndarray:
+        """Node ID of each account, -1 for accounts not in the store"""
+        codes = self.interner.lookup(accounts).astype(np.int64)
+        # Accounts interned elsewhere become nodes on their first edge
+        codes[codes >= self.num_nodes] = -1
+        return codes
+
+    def to_csr(self) -> CSRGraph:
+        """Live edges compressed by source node"""
+        return self._compress('csr')
+
+    def to_csc(self) -> CSRGraph:
+        """Live edges compressed by target node"""
+        return self._compress('csc')
+
+    def _compress(self, layout: str) -> CSRGraph:
+        cached = self._compressed.get(layout)
+        if cached is not None and cached[0] == self.version:
+            return cached[1]
+
+        rows, cols = self._edge_index[:, self._start:self._end]
+        if layout == 'csc':
+            rows, cols = cols, rows
+        graph = CSRGraph.from_edges(rows, cols, self.num_nodes)
+        self._compressed[layout] = (self.version, graph)
+        return graph
+
+    def _intern(self, data: pd.DataFrame) -> Tuple[np.ndarray, np.ndarray]:
+        """Map accounts to stable node IDs, adding unseen ones"""
+        # Interleave so new nodes are numbered by first appearance
+        accounts = np.column_stack([
+            data[self.config['source_col']].to_numpy(),
+            data[self.config['target_col']].to_numpy()
+        ]).ravel()
+        codes = self.interner.encode(accounts).astype(np.int64)
+        self._num_nodes = len(self.interner)
+        self._reserve_nodes(self.num_nodes)
+        return codes[0::2], codes[1::2]
+
+    def _link(
+        self,
+        head: np.ndarray,
+        next_edge: np.ndarray,
+        nodes: np.ndarray,
+        edge_ids: np.ndarray
+    ):
+        """Prepend new edges, in ID order, to their nodes' edge lists"""
+        order = np.argsort(nodes, kind='stable')
+        nodes = nodes[order]
+        edge_ids = edge_ids[order]
+
+        # Each edge points at the previous new edge of its node, the first
+        # new edge of a node at the node's previous head
+        first = np.ones(len(nodes), dtype=bool)
+        first[1:] = nodes[1:] != nodes[:-1]
+        previous = np.empty(len(nodes), dtype=np.int64)
+        previous[1:] = edge_ids[:-1]
+        previous[first] = head[nodes[first]]
+        next_edge[edge_ids - self._offset] = previous
+
+        last = np.ones(len(nodes), dtype=bool)
+        last[:-1] = first[1:]
+        head[nodes[last]] = edge_ids[last]
+
+    def _walk(
+        self,
+        head: np.ndarray,
+        next_edge: np.ndarray,
+        node: int,
+        limit: Optional[int] = None,
+        before: Optional[int] = None
+    ) -> np.ndarray:
+        """Follow a node's edge list until it reaches expired edges"""
+        first_live = self._offset + self._start
+        if limit is None:
+            limit = self.num_edges
+
+        offset = self._offset
+        timestamps = self._timestamps
+        edges = []
+        edge = int(head[node])
+        while edge >= first_live and len(edges) < limit:
+            position = edge - offset
+            if before is None or timestamps[position] < before:
+                edges.append(position)
+            edge = int(next_edge[position])
+        return np.array(edges, dtype=np.int64) - self._start
+
+    def _walk_many(
+        self,
+        head: np.ndarray,
+        next_edge: np.ndarray,
+        nodes: np.ndarray,
+        min_vectorized: int = 16
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Follow many edge lists in lockstep
+
+        Each step advances every unfinished list by one edge. Once fewer
+        than ``min_vectorized`` lists remain, typically those of a few
+        hubs, they are finished one at a time.
+        """
+        first_live = self._offset + self._start
+        owners = np.arange(len(nodes))
+        edge = head[nodes]
+        live = edge >= first_live
+        owners, edge = owners[live], edge[live]
+
+        owner_parts, edge_parts = [], []
+        while len(edge) >= min_vectorized:
+            position = edge - self._offset
+            owner_parts.append(owners)
+            edge_parts.append(position)
+            edge = next_edge[position]
+            live = edge >= first_live
+            owners, edge = owners[live], edge[live]
+
+        for owner, start in zip(owners.tolist(), edge.tolist()):
+            positions = []
+            while start >= first_live:
+                positions.append(start - self._offset)
+                start = int(next_edge[start - self._offset])
+            owner_parts.append(np.full(len(positions), owner))
+            edge_parts.append(np.array(positions, dtype=np.int64))
+
+        if not edge_parts:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        return (
+            np.concatenate(owner_parts),
+            np.concatenate(edge_parts) - self._start
+        )
+
+    def _reserve(self, num_rows: int):
+        """
+        Make room for ``num_rows`` more edges
+
+        The live window moves to the start of new arrays, doubled only if
+        it would fill more than half of them. Every reallocation therefore
+        either doubles the capacity or reclaims at least as many expired
+        edges as it copies, keeping appends amortized O(1).
+        """
+        capacity = len(self._timestamps)
+        if self._end + num_rows <= capacity:
+            return
+
+        num_live = self.num_edges
+        while num_live + num_rows > capacity // 2:
+            capacity *= 2
+
+        live = slice(self._start, self._end)
+        self._edge_index = _reallocate(
+            self._edge_index[:, live],
+            capacity,
+            axis=1
+        )
+        self._edge_attr = _reallocate(self._edge_attr[live], capacity)
+        self._timestamps = _reallocate(self._timestamps[live], capacity)
+        self._out_next = _reallocate(self._out_next[live], capacity)
+        self._in_next = _reallocate(self._in_next[live], capacity)
+
+        self._offset += self._start
+        self._start = 0
+        self._end = num_live
+        logger.debug(f"Graph store reallocated for {capacity} edges")
+
+    def _reserve_nodes(self, num_nodes: int):
+        """Grow the per-node arrays to hold ``num_nodes`` nodes"""
+        capacity = len(self._out_head)
+        if num_nodes <= capacity:
+            return
+        while num_nodes > capacity:
+            capacity *= 2
+
+        self._out_head = _grow(self._out_head, capacity, -1)
+        self._in_head = _grow(self._in_head, capacity, -1)
+        self._out_degree = _grow(self._out_degree, capacity, 0)
+        self._in_degree = _grow(self._in_degree, capacity, 0)
+
+
+def _reallocate(
+    live: np.ndarray,
+    capacity: int,
+    axis: int = 0
+) -> np.ndarray:
+    """Copy ``live`` into a new array with ``capacity`` along ``axis``"""
+    shape = list(live.shape)
+    shape[axis] = capacity
+    array = np.empty(shape, dtype=live.dtype)
+    index = [slice(None)] * live.ndim
+    index[axis] = slice(0, live.shape[axis])
+    array[tuple(index)] = live
+    return array
+
+
+def _grow(array: np.ndarray, capacity: int, fill: int) -> np.ndarray:
+    """Copy a per-node array into a larger one padded with ``fill``"""
+    grown = np.full(capacity, fill, dtype=array.dtype)
+    grown[:len(array)] = array
+    return grown
@@ -0,0 +1,313 @@
+import os
+from typing import Tuple
+import pandas as pd
+import numpy as np
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+# Keys of the two independent 64-bit hashes that identify an account
+_HASH_KEYS = ('rt-fads-intern-a', 'rt-fads-intern-b')
+_EMPTY = -1
+
+
+class AccountInterner:
+    """
+    Dense int32 node IDs for account identifiers
+
+    Accounts are interned by their string form, so ``12345`` and
+    ``'12345'`` are the same account, and numbered from 0 in order of
+    first appearance. While every interned account is an integer, decoding
+    returns int64 accounts, so results keyed by account join back to
+    integer account columns; otherwise accounts decode to strings.
+
+    Lookups use an open-addressing hash table with linear probing held
+    in NumPy arrays and run vectorized over whole columns. An account is
+    identified by two independent 64-bit hashes of its UTF-8 bytes, so
+    distinct accounts collide with probability about ``n^2 / 2^129``;
+    the strings themselves are kept in one byte arena for decoding and
+    persistence.
+
+    One interner can be shared by graph building, feature processing and
+    serving so that an account has the same node ID everywhere, and
+    ``save``/``load`` keep the IDs stable across restarts.
+    """
+
+    FORMAT_VERSION = 1
+
+    def __init__(self, capacity: int = 1024, max_load: float = 0.5):
+        self.max_load = max_load
+        capacity = max(1, capacity)
+        table_size = 1 << int(np.ceil(np.log2(capacity / max_load)))
+
+        self._size = 0
+        self._slots = np.full(table_size, _EMPTY, dtype=np.int32)
+        self._hash_a = np.empty(capacity, dtype=np.uint64)
+        self._hash_b = np.empty(capacity, dtype=np.uint64)
+        self._offsets = np.zeros(capacity + 1, dtype=np.int64)
+        self._arena = np.empty(capacity * 16, dtype=np.uint8)
+        self._integer_accounts = True
+
+    def __len__(self) -> int:
+        return self._size
+
+    @property
+    def memory_bytes(self) -> int:
+        """Bytes allocated by the interner's arrays"""
+        return sum(array.nbytes for array in (
+            self._slots, self._hash_a, self._hash_b, self._offsets,
+            self._arena
+        ))
+
+    def encode(self, accounts, add: bool = True) -> np.ndarray:
+        """
+        Node ID of every account in a column
+
+        Args:
+            accounts: Array-like of account identifiers
+            add: Intern unseen accounts; otherwise they map to -1
+
+        Returns:
+            int32 array of node IDs
+        """
+        codes, uniques, integers = _factorize_strings(accounts)
+        hash_a, hash_b = _hash(uniques)
+        ids, _ = self._find(hash_a, hash_b)
+
+        missing = np.flatnonzero(ids == _EMPTY)
+        if add and len(missing):
+            self._integer_accounts = self._integer_accounts and integers
+            ids[missing] = self._insert(
+                hash_a[missing],
+                hash_b[missing],
+                uniques[missing]
+            )
+        return ids[codes]
+
+    def lookup(self, accounts) -> np.ndarray:
+        """Node ID of every account, -1 for accounts not interned"""
+        return self.encode(accounts, add=False)
+
+    def decode(self, ids) -> np.ndarray:
+        """Account of every node ID, as int64 or string (see the class)"""
+        ids = np.asarray(ids, dtype=np.int64)
+        if ((ids < 0) | (ids >= self._size)).any():
+            raise KeyError("Unknown node ID")
+        arena = memoryview(self._arena)
+        starts = self._offsets[ids].tolist()
+        ends = self._offsets[ids + 1].tolist()
+        decoded = np.empty(len(ids), dtype=object)
+        decoded[:] = [str(arena[start:end], 'utf-8')
+                      for start, end in zip(starts, ends)]
+        if self._integer_accounts and self._size:
+            return decoded.astype(np.int64)
+        return decoded
+
+    def accounts(self) -> np.ndarray:
+        """Every interned account, indexed by node ID"""
+        return self.decode(np.arange(self._size))
+
+    def save(self, path: str):
+        """Persist the interner; written next to ``path`` and renamed"""
+        temp_path = f"{path}.tmp.npz"
+        np.savez(
+            temp_path,
+            format_version=self.FORMAT_VERSION,
+            max_load=self.max_load,
+            slots=self._slots,
+            hash_a=self._hash_a[:self._size],
+            hash_b=self._hash_b[:self._size],
+            offsets=self._offsets[:self._size + 1],
+            arena=self._arena[:self._offsets[self._size]],
+            integer_accounts=self._integer_accounts
+        )
+        os.replace(temp_path, path)
+        logger.info(f"Saved {self._size} interned accounts to {path}")
+
+    @classmethod
+    def load(cls, path: str) -> 'AccountInterner':
+        """
+        Load a persisted interner
+
+        Raises:
+            ValueError: If the file was written by another format version
+        """
+        with np.load(path) as saved:
+            version = int(saved['format_version'])
+            if version != cls.FORMAT_VERSION:
+                raise ValueError(
+                    f"Unsupported interner format version {version}"
+                )
+            interner = cls(capacity=1, max_load=float(saved['max_load']))
+            interner._slots = saved['slots']
+            interner._hash_a = saved['hash_a']
+            interner._hash_b = saved['hash_b']
+            interner._offsets = saved['offsets']
+            interner._arena = saved['arena']
+            # Files saved before integer accounts were tracked decoded
+            # every account to a string
+            interner._integer_accounts = (
+                bool(saved['integer_accounts'])
+                if 'integer_accounts' in saved.files else False
+            )
+        interner._size = len(interner._hash_a)
+        return interner
+
+    def _find(
+        self,
+        hash_a: np.ndarray,
+        hash_b: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Probe the table for every key
+
+        Returns:
+            ids: Node ID of each key, -1 if absent
+            slots: Slot holding each key, or the empty slot ending its
+                probe sequence if absent
+        """
+        mask = len(self._slots) - 1
+        ids = np.full(len(hash_a), _EMPTY, dtype=np.int32)
+        slots = (hash_a & np.uint64(mask)).astype(np.int64)
+
+        pending = np.arange(len(hash_a))
+        while len(pending):
+            found = self._slots[slots[pending]]
+            occupied = found != _EMPTY
+            candidates = found[occupied]
+            match = (
+                (self._hash_a[candidates] == hash_a[pending[occupied]])
+                & (self._hash_b[candidates] == hash_b[pending[occupied]])
+            )
+            matched = pending[occupied][match]
+            ids[matched] = candidates[match]
+
+            pending = pending[occupied][~match]
+            slots[pending] = (slots[pending] + 1) & mask
+        return ids, slots
+
+    def _insert(
+        self,
+        hash_a: np.ndarray,
+        hash_b: np.ndarray,
+        accounts: np.ndarray
+    ) -> np.ndarray:
+        """Intern accounts known to be absent and return their IDs"""
+        first = self._size
+        size = first + len(accounts)
+        if size > np.iinfo(np.int32).max:
+            raise OverflowError("Too many accounts for int32 node IDs")
+
+        encoded = [account.encode('utf-8') for account in accounts]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64,
+                              count=len(encoded))
+        self._reserve(size, self._offsets[first] + lengths.sum())
+
+        ends = self._offsets[first] + np.cumsum(lengths)
+        self._offsets[first + 1:size + 1] = ends
+        self._arena[self._offsets[first]:ends[-1]] = np.frombuffer(
+            b''.join(encoded),
+            dtype=np.uint8
+        )
+        self._hash_a[first:size] = hash_a
+        self._hash_b[first:size] = hash_b
+        self._size = size
+
+        ids = np.arange(first, size, dtype=np.int32)
+        self._place(ids)
+        return ids
+
+    def _place(self, ids: np.ndarray):
+        """Put interned IDs into empty slots of their probe sequences"""
+        mask = len(self._slots) - 1
+        slots = (self._hash_a[ids] & np.uint64(mask)).astype(np.int64)
+        while len(ids):
+            free = self._slots[slots] == _EMPTY
+            # Several keys may reach the same free slot; the first wins
+            _, first = np.unique(slots[free], return_index=True)
+            claimed = np.flatnonzero(free)[first]
+            self._slots[slots[claimed]] = ids[claimed]
+
+            waiting = np.ones(len(ids), dtype=bool)
+            waiting[claimed] = False
+            ids = ids[waiting]
+            slots = (slots[waiting] + 1) & mask
+
+    def _reserve(self, size: int, arena_size: int):
+        """Grow the arrays for ``size`` accounts, rehashing if needed"""
+        # A loaded interner's arrays are trimmed, possibly to nothing
+        capacity = max(1, len(self._hash_a))
+        if size > capacity:
+            while size > capacity:
+                capacity *= 2
+            self._hash_a = _resize(self._hash_a, capacity)
+            self._hash_b = _resize(self._hash_b, capacity)
+            self._offsets = _resize(self._offsets, capacity + 1)
+
+        if arena_size > len(self._arena):
+            self._arena = _resize(
+                self._arena,
+                max(arena_size, 2 * len(self._arena))
+            )
+
+        table_size = len(self._slots)
+        if size > self.max_load * table_size:
+            while size > self.max_load * table_size:
+                table_size *= 2
+            self._slots = np.full(table_size, _EMPTY, dtype=np.int32)
+            self._place(np.arange(self._size, dtype=np.int32))
+
+
+def _factorize_strings(
+    accounts
+) -> Tuple[np.ndarray, np.ndarray, bool]:
+    """
+    Codes and unique string forms of a column of accounts
+
+    Returns:
+        Codes, unique strings and whether every account is an integer
+        that fits in int64
+    """
+    codes, uniques = pd.factorize(np.asarray(accounts, dtype=object))
+    if (codes < 0).any():
+        raise ValueError("Account identifiers must not be missing")
+
+    inferred = pd.api.types.infer_dtype(uniques, skipna=False)
+    if inferred == 'string':
+        return codes, uniques, False
+    integers = inferred == 'integer' and bool(_fits_int64(uniques))
+
+    # Different values may share a string form, e.g. 5 and '5'
+    strings = pd.Series(uniques, dtype=object).astype(str).to_numpy(
+        dtype=object
+    )
+    string_codes, strings = pd.factorize(strings)
+    return string_codes[codes], strings, integers
+
+
+def _fits_int64(values: np.ndarray) -> bool:
+    """Whether integer values all fit in int64"""
+    if not len(values):
+        return True
+    bounds = np.iinfo(np.int64)
+    return bounds.min <= min(values) and max(values) <= bounds.max
+
+
+def _hash(accounts: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Two independent 64-bit hashes of each account string"""
+    return tuple(
+        pd.util.hash_array(
+            accounts,
+            encoding='utf8',
+            hash_key=key,
+            categorize=False
+        )
+        for key in _HASH_KEYS
+    )
+
+
+def _resize(array: np.ndarray, capacity: int) -> np.ndarray:
+    """Copy an array into a larger uninitialized one"""
+    resized = np.empty(capacity, dtype=array.dtype)
+    resized[:len(array)] = array
+    return resized
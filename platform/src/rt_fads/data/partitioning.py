@@ -0,0 +1,402 @@
+import os
+import torch
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from .csr import CSRGraph
+from .graph_snapshot import GraphSnapshot, load_snapshot, save_snapshot
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class GraphShard:
+    """
+    One partition of a graph, memory-mapped from its shard file
+
+    Local nodes ``0..num_owned - 1`` are owned by the partition; the rest
+    are halo nodes owned elsewhere that share an edge with an owned node.
+    ``global_node_ids`` maps local to global node IDs and ``edge_ids``
+    gives each local edge's position in the partitioned ``edge_index``.
+    ``boundary`` lists the owned nodes with edges to other partitions.
+    """
+
+    partition: int
+    num_partitions: int
+    num_owned: int
+    snapshot: GraphSnapshot
+    global_node_ids: torch.Tensor
+    edge_ids: torch.Tensor
+    boundary: torch.Tensor
+
+    @property
+    def edge_index(self) -> torch.Tensor:
+        return self.snapshot.edge_index
+
+    @property
+    def edge_attr(self) -> torch.Tensor:
+        return self.snapshot.edge_attr
+
+    @property
+    def node_ids(self) -> np.ndarray:
+        return self.snapshot.node_ids
+
+    @property
+    def num_halo(self) -> int:
+        return len(self.global_node_ids) - self.num_owned
+
+
+class GraphPartitioner:
+    """
+    Split a transaction graph into partitions with a low edge cut
+
+    Nodes are first assigned by streaming linear deterministic greedy
+    (LDG): in random order, a node joins the partition holding most of
+    its already assigned neighbors, weighted by the partition's remaining
+    capacity. Nodes are streamed in chunks scored in one vectorized step
+    each; chunks start at one node and grow to ``chunk_size`` as more
+    nodes are assigned, since early choices have the least to go on.
+
+    With the ``lpa`` method the assignment is then refined by balanced
+    label propagation: every round nodes move to the partition most of
+    their neighbors are in, as long as it has room, and the lowest-cut
+    assignment is kept.
+
+    Edge direction is ignored. No partition exceeds ``balance`` times the
+    average partition size.
+    """
+
+    METHODS = ('ldg', 'lpa')
+
+    def __init__(self, config: Dict):
+        self.config = config
+        self.num_partitions = config.get('num_partitions', 4)
+        self.method = config.get('method', 'lpa')
+        if self.method not in self.METHODS:
+            raise ValueError(f"Unsupported partitioning: {self.method}")
+        self.balance = config.get('balance', 1.05)
+        if self.balance < 1:
+            raise ValueError(
+                f"balance must be at least 1, got {self.balance}"
+            )
+        self.chunk_size = config.get('chunk_size', 1024)
+        self.lpa_iterations = config.get('lpa_iterations', 20)
+        self.rng = np.random.default_rng(config.get('seed', 0))
+
+    def partition(self, edge_index, num_nodes: int) -> np.ndarray:
+        """
+        Assign every node to a partition
+
+        Args:
+            edge_index: Array of shape [2, num_edges]
+            num_nodes: Number of nodes
+
+        Returns:
+            Partition of each node
+        """
+        edge_index = np.asarray(edge_index, dtype=np.int64)
+        sources, targets = edge_index[:, edge_index[0] != edge_index[1]]
+        graph = CSRGraph.from_edges(
+            np.concatenate([sources, targets]),
+            np.concatenate([targets, sources]),
+            num_nodes
+        )
+        capacity = int(np.ceil(
+            self.balance * num_nodes / self.num_partitions
+        ))
+
+        assignment = self._stream(graph, capacity)
+        if self.method == 'lpa':
+            assignment = self._propagate(graph, assignment, capacity)
+
+        logger.info(
+            f"Partitioned {num_nodes} nodes into {self.num_partitions} "
+            f"partitions, edge cut {edge_cut(edge_index, assignment):.3f}"
+        )
+        return assignment
+
+    def write_shards(
+        self,
+        builder,
+        directory: str,
+        assignment: Optional[np.ndarray] = None
+    ) -> List[str]:
+        """
+        Partition a built graph and write one memory-mapped shard each
+
+        Each shard holds every edge with an owned endpoint, so edges
+        between partitions are stored in both shards. The assignment is
+        saved alongside for routing accounts to their shard.
+
+        Args:
+            builder: ``GraphBuilder`` holding the built graph
+            directory: Output directory, created if missing
+            assignment: Partition of each node, computed if not given
+
+        Returns:
+            Path of every shard, by partition
+        """
+        edge_index = builder.edge_index.numpy()
+        num_nodes = len(builder.node_ids)
+        if assignment is None:
+            assignment = self.partition(edge_index, num_nodes)
+
+        os.makedirs(directory, exist_ok=True)
+        np.save(assignment_path(directory), assignment)
+        cut = assignment[edge_index[0]] != assignment[edge_index[1]]
+        boundary = np.zeros(num_nodes, dtype=bool)
+        boundary[edge_index[:, cut].ravel()] = True
+
+        paths = []
+        for partition in range(self.num_partitions):
+            owned = assignment == partition
+            edge_ids = np.flatnonzero(
+                owned[edge_index[0]] | owned[edge_index[1]]
+            )
+            shard_edges = edge_index[:, edge_ids]
+            owned_nodes = np.flatnonzero(owned)
+            halo_nodes = np.setdiff1d(shard_edges.ravel(), owned_nodes)
+            global_node_ids = np.concatenate([owned_nodes, halo_nodes])
+
+            # Relabel to local IDs and group edges by local source
+            local = np.empty(num_nodes, dtype=np.int64)
+            local[global_node_ids] = np.arange(len(global_node_ids))
+            local_edges = local[shard_edges]
+            order = np.argsort(local_edges[0], kind='stable')
+            edge_ids = edge_ids[order]
+
+            path = shard_path(directory, partition)
+            save_snapshot(
+                path,
+                local_edges[:, order],
+                builder.edge_attr.numpy()[edge_ids],
+                np.asarray(builder.node_ids)[global_node_ids],
+                metadata={
+                    'source_col': builder.config.get('source_col'),
+                    'target_col': builder.config.get('target_col'),
+                    'edge_mode': builder.edge_mode,
+                    'edge_feature_names': builder.edge_feature_names,
+                    'num_transactions': builder.num_transactions,
+                    'partition': partition,
+                    'num_partitions': self.num_partitions,
+                    'num_owned': len(owned_nodes)
+                },
+                extra={
+                    'global_node_ids': global_node_ids,
+                    'edge_ids': edge_ids,
+                    'boundary': local[owned_nodes[boundary[owned_nodes]]]
+                }
+            )
+            paths.append(path)
+        return paths
+
+    def _stream(self, graph: CSRGraph, capacity: int) -> np.ndarray:
+        """Linear deterministic greedy assignment in random order"""
+        order = self.rng.permutation(graph.num_nodes)
+        assignment = np.full(graph.num_nodes, -1, dtype=np.int64)
+        sizes = np.zeros(self.num_partitions, dtype=np.int64)
+
+        start = 0
+        while start < len(order):
+            size = min(self.chunk_size, max(1, start // 16))
+            nodes = order[start:start + size]
+            start += size
+            counts = self._neighbor_counts(graph, nodes, assignment)
+            # The small constant sends nodes without assigned neighbors
+            # to the emptiest partition
+            scores = (counts + 1e-3) * (1 - sizes / capacity)
+            choice = _fill(scores, capacity - sizes)
+            assignment[nodes] = choice
+            sizes += np.bincount(choice, minlength=self.num_partitions)
+        return assignment
+
+    def _propagate(
+        self,
+        graph: CSRGraph,
+        assignment: np.ndarray,
+        capacity: int
+    ) -> np.ndarray:
+        """Refine an assignment by balanced label propagation"""
+        nodes = np.arange(graph.num_nodes)
+        best, best_cut = assignment, self._cut(graph, assignment)
+
+        for _ in range(self.lpa_iterations):
+            counts = self._neighbor_counts(graph, nodes, assignment)
+            current = counts[nodes, assignment]
+            target = counts.argmax(axis=1)
+            gain = counts[nodes, target] - current
+
+            # Move a random half of the improving nodes so neighbors do
+            # not keep swapping partitions in step
+            movers = np.flatnonzero(
+                (gain > 0) & (self.rng.random(len(nodes)) < 0.5)
+            )
+            if len(movers) == 0:
+                break
+            movers = self._admit(
+                movers,
+                assignment[movers],
+                target[movers],
+                gain[movers],
+                np.bincount(assignment, minlength=self.num_partitions),
+                capacity
+            )
+            assignment = assignment.copy()
+            assignment[movers] = target[movers]
+
+            cut = self._cut(graph, assignment)
+            if cut < best_cut:
+                best, best_cut = assignment, cut
+        return best
+
+    def _admit(
+        self,
+        movers: np.ndarray,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        gain: np.ndarray,
+        sizes: np.ndarray,
+        capacity: int
+    ) -> np.ndarray:
+        """
+        Movers that can switch partitions without overfilling any
+
+        Nodes leaving a partition make room for nodes entering it, so
+        full partitions can still exchange nodes. Arrivals with the least
+        gain are turned away from partitions that would overflow until
+        every partition fits.
+        """
+        limit = np.maximum(sizes, capacity)
+        order = np.lexsort((-gain, targets))
+        movers, sources, targets = (
+            movers[order], sources[order], targets[order]
+        )
+        admitted = np.ones(len(movers), dtype=bool)
+        while True:
+            final = sizes + np.bincount(
+                targets[admitted],
+                minlength=self.num_partitions
+            ) - np.bincount(sources[admitted], minlength=self.num_partitions)
+            excess = final - limit
+            if (excess <= 0).all():
+                return movers[admitted]
+
+            # Arrivals are grouped by target with the best gains first;
+            # turn away the last ``excess`` of each overflowing target
+            admitted_before = np.concatenate([[0], np.cumsum(admitted)])
+            first = np.searchsorted(targets, np.arange(self.num_partitions))
+            rank = admitted_before[1:] - 1 - admitted_before[first[targets]]
+            arrivals = np.bincount(
+                targets[admitted],
+                minlength=self.num_partitions
+            )
+            keep = arrivals - np.maximum(excess, 0)
+            admitted &= rank < keep[targets]
+
+    def _neighbor_counts(
+        self,
+        graph: CSRGraph,
+        nodes: np.ndarray,
+        assignment: np.ndarray
+    ) -> np.ndarray:
+        """Number of assigned neighbors of each node per partition"""
+        owners, neighbors = _gather(graph, nodes)
+        partitions = assignment[neighbors]
+        assigned = partitions >= 0
+        return np.bincount(
+            owners[assigned] * self.num_partitions + partitions[assigned],
+            minlength=len(nodes) * self.num_partitions
+        ).reshape(len(nodes), self.num_partitions)
+
+    def _cut(self, graph: CSRGraph, assignment: np.ndarray) -> int:
+        sources = np.repeat(np.arange(graph.num_nodes), graph.degree())
+        return int((assignment[sources] != assignment[graph.indices]).sum())
+
+
+def edge_cut(edge_index, assignment: np.ndarray) -> float:
+    """Fraction of edges whose endpoints are in different partitions"""
+    edge_index = np.asarray(edge_index)
+    if edge_index.shape[1] == 0:
+        return 0.0
+    return float(np.mean(
+        assignment[edge_index[0]] != assignment[edge_index[1]]
+    ))
+
+
+def shard_path(directory: str, partition: int) -> str:
+    return os.path.join(directory, f'partition-{partition:04d}.snapshot')
+
+
+def assignment_path(directory: str) -> str:
+    return os.path.join(directory, 'assignment.npy')
+
+
+def load_assignment(directory: str) -> np.ndarray:
+    """Partition of every global node ID, for routing to shards"""
+    return np.load(assignment_path(directory), mmap_mode='r')
+
+
+def load_shard(path: str, verify: bool = False) -> GraphShard:
+    """Memory-map a shard written by ``GraphPartitioner.write_shards``"""
+    snapshot = load_snapshot(path, verify=verify)
+    metadata = snapshot.metadata
+    if 'partition' not in metadata:
+        raise ValueError(f"{path} is not a graph shard")
+    return GraphShard(
+        partition=metadata['partition'],
+        num_partitions=metadata['num_partitions'],
+        num_owned=metadata['num_owned'],
+        snapshot=snapshot,
+        global_node_ids=snapshot.extra['global_node_ids'],
+        edge_ids=snapshot.extra['edge_ids'],
+        boundary=snapshot.extra['boundary']
+    )
+
+
+def _gather(
+    graph: CSRGraph,
+    nodes: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Neighbors of many nodes with the index of the node they belong to"""
+    degree = graph.indptr[nodes + 1] - graph.indptr[nodes]
+    owners = np.repeat(np.arange(len(nodes)), degree)
+    offsets = np.arange(len(owners)) - np.repeat(
+        np.cumsum(degree) - degree,
+        degree
+    )
+    positions = np.repeat(graph.indptr[nodes], degree) + offsets
+    return owners, graph.indices[positions]
+
+
+def _fill(scores: np.ndarray, room: np.ndarray) -> np.ndarray:
+    """
+    Give each row its best-scoring column without exceeding ``room``
+
+    Rows that do not fit in their choice fall back to their next best
+    column, the highest-scoring rows keeping their places. Rows left
+    without a finite score get -1.
+    """
+    room = room.copy()
+    choice = np.full(len(scores), -1, dtype=np.int64)
+    pending = np.arange(len(scores))
+    scores = scores.copy()
+    while len(pending):
+        wanted = scores[pending].argmax(axis=1)
+        best = scores[pending, wanted]
+        placeable = np.isfinite(best)
+        pending, wanted, best = (
+            pending[placeable], wanted[placeable], best[placeable]
+        )
+        # Rank rows wanting the same column by score, best first
+        order = np.lexsort((-best, wanted))
+        wanted, ranked = wanted[order], pending[order]
+        first = np.searchsorted(wanted, np.arange(scores.shape[1]))
+        rank = np.arange(len(ranked)) - first[wanted]
+        fits = rank < room[wanted]
+
+        choice[ranked[fits]] = wanted[fits]
+        room -= np.bincount(wanted[fits], minlength=scores.shape[1])
+        pending = ranked[~fits]
+        scores[pending, wanted[~fits]] = -np.inf
+    return choice
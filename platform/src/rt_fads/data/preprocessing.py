@@ -1,27 +1,52 @@
+import os
 import numpy as np
 import pandas as pd
 import torch
-from typing import Dict, List, Tuple
-from sklearn.preprocessing import StandardScaler, LabelEncoder
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .interning import AccountInterner
+from .transform_plan import TransformPlan
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
 
 
 class FeatureProcessor:
-    """Feature processing and engineering for transaction data"""
-
-    def __init__(self, config: Dict):
+    """
+    Feature processing and engineering for transaction data
+
+    Columns in ``config['account_features']`` are encoded with an
+    ``AccountInterner`` rather than a label encoder, so accounts map to
+    the same node IDs as in a graph built with that interner. Accounts
+    first seen after fitting encode as -1.
+
+    Data larger than memory is processed in chunks: ``fit`` accumulates
+    the scaler statistics and category vocabularies over an iterator of
+    DataFrames, e.g. from ``read_parquet_chunks``, and
+    ``transform_to_file`` writes the features chunk by chunk into an
+    on-disk float32 matrix.
+    """
+
+    def __init__(
+        self,
+        config: Dict,
+        interner: Optional[AccountInterner] = None
+    ):
         self.config = config
+        self.interner = interner if interner is not None else (
+            AccountInterner()
+        )
         self.scalers = {}
         self.encoders = {}
         self.feature_names = []
+        self.num_rows: Optional[int] = None
 
     def fit_transform(
         self,
         data: pd.DataFrame
     ) -> Tuple[torch.Tensor, Dict]:
         """Fit and transform features"""
+        self.feature_names = []
+
         # Numerical features
         numerical_features = self._process_numerical_features(
             data,
@@ -55,7 +80,8 @@ class FeatureProcessor:
         return torch.FloatTensor(all_features), {
             'feature_names': self.feature_names,
             'scalers': self.scalers,
-            'encoders': self.encoders
+            'encoders': self.encoders,
+            'interner': self.interner
         }
 
     def transform(
@@ -63,6 +89,7 @@ class FeatureProcessor:
         data: pd.DataFrame
     ) -> torch.Tensor:
         """Transform features using fitted processors"""
+        self.feature_names = []
         numerical_features = self._process_numerical_features(
             data,
             fit=False
@@ -85,6 +112,152 @@ class FeatureProcessor:
 
         return torch.FloatTensor(all_features)
 
+    def fit(
+        self,
+        chunks: Iterable[pd.DataFrame]
+    ) -> 'FeatureProcessor':
+        """
+        Fit the processors one chunk at a time
+
+        The scaler's mean and variance are accumulated chunk by chunk with
+        ``StandardScaler.partial_fit`` and category vocabularies grow as
+        new values appear, so memory is bounded by the chunk size
+        and the vocabularies rather than the number of rows. The fitted
+        processors match those of ``fit_transform`` on the concatenated
+        chunks, up to floating-point rounding of the statistics.
+
+        Args:
+            chunks: DataFrames with the same columns, or one DataFrame
+        """
+        from sklearn.preprocessing import LabelEncoder, StandardScaler
+
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        numerical_cols = self.config['numerical_features']
+        categorical_cols = self.config['categorical_features']
+        account_cols = self.config.get('account_features', [])
+
+        scaler = StandardScaler()
+        vocabularies = {}
+        num_rows = 0
+        for chunk in chunks:
+            if len(chunk) == 0:
+                continue
+            scaler.partial_fit(chunk[numerical_cols].values)
+            for col in categorical_cols:
+                values = pd.unique(chunk[col].to_numpy())
+                if col in vocabularies:
+                    values = np.concatenate([vocabularies[col], values])
+                vocabularies[col] = np.unique(values)
+            for col in account_cols:
+                self.interner.encode(chunk[col])
+            num_rows += len(chunk)
+        if num_rows == 0:
+            raise ValueError("No data to fit")
+
+        self.scalers['numerical'] = scaler
+        for col in categorical_cols:
+            self.encoders[col] = LabelEncoder()
+            self.encoders[col].classes_ = vocabularies[col]
+        self.num_rows = num_rows
+        logger.info(f"Fitted feature processors on {num_rows} rows")
+        return self
+
+    def transform_to_file(
+        self,
+        chunks: Iterable[pd.DataFrame],
+        path: str,
+        num_rows: Optional[int] = None
+    ) -> np.memmap:
+        """
+        Transform chunks into a preallocated on-disk float32 matrix
+
+        The matrix is a ``.npy`` file, so ``np.load(path, mmap_mode='r')``
+        reopens it without reading it into memory. It is written next to
+        ``path`` and renamed into place once complete.
+
+        Args:
+            chunks: DataFrames to transform, in row order
+            path: Output file
+            num_rows: Total rows in ``chunks``, by default the number of
+                rows ``fit`` saw
+
+        Returns:
+            Read-only memory map of the features
+
+        Raises:
+            ValueError: If the chunks do not hold exactly ``num_rows`` rows
+        """
+        if isinstance(chunks, pd.DataFrame):
+            chunks = [chunks]
+        if num_rows is None:
+            num_rows = self.num_rows
+        if not num_rows:
+            raise ValueError("num_rows is required before fit")
+
+        temp_path = f"{path}.tmp.npy"
+        features = None
+        offset = 0
+        try:
+            for chunk in chunks:
+                if len(chunk) == 0:
+                    continue
+                block = self.transform(chunk).numpy()
+                if features is None:
+                    features = np.lib.format.open_memmap(
+                        temp_path,
+                        mode='w+',
+                        dtype=np.float32,
+                        shape=(num_rows, block.shape[1])
+                    )
+                if offset + len(block) > num_rows:
+                    raise ValueError(
+                        f"Chunks hold more than {num_rows} rows"
+                    )
+                features[offset:offset + len(block)] = block
+                offset += len(block)
+            if offset != num_rows:
+                raise ValueError(
+                    f"Chunks hold {offset} rows, not {num_rows}"
+                )
+            features.flush()
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        del features
+        os.replace(temp_path, path)
+        return np.load(path, mmap_mode='r')
+
+    def export_plan(self) -> TransformPlan:
+        """
+        Compile the fitted processors into a pandas-free transform
+
+        The plan reproduces ``transform`` bit for bit on dicts of raw
+        values, for serving single transactions.
+        """
+        if 'numerical' not in self.scalers:
+            raise ValueError("FeatureProcessor has not been fitted")
+        scaler = self.scalers['numerical']
+        return TransformPlan(
+            numerical_cols=self.config['numerical_features'],
+            mean=scaler.mean_,
+            scale=scaler.scale_,
+            vocabularies={
+                col: {
+                    value: code for code, value in enumerate(
+                        self.encoders[col].classes_.tolist()
+                    )
+                }
+                for col in self.config['categorical_features']
+            },
+            account_cols=self.config.get('account_features', []),
+            interner=self.interner,
+            timestamp_col=self.config['timestamp_col'],
+            scene_cols=self.config['scene_features']
+        )
+
     def _process_numerical_features(
         self,
         data: pd.DataFrame,
@@ -93,6 +266,8 @@ class FeatureProcessor:
         """Process numerical features"""
         numerical_cols = self.config['numerical_features']
         if fit:
+            from sklearn.preprocessing import StandardScaler
+
             self.scalers['numerical'] = StandardScaler()
             numerical_features = self.scalers['numerical'].fit_transform(
                 data[numerical_cols].values
@@ -113,6 +288,8 @@ class FeatureProcessor:
         """Process categorical features"""
         categorical_cols = self.config['categorical_features']
         categorical_features = []
+        if fit:
+            from sklearn.preprocessing import LabelEncoder
 
         for col in categorical_cols:
             if fit:
@@ -122,7 +299,12 @@ class FeatureProcessor:
                 encoded = self.encoders[col].transform(data[col])
             categorical_features.append(encoded.reshape(-1, 1))
 
-        self.feature_names.extend(categorical_cols)
+        account_cols = self.config.get('account_features', [])
+        for col in account_cols:
+            encoded = self.interner.encode(data[col], add=fit)
+            categorical_features.append(encoded.reshape(-1, 1))
+
+        self.feature_names.extend(categorical_cols + account_cols)
         return np.hstack(categorical_features)
 
     def _extract_temporal_features(
@@ -199,3 +381,26 @@ class FeatureProcessor:
         ])
 
         return np.hstack(graph_features)
+
+
+def read_parquet_chunks(
+    path: str,
+    columns: Optional[List[str]] = None
+) -> Iterator[pd.DataFrame]:
+    """
+    Read a Parquet file one row group at a time
+
+    Raises:
+        ImportError: If pyarrow is not installed
+    """
+    try:
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise ImportError("Reading Parquet requires pyarrow")
+
+    parquet_file = pq.ParquetFile(path)
+    for row_group in range(parquet_file.num_row_groups):
+        yield parquet_file.read_row_group(
+            row_group,
+            columns=columns
+        ).to_pandas()
@@ -0,0 +1,216 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+import pandas as pd
+import numpy as np
+
+
+@dataclass
+class TemporalNeighbors:
+    """
+    Neighbors of a batch of query nodes, oldest first
+
+    The neighbors of query ``i`` are ``neighbors[indptr[i]:indptr[i + 1]]``
+    with their edge ``timestamps`` and ``edge_ids``.
+    """
+
+    indptr: np.ndarray
+    neighbors: np.ndarray
+    timestamps: np.ndarray
+    edge_ids: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.indptr) - 1
+
+
+@dataclass
+class TemporalNeighborIndex:
+    """
+    Per-node neighbor lists sorted by time
+
+    Edges are grouped by node and sorted by timestamp within each group
+    in flat arrays, so node ``n`` owns ``indptr[n]:indptr[n + 1]``. A
+    query binary-searches the node's group for the edges strictly before
+    a time, then keeps the most recent ``k`` of them, so its cost is
+    logarithmic in the node's degree and never a scan of the graph.
+    ``edge_ids`` are columns of the ``edge_index`` the index was built
+    from and timestamps are integer nanoseconds.
+    """
+
+    indptr: np.ndarray
+    neighbors: np.ndarray
+    timestamps: np.ndarray
+    edge_ids: np.ndarray
+
+    DIRECTIONS = ('out', 'in', 'both')
+
+    @classmethod
+    def from_edges(
+        cls,
+        edge_index: np.ndarray,
+        timestamps,
+        num_nodes: int,
+        direction: str = 'out'
+    ) -> 'TemporalNeighborIndex':
+        """
+        Index edges by source (``out``), target (``in``) or both
+
+        Args:
+            edge_index: Array of shape [2, num_edges]
+            timestamps: Time of each edge, as timestamps or nanoseconds
+            num_nodes: Number of nodes
+            direction: Whose neighbors to index
+        """
+        if direction not in cls.DIRECTIONS:
+            raise ValueError(f"Unsupported direction: {direction}")
+        edge_index = np.asarray(edge_index, dtype=np.int64)
+        timestamps = nanoseconds(timestamps)
+        edge_ids = np.arange(edge_index.shape[1], dtype=np.int64)
+
+        nodes, neighbors = [], []
+        if direction in ('out', 'both'):
+            nodes.append(edge_index[0])
+            neighbors.append(edge_index[1])
+        if direction in ('in', 'both'):
+            nodes.append(edge_index[1])
+            neighbors.append(edge_index[0])
+        repeats = len(nodes)
+        nodes = np.concatenate(nodes)
+        neighbors = np.concatenate(neighbors)
+        timestamps = np.tile(timestamps, repeats)
+        edge_ids = np.tile(edge_ids, repeats)
+
+        order = np.lexsort((edge_ids, timestamps, nodes))
+        indptr = np.zeros(num_nodes + 1, dtype=np.int64)
+        np.cumsum(np.bincount(nodes, minlength=num_nodes), out=indptr[1:])
+        return cls(
+            indptr=indptr,
+            neighbors=neighbors[order],
+            timestamps=timestamps[order],
+            edge_ids=edge_ids[order]
+        )
+
+    @classmethod
+    def from_store(
+        cls,
+        store,
+        direction: str = 'out'
+    ) -> 'TemporalNeighborIndex':
+        """Index the live window of an ``IncrementalGraphStore``"""
+        return cls.from_edges(
+            store.edge_index.numpy(),
+            store.timestamps,
+            store.num_nodes,
+            direction
+        )
+
+    @property
+    def num_nodes(self) -> int:
+        return len(self.indptr) - 1
+
+    def window(
+        self,
+        node: int,
+        before=None,
+        k: Optional[int] = None
+    ) -> slice:
+        """
+        Positions of a node's ``k`` most recent edges before a time
+
+        Index ``neighbors``, ``timestamps`` or ``edge_ids`` with the
+        returned slice for views without copying.
+        """
+        start, stop = int(self.indptr[node]), int(self.indptr[node + 1])
+        if before is not None:
+            stop = start + int(np.searchsorted(
+                self.timestamps[start:stop],
+                nanoseconds(before),
+                side='left'
+            ))
+        if k is not None:
+            start = max(start, stop - k)
+        return slice(start, stop)
+
+    def query(
+        self,
+        nodes,
+        before=None,
+        k: Optional[int] = None
+    ) -> TemporalNeighbors:
+        """
+        Most recent ``k`` neighbors of many nodes before their times
+
+        Args:
+            nodes: Node IDs; a node may appear more than once
+            before: One time for all nodes or one per node; only edges
+                strictly before it are returned
+            k: Neighbors per node, all by default
+        """
+        nodes = np.asarray(nodes, dtype=np.int64)
+        starts, stops = self._bounds(nodes, before)
+        if k is not None:
+            starts = np.maximum(starts, stops - k)
+
+        counts = stops - starts
+        indptr = np.zeros(len(nodes) + 1, dtype=np.int64)
+        np.cumsum(counts, out=indptr[1:])
+        positions = np.arange(indptr[-1], dtype=np.int64) + np.repeat(
+            starts - indptr[:-1],
+            counts
+        )
+        return TemporalNeighbors(
+            indptr=indptr,
+            neighbors=self.neighbors[positions],
+            timestamps=self.timestamps[positions],
+            edge_ids=self.edge_ids[positions]
+        )
+
+    def _bounds(
+        self,
+        nodes: np.ndarray,
+        before
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """Group start and end of the edges before each node's time"""
+        starts = self.indptr[nodes]
+        stops = self.indptr[nodes + 1]
+        if before is None:
+            return starts, stops
+
+        # Binary search all groups in lockstep for the first edge at or
+        # after the bound
+        before = np.broadcast_to(nanoseconds(before), nodes.shape)
+        low, high = starts.copy(), stops.copy()
+        last = max(len(self.timestamps) - 1, 0)
+        active = low < high
+        while active.any():
+            middle = (low + high) // 2
+            earlier = self.timestamps[np.minimum(middle, last)] < before
+            low = np.where(active & earlier, middle + 1, low)
+            high = np.where(active & ~earlier, middle, high)
+            active = low < high
+        return starts, low
+
+
+def nanoseconds(times) -> np.ndarray:
+    """Convert timestamps to integer nanoseconds"""
+    times = np.asarray(times)
+    if times.dtype.kind in 'iu':
+        return times.astype(np.int64)
+    if times.dtype.kind != 'M':
+        times = parse_timestamps(times.ravel()).to_numpy(
+            'datetime64[ns]'
+        ).reshape(times.shape)
+    return times.astype('datetime64[ns]').view(np.int64)
+
+
+def parse_timestamps(times) -> pd.DatetimeIndex:
+    """
+    Parse a column of timestamps
+
+    A single vectorized parse infers one format from the first value and
+    rejects columns mixing formats, so those fall back to parsing each
+    value on its own.
+    """
+    try:
+        return pd.DatetimeIndex(pd.to_datetime(times))
+    except (TypeError, ValueError):
+        return pd.DatetimeIndex([pd.Timestamp(value) for value in times])
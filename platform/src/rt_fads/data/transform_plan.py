@@ -0,0 +1,184 @@
+import math
+from datetime import date, datetime, timedelta
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple, Union
+import numpy as np
+from .interning import AccountInterner
+
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_ORDINAL = _EPOCH.toordinal()
+_NANOSECONDS = 10 ** 9
+_GRAPH_COLUMNS = (
+    'node_in_degree', 'node_out_degree', 'clustering_coef', 'pagerank'
+)
+
+
+class TransformPlan:
+    """
+    Compiled ``FeatureProcessor.transform`` for single transactions
+
+    Built by ``FeatureProcessor.export_plan``. The plan holds the fitted
+    scaler means and scales and the category vocabularies as dicts, and
+    computes features for a dict or a small batch of dicts in plain
+    Python. It produces exactly the float32 values of ``transform`` on a
+    DataFrame of the same rows, including which optional columns
+    (``prev_timestamp``, scene and graph columns) appear.
+
+    Timestamps may be ISO 8601 strings, datetimes or integer
+    nanoseconds. Account IDs already interned are cached, as their node
+    IDs never change; unknown accounts are looked up again every time
+    since the shared interner may learn them later.
+    """
+
+    def __init__(
+        self,
+        numerical_cols: List[str],
+        mean: np.ndarray,
+        scale: np.ndarray,
+        vocabularies: Dict[str, Dict],
+        account_cols: List[str],
+        interner: AccountInterner,
+        timestamp_col: str,
+        scene_cols: List[str],
+        account_cache_size: int = 100000
+    ):
+        self.numerical_cols = list(numerical_cols)
+        self.mean = np.asarray(mean, dtype=np.float64)
+        self.scale = np.asarray(scale, dtype=np.float64)
+        self.vocabularies = vocabularies
+        self.account_cols = list(account_cols)
+        self.interner = interner
+        self.timestamp_col = timestamp_col
+        self.scene_cols = list(scene_cols)
+        self.account_cache_size = account_cache_size
+
+        self._scaling = list(zip(
+            self.numerical_cols,
+            self.mean.tolist(),
+            self.scale.tolist()
+        ))
+        self._account_ids: Dict[str, int] = {}
+
+    def transform(
+        self,
+        rows: Union[Mapping, Sequence[Mapping]]
+    ) -> np.ndarray:
+        """
+        Feature vector of one row, or feature matrix of several
+
+        Raises:
+            ValueError: If a categorical value was not seen in fitting
+        """
+        single = isinstance(rows, Mapping)
+        if single:
+            rows = [rows]
+        present = set().union(*rows)
+        has_time_diff = 'prev_timestamp' in present
+        scene_cols = [col for col in self.scene_cols if col in present]
+        graph_cols = [col for col in _GRAPH_COLUMNS if col in present]
+        account_ids = self._lookup_accounts(rows)
+
+        features = []
+        for i, row in enumerate(rows):
+            values = [
+                (_to_float(row.get(col)) - mean) / scale
+                for col, mean, scale in self._scaling
+            ]
+            for col, vocabulary in self.vocabularies.items():
+                code = vocabulary.get(row.get(col))
+                if code is None:
+                    raise ValueError(
+                        f"Unseen value {row.get(col)!r} in column {col}"
+                    )
+                values.append(code)
+            values.extend(account_ids[i])
+
+            wall, instant = _nanoseconds(row.get(self.timestamp_col))
+            values.extend(_calendar(wall))
+            if has_time_diff:
+                _, previous = _nanoseconds(row.get('prev_timestamp'))
+                values.append(
+                    math.nan if instant is None or previous is None
+                    else (instant - previous) / _NANOSECONDS / 3600
+                )
+            values.extend(_to_float(row.get(col)) for col in scene_cols)
+            values.extend(_to_float(row.get(col)) for col in graph_cols)
+            features.append(values)
+
+        features = np.array(features, dtype=np.float32)
+        return features[0] if single else features
+
+    def _lookup_accounts(self, rows: Sequence[Mapping]) -> List[List[int]]:
+        """Node ID of every account column of every row"""
+        if not self.account_cols:
+            return [[] for _ in rows]
+        accounts = [
+            row.get(col) for row in rows for col in self.account_cols
+        ]
+        if None in accounts:
+            raise ValueError("Account identifiers must not be missing")
+        accounts = [str(account) for account in accounts]
+        missing = [a for a in accounts if a not in self._account_ids]
+        found = {}
+        if missing:
+            ids = self.interner.lookup(missing).tolist()
+            found = dict(zip(missing, ids))
+            if len(self._account_ids) >= self.account_cache_size:
+                self._account_ids.clear()
+            self._account_ids.update(
+                (account, code) for account, code in found.items()
+                if code >= 0
+            )
+
+        ids = [self._account_ids.get(a, found.get(a)) for a in accounts]
+        width = len(self.account_cols)
+        return [ids[i:i + width] for i in range(0, len(ids), width)]
+
+
+def _to_float(value) -> float:
+    return math.nan if value is None else float(value)
+
+
+def _nanoseconds(value) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Wall-clock and absolute time of a timestamp in nanoseconds
+
+    They differ for timezone-aware timestamps, whose calendar fields
+    follow local time while differences follow absolute time.
+    """
+    if value is None:
+        return None, None
+    if isinstance(value, (int, np.integer)):
+        return int(value), int(value)
+    if isinstance(value, np.datetime64):
+        value = int(value.astype('datetime64[ns]').astype(np.int64))
+        return value, value
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            import pandas as pd
+
+            value = pd.Timestamp(value)
+
+    nanoseconds = getattr(value, 'nanosecond', 0)
+    wall = _datetime_nanoseconds(value.replace(tzinfo=None), nanoseconds)
+    offset = value.utcoffset()
+    if offset is None:
+        return wall, wall
+    return wall, wall - (offset // timedelta(microseconds=1)) * 1000
+
+
+def _datetime_nanoseconds(value: datetime, nanoseconds: int) -> int:
+    microseconds = (value - _EPOCH) // timedelta(microseconds=1)
+    return microseconds * 1000 + nanoseconds
+
+
+def _calendar(nanoseconds: Optional[int]) -> Tuple:
+    """Hour, day of week, day and month of a timestamp"""
+    if nanoseconds is None:
+        return (math.nan,) * 4
+    seconds = nanoseconds // _NANOSECONDS
+    days = seconds // 86400
+    day = date.fromordinal(_EPOCH_ORDINAL + days)
+    # 1970-01-01 was a Thursday
+    return (seconds % 86400 // 3600, (days + 3) % 7, day.day, day.month)
@@ -1,6 +1,9 @@
 import numpy as np
 import pandas as pd
-from secretflow.data import SecureDataFrame
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from secretflow.data import SecureDataFrame
 
 
 class FeatureEngineer:
@@ -11,7 +14,7 @@ class FeatureEngineer:
         self.graph_features = GraphFeatureExtractor()
         self.scene_features = SceneFeatureExtractor()
 
-    def extract_features(self, data: SecureDataFrame):
+    def extract_features(self, data: 'SecureDataFrame'):
         """Extract features with privacy protection"""
         features = {}
 
@@ -36,7 +39,7 @@ class FeatureEngineer:
 class TemporalFeatureExtractor:
     """Extract temporal features"""
 
-    def extract(self, data: SecureDataFrame):
+    def extract(self, data: 'SecureDataFrame'):
         features = {
             'time_features': self._extract_time_features(data),
             'sequence_features': self._extract_sequence_features(data),
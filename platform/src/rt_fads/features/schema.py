@@ -0,0 +1,172 @@
+import json
+import zlib
+from operator import itemgetter
+from typing import (
+    Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+)
+import numpy as np
+import torch
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+BLOCKS = ('features', 'scene_info', 'temporal_info')
+
+
+class FeatureSchema:
+    """
+    Fixed column layout for model inputs
+
+    Maps every feature name of the ``features``, ``scene_info`` and
+    ``temporal_info`` blocks to a fixed offset in one flat float32 row, so
+    inputs are vectorized by name rather than by dict ordering. The schema
+    is stored in model checkpoints under the ``feature_schema`` key.
+    """
+
+    def __init__(
+        self,
+        features: Sequence[str],
+        scene_info: Sequence[str],
+        temporal_info: Sequence[str]
+    ):
+        self.columns: Dict[str, List[str]] = {
+            'features': list(features),
+            'scene_info': list(scene_info),
+            'temporal_info': list(temporal_info)
+        }
+
+        self.slices: Dict[str, slice] = {}
+        self.offsets: Dict[str, Dict[str, int]] = {}
+        self._getters = {}
+        start = 0
+        for block in BLOCKS:
+            names = self.columns[block]
+            if len(set(names)) != len(names):
+                raise ValueError(f"Duplicate column names in '{block}'")
+            self.slices[block] = slice(start, start + len(names))
+            self.offsets[block] = {
+                name: start + i for i, name in enumerate(names)
+            }
+            # itemgetter returns a scalar for one key, a tuple otherwise
+            if len(names) > 1:
+                self._getters[block] = itemgetter(*names)
+            else:
+                self._getters[block] = lambda values, names=names: tuple(
+                    values[name] for name in names
+                )
+            start += len(names)
+
+        self.width = start
+        self.fingerprint = zlib.crc32(
+            json.dumps(self.to_dict(), sort_keys=True).encode('utf-8')
+        )
+
+    @classmethod
+    def from_dict(cls, config: Mapping[str, Sequence[str]]) -> 'FeatureSchema':
+        """Create schema from its serialized form"""
+        return cls(*(config[block] for block in BLOCKS))
+
+    def to_dict(self) -> Dict[str, List[str]]:
+        """Serialize schema for storage in a checkpoint"""
+        return {block: list(names) for block, names in self.columns.items()}
+
+    @classmethod
+    def from_checkpoint(
+        cls,
+        checkpoint: Union[str, Dict]
+    ) -> Optional['FeatureSchema']:
+        """
+        Load schema stored in a model checkpoint, if any
+
+        Args:
+            checkpoint: Checkpoint path, or a checkpoint already loaded
+        """
+        if isinstance(checkpoint, str):
+            checkpoint = torch.load(
+                checkpoint,
+                map_location='cpu',
+                weights_only=True
+            )
+        config = (
+            checkpoint.get('feature_schema')
+            if isinstance(checkpoint, dict) else None
+        )
+        return cls.from_dict(config) if config else None
+
+    @classmethod
+    def from_blocks(
+        cls,
+        blocks: Mapping[str, Mapping[str, float]]
+    ) -> 'FeatureSchema':
+        """Infer schema from the key order of one set of input blocks"""
+        return cls(*(list(blocks[block].keys()) for block in BLOCKS))
+
+    def check_columns(self, block: str, names: Iterable[str]):
+        """
+        Validate that ``names`` matches the block's columns exactly
+
+        Raises:
+            ValueError: Listing missing and unknown columns
+        """
+        names = set(names)
+        expected = set(self.columns[block])
+        if names == expected:
+            return
+
+        missing = sorted(expected - names)
+        unknown = sorted(names - expected)
+        raise ValueError(
+            f"Invalid '{block}' columns: "
+            f"missing {missing}, unknown {unknown}"
+        )
+
+    def vectorize(
+        self,
+        blocks: Mapping[str, Mapping[str, float]],
+        out: Optional[np.ndarray] = None
+    ) -> np.ndarray:
+        """
+        Fill a float32 row from named input blocks
+
+        Args:
+            blocks: Mapping of block name to ``{feature_name: value}``
+            out: Optional preallocated buffer of shape [width]
+
+        Returns:
+            The filled row
+
+        Raises:
+            ValueError: If a block has missing or unknown keys
+        """
+        if out is None:
+            out = np.empty(self.width, dtype=np.float32)
+
+        for block in BLOCKS:
+            values = blocks[block]
+            names = self.columns[block]
+            if len(values) != len(names):
+                self.check_columns(block, values.keys())
+            try:
+                out[self.slices[block]] = self._getters[block](values)
+            except KeyError:
+                self.check_columns(block, values.keys())
+                raise
+
+        return out
+
+    def vectorize_batch(
+        self,
+        batch: Sequence[Mapping[str, Mapping[str, float]]]
+    ) -> np.ndarray:
+        """Fill a single [batch_size, width] float32 matrix"""
+        out = np.empty((len(batch), self.width), dtype=np.float32)
+        for i, blocks in enumerate(batch):
+            self.vectorize(blocks, out=out[i])
+        return out
+
+    def split(
+        self,
+        rows: torch.Tensor
+    ) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+        """Split [batch_size, width] rows into per-block views"""
+        return tuple(rows[:, self.slices[block]] for block in BLOCKS)
@@ -1,7 +1,6 @@
 import torch
 import numpy as np
 from typing import Dict, List, Tuple
-from captum.attr import IntegratedGradients
 from ..utils.logger import setup_logger
 
 logger = setup_logger(__name__)
@@ -11,6 +10,8 @@ class MTHGNNExplainer:
     """Model interpretability component"""
 
     def __init__(self, model: torch.nn.Module):
+        from captum.attr import IntegratedGradients
+
         self.model = model
         self.integrated_gradients = IntegratedGradients(self.model)
 
@@ -1,12 +1,13 @@
 import time
 from typing import Dict, List
-import prometheus_client as prom
-from prometheus_client import Counter, Histogram, Gauge
 import threading
 import psutil
 import torch
+from ..utils.lazy import lazy_import
 from ..utils.logger import setup_logger
 
+prom = lazy_import('prometheus_client')
+
 logger = setup_logger(__name__)
 
 
@@ -15,45 +16,145 @@ class MetricsCollector:
 
     def __init__(self):
         # Model metrics
-        self.prediction_counter = Counter(
+        self.prediction_counter = prom.Counter(
             'rt_fads_predictions_total',
             'Total number of predictions made'
         )
-        self.prediction_latency = Histogram(
+        self.prediction_latency = prom.Histogram(
             'rt_fads_prediction_latency_seconds',
             'Prediction latency in seconds',
             buckets=(0.005, 0.01, 0.025, 0.05, 0.075,
                      0.1, 0.25, 0.5, 0.75, 1.0)
         )
-        self.fraud_detected = Counter(
+        self.fraud_detected = prom.Counter(
             'rt_fads_fraud_detected_total',
             'Total number of frauds detected'
         )
 
         # System metrics
-        self.gpu_memory_used = Gauge(
+        self.gpu_memory_used = prom.Gauge(
             'rt_fads_gpu_memory_used_bytes',
             'GPU memory used in bytes'
         )
-        self.cpu_usage = Gauge(
+        self.cpu_usage = prom.Gauge(
             'rt_fads_cpu_usage_percent',
             'CPU usage percentage'
         )
-        self.memory_usage = Gauge(
+        self.memory_usage = prom.Gauge(
             'rt_fads_memory_usage_bytes',
             'Memory usage in bytes'
         )
 
         # Model performance metrics
-        self.model_accuracy = Gauge(
+        self.model_accuracy = prom.Gauge(
             'rt_fads_model_accuracy',
             'Model accuracy score'
         )
-        self.false_positives = Counter(
+        self.false_positives = prom.Counter(
             'rt_fads_false_positives_total',
             'Total number of false positives'
         )
 
+        # Model version metrics
+        self.model_version_info = prom.Gauge(
+            'rt_fads_model_version_info',
+            'Model version currently served (1) or replaced (0)',
+            ['model_version']
+        )
+        self.model_version_predictions = prom.Counter(
+            'rt_fads_model_version_predictions_total',
+            'Total number of predictions per model version',
+            ['model_version']
+        )
+
+        # Shadow scoring metrics
+        self.shadow_predictions = prom.Counter(
+            'rt_fads_shadow_predictions_total',
+            'Total number of shadow predictions per candidate version',
+            ['model_version']
+        )
+        self.shadow_agreement = prom.Counter(
+            'rt_fads_shadow_agreement_total',
+            'Shadow fraud decisions that agree or disagree with the primary',
+            ['model_version', 'outcome']
+        )
+        self.shadow_score_delta = prom.Histogram(
+            'rt_fads_shadow_score_delta',
+            'Absolute fraud probability difference between models',
+            buckets=(0.001, 0.01, 0.05, 0.1, 0.2, 0.3, 0.5, 1.0)
+        )
+        self.shadow_latency_delta = prom.Histogram(
+            'rt_fads_shadow_latency_delta_seconds',
+            'Shadow scoring time minus primary scoring time',
+            buckets=(-0.1, -0.025, -0.01, -0.005, -0.001, 0.0,
+                     0.001, 0.005, 0.01, 0.025, 0.1)
+        )
+        self.shadow_dropped = prom.Counter(
+            'rt_fads_shadow_dropped_total',
+            'Shadow requests dropped because the shadow queue was full'
+        )
+
+        # Admission control metrics
+        self.admission_in_flight = prom.Gauge(
+            'rt_fads_admission_in_flight',
+            'Number of admitted transactions not yet answered'
+        )
+        self.requests_shed = prom.Counter(
+            'rt_fads_requests_shed_total',
+            'Requests rejected by admission control',
+            ['reason']
+        )
+        self.requests_degraded = prom.Counter(
+            'rt_fads_requests_degraded_total',
+            'Requests served without explanation to meet their deadline'
+        )
+        self.queue_delay = prom.Histogram(
+            'rt_fads_admission_queue_delay_seconds',
+            'Time an admitted request waits for the micro-batcher and '
+            'inference executor before it is scored',
+            buckets=(0.001, 0.002, 0.005, 0.01, 0.025,
+                     0.05, 0.1, 0.25, 0.5, 1.0)
+        )
+
+        # Cascade scoring metrics
+        self.cascade_decisions = prom.Counter(
+            'rt_fads_cascade_decisions_total',
+            'Predictions decided per cascade stage',
+            ['stage']
+        )
+
+        # Prediction cache metrics
+        self.cache_lookups = prom.Counter(
+            'rt_fads_cache_lookups_total',
+            'Prediction cache lookups by result (hit, miss, coalesced)',
+            ['result']
+        )
+        self.cache_entries = prom.Gauge(
+            'rt_fads_cache_entries',
+            'Number of cached prediction responses'
+        )
+        self.cache_memory = prom.Gauge(
+            'rt_fads_cache_memory_bytes',
+            'Approximate memory held by cached prediction responses'
+        )
+
+        # Micro-batching metrics
+        self.batch_queue_depth = prom.Gauge(
+            'rt_fads_batch_queue_depth',
+            'Number of requests waiting to be batched'
+        )
+        self.batch_size = prom.Histogram(
+            'rt_fads_batch_size',
+            'Number of requests per inference batch',
+            buckets=(1, 2, 4, 8, 16, 32, 64, 128, 256)
+        )
+        self.batch_wait_time = prom.Histogram(
+            'rt_fads_batch_wait_seconds',
+            'Time a request waits in the queue before its batch runs',
+            buckets=(0.0005, 0.001, 0.002, 0.005, 0.01,
+                     0.025, 0.05, 0.1)
+        )
+
         # Start background metrics collection
         self._start_background_collection()
 
@@ -86,10 +187,13 @@ class MetricsCollector:
         self,
         start_time: float,
         is_fraud: bool,
-        latency: float = None
+        latency: float = None,
+        model_version: str = None
     ):
         """Record prediction metrics"""
         self.prediction_counter.inc()
+        if model_version is not None:
+            self.model_version_predictions.labels(model_version).inc()
 
         if latency is None:
             latency = time.time() - start_time
@@ -98,6 +202,95 @@ class MetricsCollector:
         if is_fraud:
             self.fraud_detected.inc()
 
+    def record_batch_predictions(
+        self,
+        count: int,
+        fraud_count: int,
+        latency: float,
+        model_version: str = None
+    ):
+        """Record metrics for a bulk prediction request"""
+        self.prediction_counter.inc(count)
+        if model_version is not None:
+            self.model_version_predictions.labels(model_version).inc(count)
+        self.prediction_latency.observe(latency)
+        if fraud_count:
+            self.fraud_detected.inc(fraud_count)
+
+    def set_model_version(
+        self,
+        version: str,
+        previous_version: str = None
+    ):
+        """Mark the model version currently being served"""
+        if previous_version is not None and previous_version != version:
+            self.model_version_info.labels(previous_version).set(0)
+        self.model_version_info.labels(version).set(1)
+
+    def record_shadow(
+        self,
+        primary_prob: float,
+        shadow_prob: float,
+        latency_delta: float,
+        model_version: str
+    ):
+        """Record how a shadow prediction compares with the primary one"""
+        self.shadow_predictions.labels(model_version).inc()
+        agreed = (primary_prob > 0.5) == (shadow_prob > 0.5)
+        self.shadow_agreement.labels(
+            model_version,
+            'agree' if agreed else 'disagree'
+        ).inc()
+        self.shadow_score_delta.observe(abs(primary_prob - shadow_prob))
+        self.shadow_latency_delta.observe(latency_delta)
+
+    def record_shadow_dropped(self):
+        """Record a shadow request dropped under saturation"""
+        self.shadow_dropped.inc()
+
+    def record_admission(self, admission: str, reason: str = None):
+        """Record an admission control decision"""
+        if admission == 'reject':
+            self.requests_shed.labels(reason).inc()
+        elif admission == 'degrade':
+            self.requests_degraded.inc()
+
+    def record_queue_delay(self, seconds: float):
+        """Record how long an admitted request waited to be scored"""
+        self.queue_delay.observe(seconds)
+
+    def set_in_flight(self, in_flight: int):
+        """Update the number of admitted in-flight requests"""
+        self.admission_in_flight.set(in_flight)
+
+    def record_cascade(self, first_stage_count: int, full_model_count: int):
+        """Record how many predictions each cascade stage decided"""
+        if first_stage_count:
+            self.cascade_decisions.labels('first_stage').inc(first_stage_count)
+        if full_model_count:
+            self.cascade_decisions.labels('full_model').inc(full_model_count)
+
+    def record_cache_lookup(self, result: str):
+        """Record a prediction cache lookup result"""
+        self.cache_lookups.labels(result).inc()
+
+    def set_cache_usage(self, entries: int, memory_bytes: int):
+        """Update prediction cache size metrics"""
+        self.cache_entries.set(entries)
+        self.cache_memory.set(memory_bytes)
+
+    def record_batch(
+        self,
+        batch_size: int,
+        wait_times: List[float],
+        queue_depth: int
+    ):
+        """Record micro-batching metrics"""
+        self.batch_size.observe(batch_size)
+        for wait_time in wait_times:
+            self.batch_wait_time.observe(wait_time)
+        self.batch_queue_depth.set(queue_depth)
+
     def update_model_metrics(
         self,
         metrics: Dict[str, float]
@@ -117,5 +310,8 @@ class MetricsCollector:
             'gpu_memory_used': float(self.gpu_memory_used._value.get()),
             'cpu_usage': float(self.cpu_usage._value.get()),
             'memory_usage': float(self.memory_usage._value.get()),
-            'model_accuracy': float(self.model_accuracy._value.get())
+            'model_accuracy': float(self.model_accuracy._value.get()),
+            'batch_queue_depth': float(self.batch_queue_depth._value.get()),
+            'cache_entries': float(self.cache_entries._value.get()),
+            'cache_memory_bytes': float(self.cache_memory._value.get())
         }
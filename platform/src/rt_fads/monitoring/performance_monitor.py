@@ -5,9 +5,11 @@ import threading
 from typing import Dict, List
 from collections import deque
 import numpy as np
-from prometheus_client import Gauge, Histogram, Counter
+from ..utils.lazy import lazy_import
 from ..utils.logger import setup_logger
 
+prom = lazy_import('prometheus_client')
+
 logger = setup_logger(__name__)
 
 
@@ -30,25 +32,25 @@ class PerformanceMonitor:
 
         # Prometheus metrics
         self.prometheus_metrics = {
-            'cpu_usage': Gauge(
+            'cpu_usage': prom.Gauge(
                 'rt_fads_cpu_usage_percent',
                 'CPU usage percentage'
             ),
-            'memory_usage': Gauge(
+            'memory_usage': prom.Gauge(
                 'rt_fads_memory_usage_bytes',
                 'Memory usage in bytes'
             ),
-            'gpu_usage': Gauge(
+            'gpu_usage': prom.Gauge(
                 'rt_fads_gpu_usage_percent',
                 'GPU usage percentage'
             ),
-            'inference_time': Histogram(
+            'inference_time': prom.Histogram(
                 'rt_fads_inference_time_seconds',
                 'Model inference time in seconds',
                 buckets=(0.001, 0.005, 0.01, 0.025,
                          0.05, 0.075, 0.1, 0.25, 0.5)
             ),
-            'requests_per_second': Gauge(
+            'requests_per_second': prom.Gauge(
                 'rt_fads_requests_per_second',
                 'Number of requests processed per second'
             )
@@ -0,0 +1,160 @@
+import math
+from dataclasses import dataclass
+from enum import Enum
+from typing import Dict, Optional
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+DEADLINE_HEADER = 'X-Request-Deadline-Ms'
+
+
+class Admission(str, Enum):
+    """Outcome of an admission decision"""
+    ACCEPT = 'accept'
+    DEGRADE = 'degrade'
+    REJECT = 'reject'
+
+
+@dataclass
+class AdmissionDecision:
+    """Admission outcome with the delay estimate it was based on"""
+    admission: Admission
+    estimated_delay: float
+    reason: Optional[str] = None
+
+    @property
+    def retry_after(self) -> int:
+        """Seconds a rejected client should wait before retrying"""
+        return max(1, math.ceil(self.estimated_delay))
+
+
+class AdmissionController:
+    """
+    Deadline-aware admission control for the prediction API
+
+    Keeps the number of in-flight rows and exponentially weighted
+    averages of the scoring (one batch forward pass) and explanation
+    service times. A single prediction is one row and a columnar batch
+    counts all of its rows. A new request is expected to wait for
+    ``in_flight / concurrency`` scoring rounds before its own
+    ``ceil(rows / concurrency)``, where ``concurrency`` is how many rows
+    the executor serves at once (workers times batch size). Given the
+    client's deadline the request is accepted, degraded to scoring without
+    explanation or shadow work, or rejected straight away. Requests that
+    would take the in-flight rows above ``max_in_flight`` are always
+    rejected, unless nothing else is in flight, so a batch larger than
+    the whole budget can still run on an idle server.
+    """
+
+    def __init__(
+        self,
+        max_in_flight: int = 512,
+        concurrency: int = 64,
+        default_deadline_ms: Optional[float] = None,
+        smoothing: float = 0.1,
+        metrics_collector=None
+    ):
+        self.max_in_flight = max_in_flight
+        self.concurrency = max(1, concurrency)
+        self.default_deadline_ms = default_deadline_ms
+        self.smoothing = smoothing
+        self.metrics_collector = metrics_collector
+
+        self.in_flight = 0
+        self._score_time = 0.0
+        self._explain_time = 0.0
+
+    @classmethod
+    def from_config(cls, config: Dict, metrics_collector=None):
+        """Create an admission controller from the ``serving`` config"""
+        concurrency = config.get(
+            'admission_concurrency',
+            config.get('inference_workers', 2)
+            * config.get('max_batch_size', 32)
+        )
+        return cls(
+            max_in_flight=config.get('admission_max_in_flight', 512),
+            concurrency=concurrency,
+            default_deadline_ms=config.get('default_deadline_ms'),
+            smoothing=config.get('admission_smoothing', 0.1),
+            metrics_collector=metrics_collector
+        )
+
+    def estimated_delay(self, rows: int = 1) -> float:
+        """Expected seconds until a new request of ``rows`` is scored"""
+        rounds = math.ceil(rows / self.concurrency)
+        return self._score_time * (
+            rounds + self.in_flight / self.concurrency
+        )
+
+    def admit(
+        self,
+        deadline_ms: Optional[float] = None,
+        rows: int = 1
+    ) -> AdmissionDecision:
+        """
+        Decide whether to serve a new request
+
+        Args:
+            deadline_ms: Remaining client budget in milliseconds, falling
+                back to ``default_deadline_ms``
+            rows: Transactions the request scores
+
+        Returns:
+            The decision; accepted and degraded requests count as in
+            flight until ``release`` is called with the same ``rows``
+        """
+        if deadline_ms is None:
+            deadline_ms = self.default_deadline_ms
+        delay = self.estimated_delay(rows)
+
+        if self.in_flight and self.in_flight + rows > self.max_in_flight:
+            decision = AdmissionDecision(Admission.REJECT, delay, 'overload')
+        elif deadline_ms is None:
+            decision = AdmissionDecision(Admission.ACCEPT, delay)
+        else:
+            deadline = deadline_ms / 1000.0
+            if delay + self._explain_time <= deadline:
+                decision = AdmissionDecision(Admission.ACCEPT, delay)
+            elif delay <= deadline:
+                decision = AdmissionDecision(
+                    Admission.DEGRADE,
+                    delay,
+                    'deadline'
+                )
+            else:
+                decision = AdmissionDecision(
+                    Admission.REJECT,
+                    delay,
+                    'deadline'
+                )
+
+        if decision.admission != Admission.REJECT:
+            self.in_flight += rows
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_admission(
+                decision.admission.value,
+                decision.reason
+            )
+            self.metrics_collector.set_in_flight(self.in_flight)
+        return decision
+
+    def observe_scoring(self, seconds: float):
+        """Update the average time of one scoring round (a batch pass)"""
+        self._score_time += self.smoothing * (seconds - self._score_time)
+
+    def observe_explanation(self, seconds: float):
+        """Update the average time of an inline explanation"""
+        self._explain_time += self.smoothing * (seconds - self._explain_time)
+
+    def observe_queueing(self, seconds: float):
+        """Record how long an admitted request waited to be scored"""
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_queue_delay(seconds)
+
+    def release(self, rows: int = 1):
+        """Mark an admitted request of ``rows`` as finished"""
+        self.in_flight -= rows
+        if self.metrics_collector is not None:
+            self.metrics_collector.set_in_flight(self.in_flight)
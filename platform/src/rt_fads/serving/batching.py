@@ -0,0 +1,191 @@
+import asyncio
+import time
+from typing import Any, Callable, List, Optional, Tuple
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class MicroBatcher:
+    """Adaptive micro-batching of concurrent inference requests
+
+    Requests submitted from concurrent handlers are queued and grouped
+    into batches of at most ``max_batch_size``. A batch is dispatched as
+    soon as it is full or once ``max_wait_ms`` has elapsed since its first
+    request arrived. The wait window adapts to load: while batches keep
+    coalescing more than one request it stays at the full ``max_wait_ms``,
+    and when they stay at size one it shrinks towards
+    ``min_wait_fraction`` of it, so an idle worker does not pay the full
+    wait for batches that would not grow anyway.
+
+    When an ``InferenceExecutor`` is given, batches run on its worker pool
+    and at most ``executor.num_workers`` batches are in flight; requests
+    arriving meanwhile accumulate into the next batch.
+    """
+
+    def __init__(
+        self,
+        infer_fn: Callable[[List[Any]], List[Any]],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0,
+        metrics_collector=None,
+        smoothing: float = 0.1,
+        executor=None,
+        min_wait_fraction: float = 0.25
+    ):
+        if max_batch_size < 1:
+            raise ValueError("max_batch_size must be at least 1")
+        if not 0.0 <= min_wait_fraction <= 1.0:
+            raise ValueError("min_wait_fraction must be between 0 and 1")
+
+        self.infer_fn = infer_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self.metrics_collector = metrics_collector
+        self.smoothing = smoothing
+        self.executor = executor
+        self.min_wait_fraction = min_wait_fraction
+
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+        # Start as if batches were coalescing so the first requests get
+        # the full window
+        self._avg_fill = 2.0
+        self._batch_slots: Optional[asyncio.Semaphore] = None
+        self._batch_tasks = set()
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting to be batched"""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    def start(self):
+        """Start the batching loop on the running event loop"""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._batch_slots = asyncio.Semaphore(
+            self.executor.num_workers if self.executor is not None else 1
+        )
+        self._task = asyncio.get_running_loop().create_task(self._run())
+
+    async def stop(self):
+        """Stop the batching loop and fail any queued requests"""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+        if self._batch_tasks:
+            await asyncio.gather(*self._batch_tasks, return_exceptions=True)
+
+        while not self._queue.empty():
+            _, future, _ = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(RuntimeError("Batcher stopped"))
+
+    async def submit(self, item: Any) -> Any:
+        """Queue an item for batched inference and wait for its result"""
+        if self._task is None:
+            raise RuntimeError("Batcher is not running")
+
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((item, future, time.perf_counter()))
+        return await future
+
+    def _wait_window(self) -> float:
+        """
+        Current maximum wait, shrunk only while batches stay at size one
+
+        Any coalescing (an average fill of two or more) keeps the full
+        window, so a window that has shrunk grows back as soon as
+        concurrent requests start sharing batches again.
+        """
+        coalescing = min(1.0, max(0.0, self._avg_fill - 1.0))
+        fraction = self.min_wait_fraction
+        return self.max_wait * (fraction + (1.0 - fraction) * coalescing)
+
+    async def _collect(self) -> List[Tuple[Any, asyncio.Future, float]]:
+        """Collect the next batch from the queue"""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._wait_window()
+
+        while len(batch) < self.max_batch_size:
+            # Drain requests that are already queued without waiting
+            if not self._queue.empty():
+                batch.append(self._queue.get_nowait())
+                continue
+
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(
+                    await asyncio.wait_for(self._queue.get(), timeout)
+                )
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self):
+        """Main batching loop"""
+        while True:
+            # Wait for a free batch slot so requests keep accumulating
+            await self._batch_slots.acquire()
+            try:
+                batch = await self._collect()
+            except BaseException:
+                self._batch_slots.release()
+                raise
+            self._avg_fill += self.smoothing * (len(batch) - self._avg_fill)
+
+            task = asyncio.get_running_loop().create_task(
+                self._dispatch(batch)
+            )
+            self._batch_tasks.add(task)
+            task.add_done_callback(self._batch_tasks.discard)
+
+    async def _dispatch(self, batch: List[Tuple[Any, asyncio.Future, float]]):
+        """Run a single forward pass for a batch and resolve its futures"""
+        try:
+            await self._execute(batch)
+        finally:
+            self._batch_slots.release()
+
+    async def _execute(self, batch: List[Tuple[Any, asyncio.Future, float]]):
+        """Score a batch and hand each result back to its caller"""
+        dispatch_time = time.perf_counter()
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_batch(
+                len(batch),
+                [dispatch_time - enqueued for _, _, enqueued in batch],
+                self.queue_depth
+            )
+
+        items = [item for item, _, _ in batch]
+        try:
+            if self.executor is not None:
+                results = await self.executor.run(self.infer_fn, items)
+            else:
+                results = self.infer_fn(items)
+            if len(results) != len(batch):
+                raise RuntimeError(
+                    f"Batch function returned {len(results)} results "
+                    f"for {len(batch)} requests"
+                )
+        except Exception as e:
+            logger.error(f"Batch inference error: {str(e)}")
+            for _, future, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        for (_, future, _), result in zip(batch, results):
+            # Callers may have gone away while the batch was running
+            if not future.done():
+                future.set_result(result)
@@ -0,0 +1,169 @@
+import asyncio
+import sys
+import time
+from collections import OrderedDict
+from functools import partial
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class PredictionCache:
+    """
+    Bounded LRU + TTL cache of encoded prediction responses
+
+    Responses are stored as the encoded bytes sent to the client, keyed by
+    transaction ID, model version and explanation mode (see ``key``), so a
+    repeat is answered without touching the model or re-serializing, but
+    never with another model's result or without a requested explanation.
+    Concurrent requests for a key that is still being computed await the
+    same task instead of computing it again. The computation runs as its
+    own task, so it still completes for the waiters if the request that
+    started it is cancelled. Only the event loop thread may use the cache.
+    """
+
+    HIT = 'hit'
+    MISS = 'miss'
+    COALESCED = 'coalesced'
+
+    def __init__(
+        self,
+        max_entries: int = 100000,
+        ttl_seconds: float = 60.0,
+        metrics_collector=None
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.metrics_collector = metrics_collector
+
+        # key -> (expires_at, body), in least-recently-used order
+        self._entries: OrderedDict = OrderedDict()
+        self._in_flight: Dict[str, asyncio.Task] = {}
+        self.memory_bytes = 0
+        self.counts = {self.HIT: 0, self.MISS: 0, self.COALESCED: 0}
+
+    @classmethod
+    def from_config(cls, config: Dict, metrics_collector=None):
+        """Create a cache from the ``serving`` config section"""
+        return cls(
+            max_entries=config.get('cache_size', 100000),
+            ttl_seconds=config.get('cache_ttl_seconds', 60),
+            metrics_collector=metrics_collector
+        )
+
+    @staticmethod
+    def key(
+        transaction_id: str,
+        model_version: str,
+        explanation_mode: str
+    ) -> str:
+        """Cache key of a response; results differ across all three"""
+        return f"{transaction_id}\x00{model_version}\x00{explanation_mode}"
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered without computing"""
+        total = sum(self.counts.values())
+        return (total - self.counts[self.MISS]) / total if total else 0.0
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Get a cached body, or None if absent or expired"""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] < time.monotonic():
+            self._remove(key)
+            self._update_usage()
+            return None
+        self._entries.move_to_end(key)
+        return entry[1]
+
+    def put(self, key: str, body: bytes):
+        """Store a body and evict expired or least recently used entries"""
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, body)
+        self.memory_bytes += self._sizeof(key, body)
+        self._evict()
+        self._update_usage()
+
+    async def get_or_compute(
+        self,
+        key: str,
+        compute: Callable[[], Awaitable[bytes]],
+        store: bool = True
+    ) -> Tuple[bytes, str]:
+        """
+        Return the cached body for ``key`` or compute it once
+
+        Args:
+            key: Cache key, built with ``key``
+            compute: Coroutine function producing the encoded response
+            store: Whether a computed body may be cached; coalescing and
+                lookups apply either way
+
+        Returns:
+            The body and whether it was a hit, miss or coalesced request
+        """
+        body = self.get(key)
+        if body is not None:
+            return body, self._record(self.HIT)
+
+        task = self._in_flight.get(key)
+        if task is not None:
+            self._record(self.COALESCED)
+            return await asyncio.shield(task), self.COALESCED
+
+        # Shielded so cancelling this caller leaves the waiters a result
+        task = asyncio.get_running_loop().create_task(compute())
+        self._in_flight[key] = task
+        task.add_done_callback(partial(self._on_computed, key, store))
+        self._record(self.MISS)
+        return await asyncio.shield(task), self.MISS
+
+    def _on_computed(self, key: str, store: bool, task: asyncio.Task):
+        """Cache a finished computation; failures reach waiters only"""
+        del self._in_flight[key]
+        if task.cancelled():
+            return
+        # Retrieving the exception also stops asyncio reporting it when
+        # every caller has gone away
+        if task.exception() is None and store:
+            self.put(key, task.result())
+
+    def _record(self, result: str) -> str:
+        """Count a lookup result"""
+        self.counts[result] += 1
+        if self.metrics_collector is not None:
+            self.metrics_collector.record_cache_lookup(result)
+        return result
+
+    def _update_usage(self):
+        """Export the current number of entries and their memory"""
+        if self.metrics_collector is not None:
+            self.metrics_collector.set_cache_usage(
+                len(self._entries),
+                self.memory_bytes
+            )
+
+    @staticmethod
+    def _sizeof(key: str, body: bytes) -> int:
+        """Approximate memory held by one entry"""
+        return sys.getsizeof(key) + sys.getsizeof(body)
+
+    def _remove(self, key: str):
+        _, body = self._entries.pop(key)
+        self.memory_bytes -= self._sizeof(key, body)
+
+    def _evict(self):
+        """Drop expired entries at the front and enforce the size bound"""
+        now = time.monotonic()
+        while self._entries:
+            key, (expires_at, _) = next(iter(self._entries.items()))
+            if len(self._entries) <= self.max_entries and expires_at >= now:
+                break
+            self._remove(key)
@@ -0,0 +1,198 @@
+import json
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence
+import numpy as np
+from ..features.schema import BLOCKS, FeatureSchema
+
+JSON_CONTENT_TYPE = 'application/json'
+MSGPACK_CONTENT_TYPES = ('application/msgpack', 'application/x-msgpack')
+ARROW_CONTENT_TYPE = 'application/vnd.apache.arrow.stream'
+
+
+@dataclass
+class ColumnarBatch:
+    """Batch of transactions decoded into one float32 matrix per block"""
+    transaction_ids: List[str]
+    features: np.ndarray
+    scene_info: np.ndarray
+    temporal_info: np.ndarray
+    columns: Dict[str, List[str]]
+
+    def __len__(self) -> int:
+        return len(self.transaction_ids)
+
+
+def decode_columnar(
+    body: bytes,
+    content_type: str,
+    schema: Optional[FeatureSchema] = None
+) -> ColumnarBatch:
+    """
+    Decode a columnar batch payload
+
+    JSON and msgpack bodies hold ``transaction_ids`` plus one mapping of
+    column name to values per block::
+
+        {"transaction_ids": [...],
+         "features": {"amount": [...], ...},
+         "scene_info": {...},
+         "temporal_info": {...}}
+
+    Arrow IPC streams hold a ``transaction_id`` column and one column per
+    feature, named ``<block>.<feature>``.
+
+    When a ``FeatureSchema`` is given, columns are laid out in schema order
+    and must match the schema exactly; otherwise payload order is used.
+
+    Raises:
+        ValueError: If the payload is malformed
+        NotImplementedError: If the content type is not supported
+    """
+    media_type = content_type.split(';')[0].strip().lower()
+
+    if media_type == JSON_CONTENT_TYPE:
+        return _from_mapping(json.loads(body), schema)
+    if media_type in MSGPACK_CONTENT_TYPES:
+        try:
+            import msgpack
+        except ImportError:
+            raise NotImplementedError("msgpack payloads require msgpack")
+        return _from_mapping(msgpack.unpackb(body, raw=False), schema)
+    if media_type == ARROW_CONTENT_TYPE:
+        return _from_arrow(body, schema)
+
+    raise NotImplementedError(f"Unsupported content type: {content_type}")
+
+
+def _fill_block(
+    columns: Sequence[str],
+    values: Sequence[Sequence[float]],
+    num_rows: int,
+    block: str
+) -> np.ndarray:
+    """Fill one preallocated float32 matrix column by column"""
+    matrix = np.empty((num_rows, len(columns)), dtype=np.float32)
+    for j, (name, column) in enumerate(zip(columns, values)):
+        if not isinstance(column, (list, tuple, np.ndarray)):
+            raise ValueError(f"Column '{block}.{name}' must be a list")
+        if len(column) != num_rows:
+            raise ValueError(
+                f"Column '{block}.{name}' has {len(column)} values, "
+                f"expected {num_rows}"
+            )
+        if not _is_numeric(column):
+            raise ValueError(
+                f"Column '{block}.{name}' must hold only numbers"
+            )
+        matrix[:, j] = column
+    return matrix
+
+
+def _is_numeric(column) -> bool:
+    """Whether every cell is a number, so ``None`` never becomes NaN"""
+    if isinstance(column, np.ndarray):
+        return column.dtype.kind in 'biuf'
+    return all(isinstance(value, (int, float)) for value in column)
+
+
+def _block_columns(
+    block: str,
+    names: List[str],
+    schema: Optional[FeatureSchema]
+) -> List[str]:
+    """Resolve the column order for one block"""
+    if schema is None:
+        return names
+    schema.check_columns(block, names)
+    return schema.columns[block]
+
+
+def _from_mapping(
+    payload: Dict,
+    schema: Optional[FeatureSchema] = None
+) -> ColumnarBatch:
+    """Build a batch from a decoded JSON/msgpack mapping"""
+    if not isinstance(payload, dict) or 'transaction_ids' not in payload:
+        raise ValueError("Payload must contain 'transaction_ids'")
+    if not isinstance(payload['transaction_ids'], list):
+        raise ValueError("'transaction_ids' must be a list")
+
+    transaction_ids = [str(t) for t in payload['transaction_ids']]
+    num_rows = len(transaction_ids)
+
+    blocks = {}
+    columns = {}
+    for block in BLOCKS:
+        block_columns = payload.get(block)
+        if not isinstance(block_columns, dict):
+            raise ValueError(f"Payload must contain a '{block}' mapping")
+        columns[block] = _block_columns(
+            block,
+            list(block_columns.keys()),
+            schema
+        )
+        blocks[block] = _fill_block(
+            columns[block],
+            [block_columns[name] for name in columns[block]],
+            num_rows,
+            block
+        )
+
+    return ColumnarBatch(
+        transaction_ids=transaction_ids,
+        columns=columns,
+        **blocks
+    )
+
+
+def _from_arrow(
+    body: bytes,
+    schema: Optional[FeatureSchema] = None
+) -> ColumnarBatch:
+    """Build a batch from an Arrow IPC stream"""
+    try:
+        import pyarrow as pa
+    except ImportError:
+        raise NotImplementedError("Arrow payloads require pyarrow")
+
+    table = pa.ipc.open_stream(body).read_all()
+    if 'transaction_id' not in table.column_names:
+        raise ValueError("Arrow payload must contain 'transaction_id'")
+
+    transaction_ids = [
+        str(t) for t in table.column('transaction_id').to_pylist()
+    ]
+    num_rows = table.num_rows
+
+    blocks = {}
+    columns = {}
+    for block in BLOCKS:
+        prefix = f"{block}."
+        columns[block] = _block_columns(
+            block,
+            [
+                n[len(prefix):] for n in table.column_names
+                if n.startswith(prefix)
+            ],
+            schema
+        )
+        arrays = []
+        for name in columns[block]:
+            column = table.column(prefix + name)
+            if column.null_count:
+                raise ValueError(
+                    f"Column '{block}.{name}' has missing values"
+                )
+            arrays.append(column.to_numpy(zero_copy_only=False))
+        blocks[block] = _fill_block(
+            columns[block],
+            arrays,
+            num_rows,
+            block
+        )
+
+    return ColumnarBatch(
+        transaction_ids=transaction_ids,
+        columns=columns,
+        **blocks
+    )
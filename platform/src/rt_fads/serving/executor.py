@@ -0,0 +1,74 @@
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+import torch
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class InferenceExecutor:
+    """Dedicated thread pool for model forward passes
+
+    Keeps ``model(...)`` and explanation calls off the asyncio event loop.
+    PyTorch releases the GIL inside its kernels, so a small pool of threads
+    runs forward passes in parallel while the loop keeps serving other
+    connections. At most ``max_in_flight`` calls are admitted at once;
+    further callers wait for a free slot instead of piling work onto the
+    pool.
+
+    ``intra_op_threads`` is passed to ``torch.set_num_threads``, which is a
+    process-wide setting shared by every thread, not a per-worker budget.
+    Size it together with ``num_workers`` so that their product does not
+    oversubscribe the cores; ``None`` leaves PyTorch's setting unchanged.
+    """
+
+    def __init__(
+        self,
+        num_workers: int = 2,
+        intra_op_threads: Optional[int] = 1,
+        max_in_flight: int = 64
+    ):
+        self.num_workers = num_workers
+        self.intra_op_threads = intra_op_threads
+        self.max_in_flight = max_in_flight
+
+        if intra_op_threads is not None:
+            torch.set_num_threads(intra_op_threads)
+        self._pool = ThreadPoolExecutor(
+            max_workers=num_workers,
+            thread_name_prefix='rt-fads-inference'
+        )
+        self._slots = asyncio.Semaphore(max_in_flight)
+        self._in_flight = 0
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'InferenceExecutor':
+        """Create executor from the ``serving`` config section"""
+        return cls(
+            num_workers=config.get('inference_workers', 2),
+            intra_op_threads=config.get('intra_op_threads', 1),
+            max_in_flight=config.get('max_in_flight', 64)
+        )
+
+    @property
+    def in_flight(self) -> int:
+        """Number of calls currently admitted to the executor"""
+        return self._in_flight
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        """Run ``fn`` on the executor and await its result"""
+        async with self._slots:
+            self._in_flight += 1
+            try:
+                return await asyncio.get_running_loop().run_in_executor(
+                    self._pool,
+                    functools.partial(fn, *args, **kwargs)
+                )
+            finally:
+                self._in_flight -= 1
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the worker pool"""
+        self._pool.shutdown(wait=wait)
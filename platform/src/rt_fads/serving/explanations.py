@@ -0,0 +1,155 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from enum import Enum
+from typing import Any, Callable, Dict, Optional
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+class ExplanationMode(str, Enum):
+    """When explanations are computed for a prediction"""
+    NONE = 'none'
+    INLINE = 'inline'
+    DEFERRED = 'deferred'
+
+
+class ExplanationStore:
+    """Bounded in-memory explanation store with TTL eviction"""
+
+    PENDING = 'pending'
+    READY = 'ready'
+    FAILED = 'failed'
+
+    def __init__(
+        self,
+        max_entries: int = 10000,
+        ttl_seconds: float = 300.0
+    ):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._entries: OrderedDict = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def put(
+        self,
+        transaction_id: str,
+        status: str,
+        explanation: Optional[Dict[str, float]] = None
+    ):
+        """Store or update the explanation entry for a transaction"""
+        with self._lock:
+            self._entries[transaction_id] = {
+                'status': status,
+                'explanation': explanation,
+                'updated_at': time.monotonic()
+            }
+            self._entries.move_to_end(transaction_id)
+            self._evict()
+
+    def get(self, transaction_id: str) -> Optional[Dict[str, Any]]:
+        """Get the entry for a transaction, or None if unknown/expired"""
+        with self._lock:
+            self._evict()
+            entry = self._entries.get(transaction_id)
+            return dict(entry) if entry is not None else None
+
+    def _evict(self):
+        """Drop expired entries and enforce the size bound"""
+        # Entries are kept in update order, so expired ones are at the front
+        expire_before = time.monotonic() - self.ttl_seconds
+        while self._entries:
+            oldest = next(iter(self._entries.values()))
+            if (
+                len(self._entries) <= self.max_entries
+                and oldest['updated_at'] >= expire_before
+            ):
+                break
+            self._entries.popitem(last=False)
+
+
+class DeferredExplainer:
+    """
+    Background worker pool computing explanations off the request path
+
+    Results are stored in an ``ExplanationStore`` under the transaction ID.
+    At most ``max_pending`` explanations are queued; beyond that new work
+    is refused so a burst of traffic cannot grow the backlog without bound.
+    """
+
+    def __init__(
+        self,
+        store: ExplanationStore,
+        num_workers: int = 1,
+        max_pending: int = 1000
+    ):
+        self.store = store
+        self.max_pending = max_pending
+
+        self._pool = ThreadPoolExecutor(
+            max_workers=num_workers,
+            thread_name_prefix='rt-fads-explainer'
+        )
+        self._pending = 0
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_config(cls, config: Dict) -> 'DeferredExplainer':
+        """Create explainer and store from the ``serving`` config section"""
+        store = ExplanationStore(
+            max_entries=config.get('explanation_store_size', 10000),
+            ttl_seconds=config.get('explanation_ttl_seconds', 300.0)
+        )
+        return cls(
+            store,
+            num_workers=config.get('explanation_workers', 1),
+            max_pending=config.get('max_pending_explanations', 1000)
+        )
+
+    def submit(
+        self,
+        transaction_id: str,
+        explain_fn: Callable[..., Dict[str, float]],
+        *args
+    ) -> bool:
+        """
+        Schedule an explanation
+
+        Returns:
+            False if the backlog is full and the work was refused
+        """
+        with self._lock:
+            if self._pending >= self.max_pending:
+                return False
+            self._pending += 1
+
+        self.store.put(transaction_id, ExplanationStore.PENDING)
+        self._pool.submit(self._explain, transaction_id, explain_fn, *args)
+        return True
+
+    def _explain(
+        self,
+        transaction_id: str,
+        explain_fn: Callable[..., Dict[str, float]],
+        *args
+    ):
+        """Compute one explanation and store the result"""
+        try:
+            explanation = explain_fn(*args)
+            self.store.put(transaction_id, ExplanationStore.READY, explanation)
+        except Exception as e:
+            logger.error(f"Explanation error for {transaction_id}: {str(e)}")
+            self.store.put(transaction_id, ExplanationStore.FAILED)
+        finally:
+            with self._lock:
+                self._pending -= 1
+
+    def shutdown(self, wait: bool = True):
+        """Shut down the worker pool"""
+        self._pool.shutdown(wait=wait)
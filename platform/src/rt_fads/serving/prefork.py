@@ -0,0 +1,223 @@
+import argparse
+import os
+import signal
+import socket
+from typing import Dict
+import psutil
+import torch
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+def share_weights(model: torch.nn.Module, path: str) -> torch.nn.Module:
+    """
+    Freeze model weights into a memory-mapped file
+
+    The state dict is written once to ``path`` (``/dev/shm`` keeps it off
+    disk) and loaded back with ``mmap=True``, so every parameter and buffer
+    becomes a view over the file's pages. Processes forked afterwards, or
+    started later with ``attach_weights``, share those pages read-only
+    instead of each holding a private copy.
+    """
+    model.eval()
+    torch.save(model.state_dict(), path)
+    return attach_weights(model, path)
+
+
+def attach_weights(model: torch.nn.Module, path: str) -> torch.nn.Module:
+    """Point a model's parameters at weights frozen by ``share_weights``"""
+    state_dict = torch.load(
+        path,
+        map_location='cpu',
+        mmap=True,
+        weights_only=True
+    )
+    model.load_state_dict(state_dict, assign=True)
+    model.requires_grad_(False)
+    model.eval()
+    return model
+
+
+def memory_report() -> Dict[str, float]:
+    """Resident, proportional and unique set size of this process in MB"""
+    info = psutil.Process().memory_full_info()
+    return {
+        'pid': os.getpid(),
+        'rss_mb': info.rss / 2 ** 20,
+        'pss_mb': getattr(info, 'pss', 0) / 2 ** 20,
+        'uss_mb': info.uss / 2 ** 20
+    }
+
+
+class PreforkServer:
+    """
+    Prefork API server sharing one copy of the model weights
+
+    The parent loads the checkpoint once, freezes its weights into a
+    memory-mapped file, binds the listening socket and forks
+    ``deployment.workers`` uvicorn workers that inherit both. Each worker
+    logs its memory usage at startup.
+
+    The parent then supervises the workers. A worker that fails logs its
+    traceback and exits with status 1; any worker exiting before shutdown
+    is reaped and replaced, up to ``deployment.max_worker_restarts`` times
+    in total, after which the server stops and ``run`` raises.
+
+    ``POST /models`` hot swaps are disabled in the workers: a swap would
+    reach only the worker that received it, which would then score with
+    a private copy of the new model. Restart the server with the new
+    checkpoint instead.
+    """
+
+    def __init__(self, model_path: str, config: Dict):
+        self.model_path = model_path
+        self.config = config
+        deployment_config = config.get('deployment', {})
+        self.host = deployment_config.get('host', '0.0.0.0')
+        self.port = deployment_config.get('port', 8080)
+        self.num_workers = deployment_config.get('workers', 4)
+        self.max_worker_restarts = deployment_config.get(
+            'max_worker_restarts',
+            10
+        )
+        self.shared_weights_path = deployment_config.get(
+            'shared_weights_path',
+            '/dev/shm/rt-fads-weights.pt'
+        )
+        # Worker index of every live worker process, by pid
+        self.workers: Dict[int, int] = {}
+        self._stopping = False
+
+    def _load_model(self):
+        """Load and freeze the model in the parent process"""
+        from ..api import server
+
+        server.init_serving({
+            **self.config.get('serving', {}),
+            'hot_swap': False
+        })
+        server.init_model(self.model_path)
+        share_weights(server.registry.current.model, self.shared_weights_path)
+        logger.info(
+            f"Model weights shared from {self.shared_weights_path}, "
+            f"parent memory: {memory_report()}"
+        )
+        return server.app
+
+    def _bind(self) -> socket.socket:
+        """Bind the listening socket shared by all workers"""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        sock.bind((self.host, self.port))
+        sock.listen(2048)
+        sock.set_inheritable(True)
+        return sock
+
+    def _run_worker(self, app, sock: socket.socket, index: int):
+        """Worker process entry point"""
+        import uvicorn
+
+        report = memory_report()
+        logger.info(
+            f"Worker {index} (pid {report['pid']}): "
+            f"RSS {report['rss_mb']:.1f} MB, "
+            f"PSS {report['pss_mb']:.1f} MB, "
+            f"USS {report['uss_mb']:.1f} MB"
+        )
+
+        server = uvicorn.Server(uvicorn.Config(app, log_level='info'))
+        server.run(sockets=[sock])
+
+    def _spawn(self, app, sock: socket.socket, index: int) -> int:
+        """Fork one worker; the child never returns"""
+        pid = os.fork()
+        if pid == 0:
+            # The parent's handlers would signal the sibling workers
+            signal.signal(signal.SIGTERM, signal.SIG_DFL)
+            signal.signal(signal.SIGINT, signal.SIG_DFL)
+            status = 0
+            try:
+                self._run_worker(app, sock, index)
+            except BaseException:
+                logger.exception(f"Worker {index} failed")
+                status = 1
+            finally:
+                os._exit(status)
+        self.workers[pid] = index
+        return pid
+
+    def _stop_workers(self, *args):
+        """Forward termination to all workers"""
+        self._stopping = True
+        for pid in list(self.workers):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    def run(self):
+        """
+        Load the model, fork workers and supervise them until shutdown
+
+        Raises:
+            RuntimeError: If workers exited more than
+                ``max_worker_restarts`` times
+        """
+        app = self._load_model()
+        sock = self._bind()
+        signal.signal(signal.SIGTERM, self._stop_workers)
+        signal.signal(signal.SIGINT, self._stop_workers)
+
+        for index in range(self.num_workers):
+            self._spawn(app, sock, index)
+
+        restarts = 0
+        failed = False
+        while self.workers:
+            pid, status = os.wait()
+            index = self.workers.pop(pid, None)
+            if index is None or self._stopping:
+                continue
+
+            logger.error(
+                f"Worker {index} (pid {pid}) exited unexpectedly with "
+                f"status {_exit_code(status)}"
+            )
+            if restarts >= self.max_worker_restarts:
+                logger.error(
+                    f"Workers exited {restarts + 1} times, shutting down"
+                )
+                failed = True
+                self._stop_workers()
+                continue
+            restarts += 1
+            self._spawn(app, sock, index)
+
+        sock.close()
+        if failed:
+            raise RuntimeError("Prefork workers kept exiting")
+
+
+def _exit_code(status: int) -> int:
+    """Exit code of a wait status, negative for a terminating signal"""
+    if os.WIFSIGNALED(status):
+        return -os.WTERMSIG(status)
+    return os.WEXITSTATUS(status)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="RT-FADS prefork server")
+    parser.add_argument('--model-path', required=True)
+    parser.add_argument('--config', default='config/system_config.yaml')
+    args = parser.parse_args()
+
+    import yaml
+    with open(args.config) as f:
+        config = yaml.safe_load(f)
+
+    PreforkServer(args.model_path, config).run()
+
+
+if __name__ == "__main__":
+    main()
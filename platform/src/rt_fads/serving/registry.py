@@ -0,0 +1,255 @@
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence
+import torch
+from ..features.schema import FeatureSchema
+from .cascade import FirstStageModel
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+
+@dataclass
+class ModelVersion:
+    """A loaded model together with its input schema"""
+    version: str
+    model: torch.nn.Module
+    path: str
+    feature_schema: Optional[FeatureSchema] = None
+    first_stage: Optional[FirstStageModel] = None
+    loaded_at: float = field(default_factory=time.time)
+
+
+class ModelRegistry:
+    """
+    Versioned model registry with background loading and atomic swaps
+
+    New checkpoints are loaded and warmed up with synthetic batches on a
+    background thread, then published by replacing a single reference.
+    Requests capture ``registry.current`` once when they start and keep
+    using that ``ModelVersion``, so in-flight work finishes on the version
+    it began with while new requests see the new one.
+
+    A candidate version can also be held in the ``shadow`` slot, where it
+    is scored off the request path without ever answering requests.
+
+    Each checkpoint is read once; ``loader`` builds the model from the
+    loaded checkpoint, and the feature schema and cascade first stage are
+    taken from the same object. Checkpoints are loaded with
+    ``weights_only=True``, so they may hold tensors and plain containers
+    but never unpickle arbitrary objects.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Dict], torch.nn.Module],
+        metrics_collector=None,
+        warmup_batch_sizes: Sequence[int] = (1, 8, 32),
+        warmup_rounds: int = 3,
+        max_history: int = 5
+    ):
+        self.loader = loader
+        self.metrics_collector = metrics_collector
+        self.warmup_batch_sizes = tuple(warmup_batch_sizes)
+        self.warmup_rounds = warmup_rounds
+        self.max_history = max_history
+
+        self._current: Optional[ModelVersion] = None
+        self._shadow: Optional[ModelVersion] = None
+        self._history: List[Dict] = []
+        self._lock = threading.Lock()
+        self._loader_pool = ThreadPoolExecutor(
+            max_workers=1,
+            thread_name_prefix='rt-fads-model-loader'
+        )
+        self._loading: Optional[str] = None
+
+    @property
+    def current(self) -> Optional[ModelVersion]:
+        """The version new requests should be served with"""
+        return self._current
+
+    @property
+    def shadow(self) -> Optional[ModelVersion]:
+        """The candidate version scored in shadow, if any"""
+        return self._shadow
+
+    def load(self, path: str, version: Optional[str] = None) -> ModelVersion:
+        """Load, warm up and publish a checkpoint synchronously"""
+        model_version = self._prepare(path, version)
+        self._publish(model_version)
+        return model_version
+
+    def load_shadow(
+        self,
+        path: str,
+        version: Optional[str] = None
+    ) -> ModelVersion:
+        """
+        Load and warm up a checkpoint as the shadow candidate
+
+        Raises:
+            ValueError: If its feature schema differs from the current
+                version's, since shadow scoring reuses primary inputs
+        """
+        model_version = self._prepare(path, version)
+        current = self._current
+        if current is not None and current.feature_schema is not None:
+            if model_version.feature_schema is None:
+                model_version.feature_schema = current.feature_schema
+            elif (model_version.feature_schema.fingerprint
+                  != current.feature_schema.fingerprint):
+                raise ValueError(
+                    f"Shadow version {model_version.version} has a "
+                    "different feature schema than the current version"
+                )
+
+        with self._lock:
+            self._shadow = model_version
+        logger.info(f"Shadow version {model_version.version} ready")
+        return model_version
+
+    def clear_shadow(self):
+        """Stop shadow scoring"""
+        with self._lock:
+            self._shadow = None
+
+    def _prepare(self, path: str, version: Optional[str]) -> ModelVersion:
+        """Load and warm up a checkpoint without publishing it"""
+        version = version or os.path.splitext(os.path.basename(path))[0]
+        start_time = time.time()
+
+        checkpoint = torch.load(path, map_location='cpu', weights_only=True)
+        model = self.loader(checkpoint)
+        model.eval()
+        model_version = ModelVersion(
+            version=version,
+            model=model,
+            path=path,
+            feature_schema=FeatureSchema.from_checkpoint(checkpoint)
+        )
+        first_stage = FirstStageModel.from_checkpoint(checkpoint)
+        if first_stage is not None:
+            if model_version.feature_schema is None:
+                logger.warning(
+                    f"Ignoring cascade first stage of {version}: it needs "
+                    "a feature schema in the checkpoint"
+                )
+            else:
+                model_version.first_stage = first_stage
+        self._warm_up(model_version)
+
+        logger.info(
+            f"Model version {version} ready in "
+            f"{time.time() - start_time:.2f}s"
+        )
+        return model_version
+
+    def load_async(
+        self,
+        path: str,
+        version: Optional[str] = None,
+        shadow: bool = False
+    ) -> Future:
+        """Load a checkpoint on the background loader thread"""
+        with self._lock:
+            self._loading = version or path
+        load = self.load_shadow if shadow else self.load
+        future = self._loader_pool.submit(load, path, version)
+        future.add_done_callback(self._on_loaded)
+        return future
+
+    def _on_loaded(self, future: Future):
+        """Clear loading state and log background failures"""
+        with self._lock:
+            self._loading = None
+        if future.exception() is not None:
+            logger.error(f"Model loading failed: {future.exception()}")
+
+    def _warm_up(self, model_version: ModelVersion):
+        """Run synthetic batches so the first real requests are not cold"""
+        schema = model_version.feature_schema
+        if schema is None:
+            logger.warning(
+                f"Model version {model_version.version} has no feature "
+                "schema, skipping warm-up"
+            )
+            return
+
+        with torch.no_grad():
+            for batch_size in self.warmup_batch_sizes:
+                rows = torch.randn(batch_size, schema.width)
+                features, scene_info, temporal_info = schema.split(rows)
+                for _ in range(self.warmup_rounds):
+                    model_version.model(
+                        features,
+                        scene_info=scene_info,
+                        temporal_info=temporal_info
+                    )
+
+    def _publish(self, model_version: ModelVersion):
+        """Atomically make a version current"""
+        with self._lock:
+            previous = self._current
+            self._current = model_version
+            # Only metadata is kept, so a replaced model is released once
+            # its in-flight requests drop their references
+            self._history.append({
+                'version': model_version.version,
+                'path': model_version.path,
+                'loaded_at': model_version.loaded_at
+            })
+            del self._history[:-self.max_history]
+
+        if self.metrics_collector is not None:
+            self.metrics_collector.set_model_version(
+                model_version.version,
+                previous.version if previous is not None else None
+            )
+
+    def status(self) -> Dict:
+        """Describe the current version and recent history"""
+        with self._lock:
+            return {
+                'current': (
+                    self._current.version if self._current else None
+                ),
+                'shadow': self._shadow.version if self._shadow else None,
+                'loading': self._loading,
+                'history': list(self._history)
+            }
+
+    def shutdown(self):
+        """Stop the background loader"""
+        self._loader_pool.shutdown(wait=False)
+
+
+def resolve_model_path(model_dir: str, path: str) -> str:
+    """
+    Resolve a client-supplied checkpoint path inside ``model_dir``
+
+    Args:
+        model_dir: Directory checkpoints may be loaded from
+        path: Path relative to ``model_dir``, or absolute inside it
+
+    Returns:
+        The absolute checkpoint path
+
+    Raises:
+        ValueError: If the path uses ``..``, passes through a symlink or
+            leaves ``model_dir``
+    """
+    if '..' in path.replace('\\', '/').split('/'):
+        raise ValueError(f"Model path may not contain '..': {path}")
+
+    root = os.path.realpath(model_dir)
+    candidate = os.path.normpath(os.path.join(root, path))
+    if os.path.commonpath([root, candidate]) != root:
+        raise ValueError(f"Model path is outside the model directory: {path}")
+    # realpath only differs from the normalized path through a symlink
+    if os.path.realpath(candidate) != candidate:
+        raise ValueError(f"Model path may not contain symlinks: {path}")
+    return candidate
@@ -0,0 +1,198 @@
+import queue
+import random
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+import torch
+from .cascade import CascadeScorer
+from .registry import ModelVersion
+from ..utils.logger import setup_logger
+
+logger = setup_logger(__name__)
+
+ShadowItem = Tuple[ModelVersion, np.ndarray, float, float]
+
+
+class ShadowScorer:
+    """
+    Score a sample of live traffic with a candidate model off the hot path
+
+    ``submit`` never blocks: items go into a bounded queue and are dropped
+    (and counted) when it is full. A single daemon thread drains the queue
+    in small batches, scores them with the candidate model and records
+    agreement, score and latency deltas against the primary prediction.
+
+    Both sides are compared as served: the candidate scores through its
+    own cascade with the primary's band, so its probability comes from
+    whichever stage would have decided, like the primary's. Latency
+    deltas compare the candidate's batched scoring time with the
+    primary's, excluding parsing, queueing and explanations.
+    """
+
+    def __init__(
+        self,
+        metrics_collector=None,
+        sample_rate: float = 0.1,
+        max_queue_size: int = 1000,
+        max_batch_size: int = 32,
+        cascade_band: float = 0.3
+    ):
+        self.metrics_collector = metrics_collector
+        self.sample_rate = sample_rate
+        self.max_batch_size = max_batch_size
+        self.cascade_band = cascade_band
+
+        self._queue: queue.Queue = queue.Queue(maxsize=max_queue_size)
+        self._thread: Optional[threading.Thread] = None
+        self.dropped = 0
+
+    @classmethod
+    def from_config(cls, config: Dict, metrics_collector=None):
+        """Create a shadow scorer from the ``serving`` config section"""
+        return cls(
+            metrics_collector=metrics_collector,
+            sample_rate=config.get('shadow_sample_rate', 0.1),
+            max_queue_size=config.get('shadow_queue_size', 1000),
+            max_batch_size=config.get('max_batch_size', 32),
+            cascade_band=config.get('cascade_band', 0.3)
+        )
+
+    def should_sample(self) -> bool:
+        """Decide whether the current request is mirrored"""
+        return self.sample_rate > 0 and random.random() < self.sample_rate
+
+    def start(self):
+        """Start the shadow scoring thread"""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._run,
+                name='rt-fads-shadow',
+                daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        """Stop the shadow scoring thread, discarding queued work"""
+        if self._thread is None:
+            return
+        while True:
+            try:
+                self._queue.get_nowait()
+            except queue.Empty:
+                break
+        self._queue.put(None)
+        self._thread.join()
+        self._thread = None
+
+    def submit(
+        self,
+        model_version: ModelVersion,
+        row: np.ndarray,
+        primary_prob: float,
+        primary_scoring_time: float
+    ) -> bool:
+        """
+        Queue a request for shadow scoring without waiting
+
+        Args:
+            model_version: Candidate version to score with
+            row: Vectorized request, in the candidate's feature schema
+            primary_prob: Fraud probability served by the primary, from
+                the cascade stage that decided
+            primary_scoring_time: Seconds the primary spent scoring the
+                micro-batch holding the request
+
+        Returns:
+            False if the queue was full and the item was dropped
+        """
+        try:
+            self._queue.put_nowait(
+                (model_version, row, primary_prob, primary_scoring_time)
+            )
+            return True
+        except queue.Full:
+            self.dropped += 1
+            if self.metrics_collector is not None:
+                self.metrics_collector.record_shadow_dropped()
+            return False
+
+    @property
+    def queue_depth(self) -> int:
+        """Number of requests waiting for shadow scoring"""
+        return self._queue.qsize()
+
+    def _run(self):
+        """Drain the queue in batches until stopped"""
+        while True:
+            item = self._queue.get()
+            if item is None:
+                return
+            items = [item]
+            while len(items) < self.max_batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is None:
+                    self._score(items)
+                    return
+                items.append(item)
+            self._score(items)
+
+    def _score(self, items: List[ShadowItem]):
+        """Score one batch per candidate version and record the deltas"""
+        groups: Dict[int, List[ShadowItem]] = {}
+        for item in items:
+            groups.setdefault(id(item[0]), []).append(item)
+
+        for group in groups.values():
+            model_version = group[0][0]
+            try:
+                rows = np.stack([item[1] for item in group])
+                start_time = time.time()
+                shadow_probs = self._predict(model_version, rows).tolist()
+                shadow_scoring_time = time.time() - start_time
+            except Exception as e:
+                logger.error(
+                    f"Shadow scoring with {model_version.version} "
+                    f"failed: {str(e)}"
+                )
+                continue
+
+            if self.metrics_collector is None:
+                continue
+            for (_, _, primary_prob, primary_time), shadow_prob in zip(
+                group, shadow_probs
+            ):
+                self.metrics_collector.record_shadow(
+                    primary_prob,
+                    shadow_prob,
+                    shadow_scoring_time - primary_time,
+                    model_version.version
+                )
+
+    def _predict(
+        self,
+        model_version: ModelVersion,
+        rows: np.ndarray
+    ) -> np.ndarray:
+        """Probabilities the candidate would serve for schema-ordered rows"""
+        def full_fn(subset: np.ndarray) -> np.ndarray:
+            features, scene_info, temporal_info = (
+                model_version.feature_schema.split(torch.from_numpy(subset))
+            )
+            with torch.no_grad():
+                prediction = model_version.model(
+                    features,
+                    scene_info=scene_info,
+                    temporal_info=temporal_info
+                )
+            return torch.sigmoid(prediction).view(
+                len(subset), -1
+            )[:, -1].numpy()
+
+        if model_version.first_stage is None:
+            return full_fn(rows)
+        cascade = CascadeScorer(model_version.first_stage, self.cascade_band)
+        return cascade.score(rows, full_fn)[0]
@@ -0,0 +1,104 @@
+import struct
+from dataclasses import dataclass
+from typing import Optional
+import numpy as np
+from ..features.schema import FeatureSchema
+from .explanations import ExplanationMode
+
+FRAME_CONTENT_TYPE = 'application/x-rt-fads-frame'
+FRAME_MAGIC = b'RTFB'
+FRAME_VERSION = 1
+
+# magic, version, explanation mode, id length, schema fingerprint, width
+_HEADER = struct.Struct('<4sBBHII')
+
+_MODE_CODES = {
+    None: 0,
+    ExplanationMode.NONE: 1,
+    ExplanationMode.INLINE: 2,
+    ExplanationMode.DEFERRED: 3
+}
+_CODE_MODES = {code: mode for mode, code in _MODE_CODES.items()}
+
+
+@dataclass
+class PredictionFrame:
+    """Decoded binary prediction request"""
+    transaction_id: str
+    row: np.ndarray
+    explanation_mode: Optional[ExplanationMode] = None
+
+
+def _payload_offset(id_length: int) -> int:
+    """Offset of the float32 payload, aligned to 4 bytes"""
+    return _HEADER.size + (id_length + 3) // 4 * 4
+
+
+def encode_frame(
+    transaction_id: str,
+    row: np.ndarray,
+    schema: FeatureSchema,
+    explanation_mode: Optional[ExplanationMode] = None
+) -> bytes:
+    """
+    Encode a prediction request as a binary frame
+
+    Layout (little-endian): 16-byte header, the UTF-8 transaction ID padded
+    to a 4-byte boundary, then ``schema.width`` float32 values laid out by
+    the schema's column offsets.
+    """
+    row = np.ascontiguousarray(row, dtype='<f4')
+    if row.shape != (schema.width,):
+        raise ValueError(
+            f"Row has shape {row.shape}, expected ({schema.width},)"
+        )
+
+    encoded_id = transaction_id.encode('utf-8')
+    header = _HEADER.pack(
+        FRAME_MAGIC,
+        FRAME_VERSION,
+        _MODE_CODES[explanation_mode],
+        len(encoded_id),
+        schema.fingerprint,
+        schema.width
+    )
+    padding = b'\0' * (_payload_offset(len(encoded_id)) - _HEADER.size
+                       - len(encoded_id))
+    return b''.join([header, encoded_id, padding, row.tobytes()])
+
+
+def decode_frame(body: bytes, schema: FeatureSchema) -> PredictionFrame:
+    """
+    Decode a binary frame without copying the feature payload
+
+    The returned row is a read-only ``numpy.frombuffer`` view over ``body``.
+
+    Raises:
+        ValueError: If the frame is malformed or built for another schema
+    """
+    if len(body) < _HEADER.size:
+        raise ValueError("Frame is shorter than its header")
+
+    magic, version, mode_code, id_length, fingerprint, width = (
+        _HEADER.unpack_from(body)
+    )
+    if magic != FRAME_MAGIC or version != FRAME_VERSION:
+        raise ValueError("Not an RT-FADS frame or unsupported version")
+    if fingerprint != schema.fingerprint or width != schema.width:
+        raise ValueError("Frame was encoded for a different feature schema")
+    if mode_code not in _CODE_MODES:
+        raise ValueError(f"Unknown explanation mode code {mode_code}")
+
+    offset = _payload_offset(id_length)
+    if len(body) != offset + width * 4:
+        raise ValueError(
+            f"Frame has {len(body)} bytes, expected {offset + width * 4}"
+        )
+
+    return PredictionFrame(
+        transaction_id=body[_HEADER.size:_HEADER.size + id_length].decode(
+            'utf-8'
+        ),
+        row=np.frombuffer(body, dtype='<f4', count=width, offset=offset),
+        explanation_mode=_CODE_MODES[mode_code]
+    )
@@ -3,9 +3,12 @@ import torch.distributed as dist
 from torch.nn.parallel import DistributedDataParallel as DDP
 from typing import Dict, Optional
 import os
-import horovod.torch as hvd
+from ..data.partitioning import GraphShard, load_shard, shard_path
+from ..utils.lazy import lazy_import
 from ..utils.logger import setup_logger
 
+hvd = lazy_import('horovod.torch')
+
 logger = setup_logger(__name__)
 
 
@@ -32,6 +35,7 @@ class DistributedTrainer:
 
         # Initialize optimizer with Horovod
         self.optimizer = self._init_optimizer()
+        self.shard: Optional[GraphShard] = None
 
     def _init_distributed(self):
         """Initialize distributed training environment"""
@@ -53,6 +57,32 @@ class DistributedTrainer:
                 init_method='env://'
             )
 
+    def load_graph_shard(
+        self,
+        directory: str,
+        verify: bool = False
+    ) -> GraphShard:
+        """
+        Memory-map this rank's partition of the graph
+
+        Shards are written by ``GraphPartitioner.write_shards`` with one
+        partition per rank.
+        """
+        self.shard = load_shard(
+            shard_path(directory, hvd.rank()),
+            verify=verify
+        )
+        if self.shard.num_partitions != hvd.size():
+            raise ValueError(
+                f"Graph has {self.shard.num_partitions} partitions for "
+                f"{hvd.size()} ranks"
+            )
+        logger.info(
+            f"Rank {hvd.rank()} loaded {self.shard.num_owned} nodes and "
+            f"{self.shard.num_halo} halo nodes"
+        )
+        return self.shard
+
     def _init_optimizer(self) -> torch.optim.Optimizer:
         """Initialize distributed optimizer"""
         optimizer = torch.optim.Adam(
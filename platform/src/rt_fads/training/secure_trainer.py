@@ -0,0 +1,46 @@
+import torch
+from secretflow.ml.nn import SecureTrainer
+from ..utils.metrics import MetricsCalculator
+
+
+class ModelTrainer(SecureTrainer):
+    """Secure model trainer"""
+
+    def __init__(self, model, optimizer, device):
+        super().__init__()
+        self.model = model
+        self.optimizer = optimizer
+        self.device = device
+
+    def train_epoch(self, train_loader, epoch):
+        self.model.train()
+        total_loss = 0
+
+        for batch_idx, (data, target) in enumerate(train_loader):
+            data, target = data.to(self.device), target.to(self.device)
+
+            self.optimizer.zero_grad()
+            output = self.model(data)
+            loss = self.criterion(output, target)
+
+            loss.backward()
+            self.optimizer.step()
+
+            total_loss += loss.item()
+
+        return total_loss / len(train_loader)
+
+    def evaluate(self, test_loader):
+        self.model.eval()
+        predictions = []
+        targets = []
+
+        with torch.no_grad():
+            for data, target in test_loader:
+                data, target = data.to(self.device), target.to(self.device)
+                output = self.model(data)
+                predictions.extend(output.cpu().numpy())
+                targets.extend(target.cpu().numpy())
+
+        metrics = MetricsCalculator.calculate_metrics(targets, predictions)
+        return metrics
@@ -1,58 +1,25 @@
 from tqdm import tqdm
+from ..features.schema import FeatureSchema
 from ..monitoring import MetricsCollector
+from ..serving.cascade import FirstStageModel
 from ..utils.logger import setup_logger
 from torch.utils.data import DataLoader
 from typing import Dict, Optional, Tuple
+import numpy as np
 import torch.nn as nn
 import torch
-from secretflow.ml.nn import SecureTrainer
-from rt_fads.utils.metrics import calculate_metrics
 
 
-class ModelTrainer(SecureTrainer):
-    """Secure model trainer"""
-
-    def __init__(self, model, optimizer, device):
-        super().__init__()
-        self.model = model
-        self.optimizer = optimizer
-        self.device = device
-
-    def train_epoch(self, train_loader, epoch):
-        self.model.train()
-        total_loss = 0
-
-        for batch_idx, (data, target) in enumerate(train_loader):
-            data, target = data.to(self.device), target.to(self.device)
-
-            self.optimizer.zero_grad()
-            output = self.model(data)
-            loss = self.criterion(output, target)
-
-            loss.backward()
-            self.optimizer.step()
-
-            total_loss += loss.item()
-
-        return total_loss / len(train_loader)
-
-    def evaluate(self, test_loader):
-        self.model.eval()
-        predictions = []
-        targets = []
-
-        with torch.no_grad():
-            for data, target in test_loader:
-                data, target = data.to(self.device), target.to(self.device)
-                output = self.model(data)
-                predictions.extend(output.cpu().numpy())
-                targets.extend(target.cpu().numpy())
-
-        metrics = calculate_metrics(targets, predictions)
-        return metrics
+logger = setup_logger(__name__)
 
 
-logger = setup_logger(__name__)
+def __getattr__(name: str):
+    # ModelTrainer subclasses secretflow's SecureTrainer, so it lives in
+    # its own module and is only imported when asked for
+    if name == 'ModelTrainer':
+        from .secure_trainer import ModelTrainer
+        return ModelTrainer
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class MTHGNNTrainer:
@@ -80,6 +47,9 @@ class MTHGNNTrainer:
         # Metrics collector
         self.metrics_collector = MetricsCollector()
 
+        # Cascade first stage, set by distill_first_stage
+        self.first_stage: Optional[FirstStageModel] = None
+
     def _setup_optimizer(self) -> torch.optim.Optimizer:
         """Setup optimizer based on config"""
         optimizer_config = self.config['optimizer']
@@ -277,13 +247,56 @@ class MTHGNNTrainer:
 
         return history
 
+    def distill_first_stage(
+        self,
+        rows: np.ndarray,
+        l2: float = 1e-3
+    ) -> FirstStageModel:
+        """
+        Distill the serving cascade's first stage from the trained model
+
+        The first stage is saved by ``save_checkpoint`` under the
+        ``'cascade'`` key, where the serving registry picks it up.
+
+        Args:
+            rows: Unlabelled sample rows laid out in
+                ``config['feature_schema']`` order
+            l2: Ridge penalty on the first-stage weights
+
+        Raises:
+            ValueError: If the config has no feature schema
+        """
+        schema_config = self.config.get('feature_schema')
+        if not schema_config:
+            raise ValueError(
+                "Distilling a first stage requires config['feature_schema']"
+            )
+
+        was_training = self.model.training
+        self.model.eval()
+        try:
+            self.first_stage = FirstStageModel.distill(
+                self.model,
+                FeatureSchema.from_dict(schema_config),
+                rows,
+                l2=l2
+            )
+        finally:
+            self.model.train(was_training)
+        return self.first_stage
+
     def save_checkpoint(self, path: str):
         """Save model checkpoint"""
         torch.save({
             'model_state_dict': self.model.state_dict(),
             'optimizer_state_dict': self.optimizer.state_dict(),
             'scheduler_state_dict': self.scheduler.state_dict() if self.scheduler else None,
-            'config': self.config
+            'config': self.config,
+            'feature_schema': self.config.get('feature_schema'),
+            'cascade': (
+                self.first_stage.to_dict()
+                if self.first_stage is not None else None
+            )
         }, path)
 
     def load_checkpoint(self, path: str):
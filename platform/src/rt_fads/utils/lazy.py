@@ -0,0 +1,36 @@
+import importlib
+import sys
+import types
+from typing import Optional
+
+
+class LazyModule(types.ModuleType):
+    """Module proxy that imports the real module on first attribute access"""
+
+    def __init__(self, name: str):
+        super().__init__(name)
+        self._module: Optional[types.ModuleType] = None
+
+    def _load(self) -> types.ModuleType:
+        if self._module is None:
+            self._module = importlib.import_module(self.__name__)
+        return self._module
+
+    def __getattr__(self, attr: str):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+
+def lazy_import(name: str) -> types.ModuleType:
+    """
+    Defer importing a heavy optional dependency until it is used
+
+    Returns the module itself if it is already imported, otherwise a proxy
+    that imports it on first attribute access, so ``nx = lazy_import(
+    'networkx')`` at module level costs nothing until ``nx.DiGraph()`` runs.
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    return LazyModule(name)
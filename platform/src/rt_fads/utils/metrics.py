@@ -1,13 +1,6 @@
 import torch
 import numpy as np
 from typing import Dict, Tuple
-from sklearn.metrics import (
-    accuracy_score,
-    precision_score,
-    recall_score,
-    f1_score,
-    roc_auc_score
-)
 
 
 class MetricsCalculator:
@@ -20,6 +13,14 @@ class MetricsCalculator:
         threshold: float = 0.5
     ) -> Dict[str, float]:
         """Calculate multiple metrics"""
+        from sklearn.metrics import (
+            accuracy_score,
+            precision_score,
+            recall_score,
+            f1_score,
+            roc_auc_score
+        )
+
         # Convert to numpy arrays
         if isinstance(y_true, torch.Tensor):
             y_true = y_true.cpu().numpy()
@@ -47,6 +48,8 @@ class MetricsCalculator:
         thresholds: np.ndarray
     ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
         """Calculate metrics at different thresholds"""
+        from sklearn.metrics import precision_score, recall_score, f1_score
+
         precisions = []
         recalls = []
         f1_scores = []
@@ -1,20 +1,22 @@
-from prometheus_client import Counter, Histogram, start_http_server
 import time
+from .lazy import lazy_import
+
+prom = lazy_import('prometheus_client')
 
 
 class MetricsCollector:
     """System metrics collector"""
 
     def __init__(self):
-        self.prediction_counter = Counter(
+        self.prediction_counter = prom.Counter(
             'rt_fads_predictions_total',
             'Total number of fraud predictions'
         )
-        self.prediction_latency = Histogram(
+        self.prediction_latency = prom.Histogram(
             'rt_fads_prediction_latency_seconds',
             'Prediction latency in seconds'
         )
-        self.fraud_detected = Counter(
+        self.fraud_detected = prom.Counter(
             'rt_fads_fraud_detected_total',
             'Total number of detected fraud cases'
         )
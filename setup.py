@@ -10,7 +10,7 @@ setup(
     package_dir={"": "src"},
     install_requires=[
         "secretflow>=1.0.0",
-        "torch>=2.0.0",
+        "torch>=2.1.0",
         "numpy>=1.20.0",
         "pandas>=1.3.0",
         "scikit-learn>=1.0.0"
@@ -0,0 +1,54 @@
+from rt_fads.serving.admission import Admission, AdmissionController
+
+
+def test_admission_follows_deadline():
+    """Test requests are accepted, degraded or shed against their deadline"""
+    controller = AdmissionController(concurrency=2, smoothing=1.0)
+    controller.observe_scoring(0.010)
+    controller.observe_explanation(0.020)
+
+    assert controller.admit(50).admission == Admission.ACCEPT
+    # One request in flight: 10ms * (1 + 1/2) = 15ms to score
+    assert controller.admit(20).admission == Admission.DEGRADE
+    # Two in flight: 20ms to score
+    decision = controller.admit(10)
+    assert decision.admission == Admission.REJECT
+    assert decision.reason == 'deadline'
+    assert controller.in_flight == 2
+
+
+def test_admission_caps_in_flight():
+    """Test requests above the in-flight cap are rejected and released"""
+    controller = AdmissionController(max_in_flight=2)
+
+    decisions = [controller.admit() for _ in range(3)]
+
+    assert [d.admission for d in decisions] == [
+        Admission.ACCEPT, Admission.ACCEPT, Admission.REJECT
+    ]
+    assert decisions[-1].reason == 'overload'
+    controller.release()
+    assert controller.admit().admission == Admission.ACCEPT
+
+
+def test_admission_counts_batch_rows():
+    """Test batches hold one in-flight slot per row"""
+    controller = AdmissionController(
+        max_in_flight=10,
+        concurrency=4,
+        smoothing=1.0
+    )
+    controller.observe_scoring(0.010)
+
+    # Eight rows need two rounds of four
+    assert controller.estimated_delay(rows=8) == 0.020
+    assert controller.admit(rows=8).admission == Admission.ACCEPT
+    assert controller.in_flight == 8
+    assert controller.admit(rows=3).reason == 'overload'
+    assert controller.admit(rows=2).admission == Admission.ACCEPT
+    controller.release(8)
+    controller.release(2)
+
+    # An idle server still admits a batch larger than the whole budget
+    assert controller.admit(rows=50).admission == Admission.ACCEPT
+    assert controller.admit().reason == 'overload'
@@ -0,0 +1,100 @@
+import asyncio
+import pytest
+from rt_fads.serving.batching import MicroBatcher
+
+
+def test_concurrent_requests_are_batched():
+    """Test concurrent submissions share one forward pass"""
+    batch_sizes = []
+
+    def infer(items):
+        batch_sizes.append(len(items))
+        return [item * 2 for item in items]
+
+    async def run():
+        batcher = MicroBatcher(infer, max_batch_size=8, max_wait_ms=50)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                *(batcher.submit(i) for i in range(20))
+            )
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+
+    assert results == [i * 2 for i in range(20)]
+    assert max(batch_sizes) == 8
+    assert sum(batch_sizes) == 20
+
+
+def test_requests_within_max_wait_are_coalesced():
+    """Test spaced arrivals inside the wait window share one batch"""
+    batch_sizes = []
+
+    def infer(items):
+        batch_sizes.append(len(items))
+        return items
+
+    async def submit_later(batcher, i):
+        await asyncio.sleep(0.005 * i)
+        return await batcher.submit(i)
+
+    async def run():
+        batcher = MicroBatcher(infer, max_batch_size=32, max_wait_ms=100)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                *(submit_later(batcher, i) for i in range(5))
+            )
+        finally:
+            await batcher.stop()
+
+    assert asyncio.run(run()) == list(range(5))
+    assert batch_sizes == [5]
+
+
+def test_wait_window_has_a_floor():
+    """Test single-request batches shrink the window only to its floor"""
+    batcher = MicroBatcher(
+        lambda items: items,
+        max_batch_size=32,
+        max_wait_ms=2.0,
+        min_wait_fraction=0.25
+    )
+    assert batcher._wait_window() == pytest.approx(0.002)
+
+    batcher._avg_fill = 1.0
+    assert batcher._wait_window() == pytest.approx(0.0005)
+
+    batcher._avg_fill = 3.0
+    assert batcher._wait_window() == pytest.approx(0.002)
+
+
+def test_batch_errors_propagate_to_callers():
+    """Test a failing forward pass fails every request in the batch"""
+    def infer(items):
+        raise ValueError("bad batch")
+
+    async def run():
+        batcher = MicroBatcher(infer, max_batch_size=4, max_wait_ms=1)
+        batcher.start()
+        try:
+            return await asyncio.gather(
+                *(batcher.submit(i) for i in range(3)),
+                return_exceptions=True
+            )
+        finally:
+            await batcher.stop()
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, ValueError) for r in results)
+
+
+def test_submit_requires_running_batcher():
+    """Test submitting before start is rejected"""
+    batcher = MicroBatcher(lambda items: items)
+
+    with pytest.raises(RuntimeError):
+        asyncio.run(batcher.submit(1))
@@ -0,0 +1,116 @@
+import warnings
+import pytest
+import numpy as np
+import torch
+from rt_fads.features.schema import FeatureSchema
+from rt_fads.serving.cascade import CascadeScorer, FirstStageModel
+from rt_fads.training import trainer as trainer_module
+
+
+class LinearModel(torch.nn.Module):
+    """Stand-in full model that is exactly linear"""
+
+    def __init__(self, width: int):
+        super().__init__()
+        self.linear = torch.nn.Linear(width, 1)
+
+    def forward(self, features, scene_info=None, temporal_info=None):
+        return self.linear(
+            torch.cat([features, scene_info, temporal_info], dim=1)
+        )
+
+
+def test_distill_recovers_linear_model():
+    """Test distillation reproduces a linear full model"""
+    torch.manual_seed(0)
+    schema = FeatureSchema(['amount', 'merchant_id'], ['location'], ['hour'])
+    model = LinearModel(schema.width)
+    rows = np.random.default_rng(0).standard_normal(
+        (500, schema.width)
+    ).astype(np.float32)
+
+    first_stage = FirstStageModel.distill(model, schema, rows, l2=0.0)
+
+    np.testing.assert_allclose(
+        first_stage.weights,
+        model.linear.weight.detach().numpy()[0],
+        atol=1e-4
+    )
+    restored = FirstStageModel.from_dict(first_stage.to_dict())
+    np.testing.assert_allclose(restored.predict(rows),
+                               first_stage.predict(rows))
+
+
+def test_cascade_escalates_uncertain_rows():
+    """Test only rows at or above the band reach the full model"""
+    first_stage = FirstStageModel(np.array([1.0], dtype=np.float32), 0.0)
+    cascade = CascadeScorer(first_stage, band=0.2)
+    # First-stage probabilities: ~0.05, ~0.38, 0.5, ~0.95
+    rows = np.array([[-3.0], [-0.5], [0.0], [3.0]], dtype=np.float32)
+    seen = []
+
+    def full_fn(subset):
+        seen.append(subset.copy())
+        return np.full(len(subset), 0.9, dtype=np.float32)
+
+    fraud_probs, escalated = cascade.score(rows, full_fn)
+
+    assert escalated.tolist() == [False, True, True, True]
+    np.testing.assert_array_equal(seen[0], rows[1:])
+    assert fraud_probs[0] < 0.1
+    np.testing.assert_allclose(fraud_probs[1:], 0.9)
+
+
+def test_cascade_rejects_invalid_band():
+    """Test bands outside [0, 0.5] are refused"""
+    with pytest.raises(ValueError):
+        CascadeScorer(FirstStageModel(np.zeros(1), 0.0), band=0.6)
+
+
+def test_predict_is_stable_for_extreme_logits():
+    """Test large logits of either sign saturate without overflow"""
+    first_stage = FirstStageModel(np.array([1.0], dtype=np.float32), 0.0)
+    rows = np.array([[-1e4], [-50.0], [0.0], [50.0], [1e4]],
+                    dtype=np.float32)
+
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        probs = first_stage.predict(rows)
+
+    assert probs[0] == 0.0 and probs[-1] == 1.0
+    np.testing.assert_allclose(
+        probs[1:4],
+        [1 / (1 + np.exp(50.0)), 0.5, 1 / (1 + np.exp(-50.0))]
+    )
+
+
+def test_trainer_checkpoint_exports_first_stage(tmp_path, monkeypatch):
+    """Test trainer checkpoints carry the first stage serving loads"""
+    monkeypatch.setattr(trainer_module, 'MetricsCollector', lambda: None)
+    torch.manual_seed(0)
+    schema = FeatureSchema(['amount', 'merchant_id'], ['location'], ['hour'])
+    model = LinearModel(schema.width)
+    trainer = trainer_module.MTHGNNTrainer(
+        model,
+        {
+            'optimizer': {
+                'type': 'adam',
+                'learning_rate': 1e-3,
+                'weight_decay': 0.0
+            },
+            'feature_schema': schema.to_dict()
+        },
+        device=torch.device('cpu')
+    )
+    rows = np.random.default_rng(0).standard_normal(
+        (200, schema.width)
+    ).astype(np.float32)
+
+    first_stage = trainer.distill_first_stage(rows, l2=0.0)
+    path = str(tmp_path / 'model.pt')
+    trainer.save_checkpoint(path)
+
+    assert model.training
+    restored = FirstStageModel.from_checkpoint(path)
+    np.testing.assert_allclose(restored.predict(rows),
+                               first_stage.predict(rows))
@@ -0,0 +1,231 @@
+import json
+from types import SimpleNamespace
+import numpy as np
+import pytest
+import torch
+from fastapi.testclient import TestClient
+from rt_fads.api import server
+from rt_fads.features.schema import FeatureSchema
+from rt_fads.serving.admission import AdmissionController
+from rt_fads.serving.columnar import decode_columnar
+from rt_fads.serving.executor import InferenceExecutor
+from rt_fads.serving.registry import ModelRegistry
+
+SCHEMA = FeatureSchema(['amount', 'balance'], ['location'], ['hour'])
+
+PAYLOAD = {
+    'transaction_ids': ['t1', 't2', 't3'],
+    'features': {'balance': [10.0, 20.0, 30.0], 'amount': [1, 2, 3]},
+    'scene_info': {'location': [0.5, 0.25, 0.0]},
+    'temporal_info': {'hour': [9, 13, 23]}
+}
+
+
+class NullCollector:
+    """Metrics collector discarding every record"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+class ConstantModel(torch.nn.Module):
+    """Stand-in model returning a zero logit"""
+
+    def forward(self, features, scene_info=None, temporal_info=None):
+        return torch.zeros(len(features), 1)
+
+
+class FirstColumnModel(torch.nn.Module):
+    """Stand-in model using its first feature column as the logit"""
+
+    def forward(self, features, scene_info=None, temporal_info=None):
+        return features[:, :1]
+
+
+def _assert_decoded(batch):
+    assert batch.transaction_ids == ['t1', 't2', 't3']
+    assert batch.columns == SCHEMA.columns
+    assert batch.features.dtype == np.float32
+    np.testing.assert_array_equal(
+        batch.features,
+        [[1, 10], [2, 20], [3, 30]]
+    )
+    np.testing.assert_array_equal(batch.scene_info, [[0.5], [0.25], [0]])
+    np.testing.assert_array_equal(batch.temporal_info, [[9], [13], [23]])
+
+
+def test_decode_json_and_msgpack():
+    """Test mapping payloads are laid out in schema order"""
+    _assert_decoded(decode_columnar(
+        json.dumps(PAYLOAD).encode(),
+        'application/json; charset=utf-8',
+        schema=SCHEMA
+    ))
+
+    msgpack = pytest.importorskip('msgpack')
+    _assert_decoded(decode_columnar(
+        msgpack.packb(PAYLOAD),
+        'application/msgpack',
+        schema=SCHEMA
+    ))
+
+
+def test_decode_arrow():
+    """Test Arrow streams with block-prefixed columns"""
+    pa = pytest.importorskip('pyarrow')
+    columns = {'transaction_id': PAYLOAD['transaction_ids']}
+    for block in ('features', 'scene_info', 'temporal_info'):
+        for name, values in PAYLOAD[block].items():
+            columns[f'{block}.{name}'] = values
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    _assert_decoded(decode_columnar(
+        sink.getvalue().to_pybytes(),
+        'application/vnd.apache.arrow.stream',
+        schema=SCHEMA
+    ))
+
+    columns['features.amount'] = [1.0, None, 3.0]
+    table = pa.table(columns)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    with pytest.raises(ValueError, match='missing'):
+        decode_columnar(
+            sink.getvalue().to_pybytes(),
+            'application/vnd.apache.arrow.stream'
+        )
+
+
+@pytest.mark.parametrize('cell', [None, 'abc', [1.0], {'a': 1}])
+def test_decode_rejects_non_numeric_cells(cell):
+    """Test missing and non-numeric cells are malformed payloads"""
+    payload = json.loads(json.dumps(PAYLOAD))
+    payload['features']['amount'][1] = cell
+
+    with pytest.raises(ValueError, match='features.amount'):
+        decode_columnar(json.dumps(payload).encode(), 'application/json')
+
+
+def test_decode_rejects_unknown_content_type():
+    """Test unsupported media types are reported as such"""
+    with pytest.raises(NotImplementedError):
+        decode_columnar(b'', 'text/csv')
+
+
+@pytest.fixture
+def serve(tmp_path, monkeypatch):
+    """Serve a checkpoint with a stand-in model through the app"""
+    started = []
+
+    def serve(checkpoint: dict, model: torch.nn.Module) -> TestClient:
+        path = str(tmp_path / 'v1.pt')
+        torch.save(checkpoint, path)
+        registry = ModelRegistry(
+            lambda checkpoint: model,
+            warmup_batch_sizes=[1]
+        )
+        registry.load(path)
+        executor = InferenceExecutor(num_workers=1, intra_op_threads=None)
+        started.append((registry, executor))
+        monkeypatch.setattr(server, 'registry', registry)
+        monkeypatch.setattr(server, 'executor', executor)
+        monkeypatch.setattr(server, 'metrics_collector', NullCollector())
+        monkeypatch.setattr(server, 'serving_config', {'max_batch_rows': 3})
+        monkeypatch.setattr(
+            server,
+            'admission',
+            AdmissionController(max_in_flight=4)
+        )
+        return TestClient(server.app)
+
+    yield serve
+    for registry, executor in started:
+        executor.shutdown()
+        registry.shutdown()
+
+
+@pytest.fixture
+def client(serve):
+    return serve({'feature_schema': SCHEMA.to_dict()}, ConstantModel())
+
+
+def test_predict_batch_route(client):
+    """Test the batch route scores and reports malformed payloads"""
+    response = client.post('/predict/batch', json=PAYLOAD)
+    assert response.status_code == 200
+    predictions = response.json()['predictions']
+    assert [p['transaction_id'] for p in predictions] == ['t1', 't2', 't3']
+    assert all(p['fraud_probability'] == 0.5 for p in predictions)
+
+    payload = json.loads(json.dumps(PAYLOAD))
+    payload['features']['amount'][0] = None
+    assert client.post('/predict/batch', json=payload).status_code == 400
+
+    payload = json.loads(json.dumps(PAYLOAD))
+    payload['transaction_ids'].append('t4')
+    for block in ('features', 'scene_info', 'temporal_info'):
+        for values in payload[block].values():
+            values.append(0.0)
+    assert client.post('/predict/batch', json=payload).status_code == 413
+
+    response = client.post(
+        '/predict/batch',
+        content=b'a,b',
+        headers={'content-type': 'text/csv'}
+    )
+    assert response.status_code == 415
+
+
+def test_predict_batch_pins_inferred_schema(serve):
+    """Test reordered keys cannot swap columns without a saved schema"""
+    client = serve({}, FirstColumnModel())
+
+    first = client.post('/predict/batch', json=PAYLOAD)
+    payload = json.loads(json.dumps(PAYLOAD))
+    payload['features'] = {
+        'amount': PAYLOAD['features']['amount'],
+        'balance': PAYLOAD['features']['balance']
+    }
+    second = client.post('/predict/batch', json=payload)
+
+    assert first.status_code == second.status_code == 200
+    assert (
+        [p['fraud_probability'] for p in first.json()['predictions']]
+        == [p['fraud_probability'] for p in second.json()['predictions']]
+    )
+    # The first payload's order ('balance' first) is the pinned layout
+    assert server.registry.current.feature_schema.columns['features'] == [
+        'balance', 'amount'
+    ]
+
+    payload['features']['extra'] = [0.0, 0.0, 0.0]
+    assert client.post('/predict/batch', json=payload).status_code == 400
+
+
+def test_predict_batch_is_shed_under_load(client):
+    """Test batch rows count against the shared in-flight budget"""
+    # Two single predictions in flight leave room for two more rows
+    server.admission.admit()
+    server.admission.admit()
+
+    response = client.post('/predict/batch', json=PAYLOAD)
+    assert response.status_code == 503
+    assert 'overload' in response.json()['detail']
+    assert response.headers['Retry-After'] == '1'
+
+    server.admission.release()
+    server.admission.release()
+    delays = []
+    server.admission.metrics_collector = SimpleNamespace(
+        record_admission=lambda *args: None,
+        set_in_flight=lambda in_flight: None,
+        record_queue_delay=delays.append
+    )
+    assert client.post('/predict/batch', json=PAYLOAD).status_code == 200
+    assert server.admission.in_flight == 0
+    # The measured wait for the executor, not an estimate
+    assert len(delays) == 1 and 0 <= delays[0] < 1
@@ -0,0 +1,69 @@
+import asyncio
+import threading
+import time
+import torch
+from rt_fads.serving.executor import InferenceExecutor
+
+
+def test_run_executes_off_the_event_loop():
+    """Test calls run on a worker thread and return their result"""
+    async def run():
+        executor = InferenceExecutor(num_workers=2, intra_op_threads=None)
+        try:
+            return await executor.run(
+                lambda x, scale: (threading.current_thread().name, x * scale),
+                3,
+                scale=2
+            )
+        finally:
+            executor.shutdown()
+
+    thread_name, result = asyncio.run(run())
+
+    assert thread_name.startswith('rt-fads-inference')
+    assert result == 6
+
+
+def test_in_flight_calls_are_bounded():
+    """Test at most max_in_flight calls are admitted at once"""
+    peak = 0
+    active = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal peak, active
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        time.sleep(0.01)
+        with lock:
+            active -= 1
+
+    async def run():
+        executor = InferenceExecutor(
+            num_workers=8,
+            intra_op_threads=None,
+            max_in_flight=3
+        )
+        try:
+            await asyncio.gather(*(executor.run(work) for _ in range(20)))
+            return executor.in_flight
+        finally:
+            executor.shutdown()
+
+    assert asyncio.run(run()) == 0
+    assert peak == 3
+
+
+def test_intra_op_threads_is_process_wide():
+    """Test the intra-op setting applies to the whole process"""
+    previous = torch.get_num_threads()
+    try:
+        executor = InferenceExecutor.from_config({
+            'inference_workers': 2,
+            'intra_op_threads': 1
+        })
+        assert torch.get_num_threads() == 1
+        executor.shutdown()
+    finally:
+        torch.set_num_threads(previous)
@@ -0,0 +1,31 @@
+import time
+from rt_fads.serving.explanations import DeferredExplainer, ExplanationStore
+
+
+def test_store_evicts_oldest_and_expired_entries():
+    """Test size bound and TTL eviction"""
+    store = ExplanationStore(max_entries=2, ttl_seconds=0.05)
+    store.put('t1', ExplanationStore.READY, {'amount': 0.5})
+    store.put('t2', ExplanationStore.READY, {'amount': 0.1})
+    store.put('t3', ExplanationStore.PENDING)
+
+    assert store.get('t1') is None
+    assert store.get('t2')['explanation'] == {'amount': 0.1}
+
+    time.sleep(0.1)
+    assert store.get('t3') is None
+    assert len(store) == 0
+
+
+def test_deferred_explainer_stores_results():
+    """Test background explanations land in the store"""
+    explainer = DeferredExplainer(ExplanationStore(), max_pending=10)
+
+    assert explainer.submit('t1', lambda x: {'amount': x}, 0.25)
+    assert explainer.submit('t2', lambda: 1 / 0)
+    explainer.shutdown()
+
+    entry = explainer.store.get('t1')
+    assert entry['status'] == ExplanationStore.READY
+    assert entry['explanation'] == {'amount': 0.25}
+    assert explainer.store.get('t2')['status'] == ExplanationStore.FAILED
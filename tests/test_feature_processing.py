@@ -0,0 +1,110 @@
+import sys
+import numpy as np
+import pandas as pd
+import pytest
+from rt_fads.data.preprocessing import FeatureProcessor, read_parquet_chunks
+
+CONFIG = {
+    'numerical_features': ['amount', 'balance'],
+    'categorical_features': ['category', 'channel'],
+    'account_features': ['source'],
+    'scene_features': ['scene'],
+    'timestamp_col': 'timestamp'
+}
+
+
+def _transactions(num_rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'amount': rng.lognormal(4.0, 1.5, num_rows),
+        'balance': rng.normal(1e6, 1e3, num_rows),
+        'category': rng.choice(['food', 'travel', 'fuel', 'misc'],
+                               num_rows),
+        'channel': rng.integers(0, 5, num_rows),
+        'source': rng.integers(0, 300, num_rows),
+        'scene': rng.integers(0, 3, num_rows),
+        'timestamp': pd.Timestamp('2024-01-01') + pd.to_timedelta(
+            rng.integers(0, 90 * 86400, num_rows), unit='s'
+        ),
+        'prev_timestamp': pd.Timestamp('2023-12-31'),
+        'node_in_degree': rng.integers(0, 10, num_rows),
+        'node_out_degree': rng.integers(0, 10, num_rows),
+        'clustering_coef': rng.random(num_rows),
+        'pagerank': rng.random(num_rows)
+    })
+
+
+def _chunks(data: pd.DataFrame, size: int):
+    for offset in range(0, len(data), size):
+        yield data.iloc[offset:offset + size]
+
+
+def test_chunked_fit_matches_full_fit(tmp_path):
+    """Test chunked fit and on-disk transform match fit_transform"""
+    data = _transactions(5000)
+    full = FeatureProcessor(CONFIG)
+    expected, _ = full.fit_transform(data)
+
+    chunked = FeatureProcessor(CONFIG).fit(_chunks(data, 333))
+    assert chunked.num_rows == len(data)
+    scaler = chunked.scalers['numerical']
+    np.testing.assert_allclose(scaler.mean_, full.scalers['numerical'].mean_)
+    np.testing.assert_allclose(scaler.var_, full.scalers['numerical'].var_)
+    for col in CONFIG['categorical_features']:
+        np.testing.assert_array_equal(
+            chunked.encoders[col].classes_,
+            full.encoders[col].classes_
+        )
+
+    path = str(tmp_path / 'features.npy')
+    features = chunked.transform_to_file(_chunks(data, 700), path)
+    assert features.dtype == np.float32
+    assert features.shape == tuple(expected.shape)
+    np.testing.assert_allclose(features, expected.numpy(), rtol=1e-6)
+    np.testing.assert_array_equal(np.load(path, mmap_mode='r'), features)
+    assert chunked.feature_names == full.feature_names
+
+
+def test_transform_to_file_checks_row_count(tmp_path):
+    """Test a row count mismatch fails without leaving a partial file"""
+    data = _transactions(1000)
+    processor = FeatureProcessor(CONFIG).fit(_chunks(data, 250))
+    path = tmp_path / 'features.npy'
+
+    with pytest.raises(ValueError):
+        processor.transform_to_file(_chunks(data.iloc[:900], 250), str(path))
+    with pytest.raises(ValueError):
+        processor.transform_to_file(
+            _chunks(data, 250),
+            str(path),
+            num_rows=800
+        )
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_fit_from_parquet_row_groups(tmp_path):
+    """Test fitting on Parquet row groups"""
+    pytest.importorskip('pyarrow')
+    data = _transactions(2000, seed=1)
+    path = str(tmp_path / 'transactions.parquet')
+    data.to_parquet(path, row_group_size=300)
+
+    chunks = list(read_parquet_chunks(path))
+    assert len(chunks) == 7
+    processor = FeatureProcessor(CONFIG).fit(read_parquet_chunks(path))
+
+    full = FeatureProcessor(CONFIG)
+    full.fit_transform(data)
+    np.testing.assert_allclose(
+        processor.scalers['numerical'].mean_,
+        full.scalers['numerical'].mean_
+    )
+    assert len(processor.interner) == data['source'].nunique()
+
+
+def test_parquet_without_pyarrow(monkeypatch):
+    """Test a missing pyarrow is reported as a missing dependency"""
+    monkeypatch.setitem(sys.modules, 'pyarrow.parquet', None)
+
+    with pytest.raises(ImportError, match='pyarrow'):
+        next(read_parquet_chunks('transactions.parquet'))
@@ -0,0 +1,73 @@
+import pytest
+import numpy as np
+import torch
+from rt_fads.features.schema import FeatureSchema
+
+
+@pytest.fixture
+def schema():
+    return FeatureSchema(
+        features=['amount', 'merchant_id'],
+        scene_info=['location'],
+        temporal_info=['hour', 'day_of_week']
+    )
+
+
+def test_vectorize_is_independent_of_key_order(schema):
+    """Test columns are placed by name, not by dict order"""
+    blocks = {
+        'features': {'merchant_id': 7.0, 'amount': 120.5},
+        'scene_info': {'location': 3.0},
+        'temporal_info': {'day_of_week': 2.0, 'hour': 14.0}
+    }
+
+    row = schema.vectorize(blocks)
+
+    assert row.dtype == np.float32
+    np.testing.assert_array_equal(row, [120.5, 7.0, 3.0, 14.0, 2.0])
+
+
+def test_vectorize_rejects_missing_and_unknown_keys(schema):
+    """Test validation of input keys"""
+    blocks = {
+        'features': {'amount': 1.0, 'merchnt_id': 2.0},
+        'scene_info': {'location': 3.0},
+        'temporal_info': {'hour': 1.0, 'day_of_week': 2.0}
+    }
+
+    with pytest.raises(ValueError, match="merchant_id"):
+        schema.vectorize(blocks)
+
+    blocks['features'] = {'amount': 1.0}
+    with pytest.raises(ValueError, match="missing"):
+        schema.vectorize(blocks)
+
+
+def test_vectorize_fills_preallocated_buffer(schema):
+    """Test vectorization writes into a caller-provided buffer"""
+    out = np.zeros((2, schema.width), dtype=np.float32)
+    blocks = {
+        'features': {'amount': 1.0, 'merchant_id': 2.0},
+        'scene_info': {'location': 3.0},
+        'temporal_info': {'hour': 4.0, 'day_of_week': 5.0}
+    }
+
+    result = schema.vectorize(blocks, out=out[1])
+
+    assert np.shares_memory(result, out)
+    np.testing.assert_array_equal(out[1], [1.0, 2.0, 3.0, 4.0, 5.0])
+
+
+def test_split_and_checkpoint_roundtrip(schema, tmp_path):
+    """Test block split and schema persistence in a checkpoint"""
+    path = tmp_path / 'model.pt'
+    torch.save({'feature_schema': schema.to_dict()}, path)
+    loaded = FeatureSchema.from_checkpoint(str(path))
+
+    rows = torch.arange(10, dtype=torch.float32).view(2, 5)
+    features, scene_info, temporal_info = loaded.split(rows)
+
+    assert loaded.columns == schema.columns
+    assert features.shape == (2, 2)
+    assert scene_info.shape == (2, 1)
+    assert temporal_info.shape == (2, 2)
@@ -0,0 +1,165 @@
+import numpy as np
+import pandas as pd
+import pytest
+import networkx as nx
+import torch
+from rt_fads.data.graph_builder import GraphBuilder
+
+CONFIG = {
+    'source_col': 'source',
+    'target_col': 'target',
+    'amount_col': 'amount',
+    'timestamp_col': 'timestamp',
+    'edge_features': ['channel']
+}
+
+
+def reference_graph(data: pd.DataFrame):
+    """Row-by-row NetworkX construction the builder must match"""
+    graph = nx.DiGraph()
+    for _, row in data.iterrows():
+        timestamp = pd.to_datetime(row['timestamp'])
+        graph.add_edge(row['source'], row['target'], features=[
+            row['amount'], timestamp.hour, timestamp.day_of_week,
+            timestamp.day, timestamp.month, row['channel']
+        ])
+    edges = list(graph.edges())
+    return list(graph.nodes()), edges, np.array(
+        [graph[s][t]['features'] for s, t in edges],
+        dtype=np.float32
+    )
+
+
+def _transactions(num_rows: int, num_accounts: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'source': rng.integers(0, num_accounts, num_rows) * 7 + 1000,
+        'target': rng.integers(0, num_accounts, num_rows) * 7 + 1000,
+        'amount': rng.exponential(100.0, num_rows),
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            rng.integers(0, 30 * 86400, num_rows), unit='s'
+        ),
+        'channel': rng.integers(0, 3, num_rows)
+    })
+
+
+def test_build_graph_matches_networkx():
+    """Test edge order, deduplication and features match NetworkX"""
+    data = _transactions(500, 30)
+    builder = GraphBuilder(CONFIG)
+
+    edge_index, edge_attr = builder.build_graph(data)
+
+    nodes, edges, features = reference_graph(data)
+    accounts = builder.node_ids[edge_index.numpy()]
+    assert list(zip(accounts[0], accounts[1])) == edges
+    np.testing.assert_allclose(edge_attr.numpy(), features, rtol=1e-6)
+    assert list(builder.node_ids) == nodes
+
+
+def test_build_graph_factorizes_string_accounts():
+    """Test account IDs become contiguous node IDs"""
+    data = pd.DataFrame({
+        'source': ['acc-b', 'acc-a', 'acc-b'],
+        'target': ['acc-a', 'acc-c', 'acc-a'],
+        'amount': [10.0, 20.0, 30.0],
+        'timestamp': pd.to_datetime(['2024-01-01'] * 3),
+        'channel': [0, 1, 2]
+    })
+    builder = GraphBuilder(CONFIG)
+
+    edge_index, edge_attr = builder.build_graph(data)
+
+    assert list(builder.node_ids) == ['acc-b', 'acc-a', 'acc-c']
+    assert edge_index.tolist() == [[0, 1], [1, 2]]
+    assert edge_attr[:, 0].tolist() == [30.0, 20.0]
+    assert edge_attr.dtype == torch.float32
+
+
+def test_multi_mode_keeps_every_transaction():
+    """Test multi mode emits one edge per transaction"""
+    data = _transactions(200, 5)
+    builder = GraphBuilder({**CONFIG, 'edge_mode': 'multi'})
+
+    edge_index, edge_attr = builder.build_graph(data)
+
+    assert edge_index.shape[1] == len(data) == builder.num_transactions
+    accounts = builder.node_ids[edge_index.numpy()]
+    np.testing.assert_allclose(
+        np.sort(edge_attr[:, 0].numpy()),
+        np.sort(data['amount'].to_numpy(np.float32))
+    )
+    assert np.all(np.diff(edge_index[0].numpy()) >= 0)
+    assert set(zip(accounts[0], accounts[1])) == set(
+        zip(data['source'], data['target'])
+    )
+
+
+def test_aggregate_mode_matches_groupby():
+    """Test aggregate features match a pandas groupby"""
+    data = _transactions(300, 6)
+    builder = GraphBuilder({**CONFIG, 'edge_mode': 'aggregate'})
+
+    edge_index, edge_attr = builder.build_graph(data)
+
+    expected = data.groupby(['source', 'target'], sort=False).agg(
+        count=('amount', 'size'),
+        amount_sum=('amount', 'sum'),
+        amount_min=('amount', 'min'),
+        amount_max=('amount', 'max'),
+        amount_last=('amount', 'last'),
+        first=('timestamp', 'min'),
+        last=('timestamp', 'max')
+    )
+    expected['time_span'] = (
+        expected['last'] - expected['first']
+    ).dt.total_seconds()
+
+    accounts = builder.node_ids[edge_index.numpy()]
+    expected = expected.loc[list(zip(accounts[0], accounts[1]))]
+    assert builder.edge_feature_names == [
+        'count', 'amount_sum', 'amount_min', 'amount_max', 'amount_last',
+        'time_span'
+    ]
+    np.testing.assert_allclose(
+        edge_attr.numpy(),
+        expected[builder.edge_feature_names].to_numpy(np.float32),
+        rtol=1e-5
+    )
+    assert edge_attr[:, 0].sum() == len(data)
+
+
+def test_mixed_format_timestamps_parse_per_value():
+    """Test timestamp strings in mixed formats parse like row by row"""
+    data = _transactions(200, 10)
+    formats = ['%Y-%m-%d %H:%M:%S', '%Y/%m/%d %H:%M', '%d %B %Y %H:%M:%S']
+    data['timestamp'] = [
+        timestamp.strftime(formats[i % len(formats)])
+        for i, timestamp in enumerate(data['timestamp'])
+    ]
+
+    builder = GraphBuilder(CONFIG)
+    edge_index, edge_attr = builder.build_graph(data)
+
+    _, edges, features = reference_graph(data)
+    accounts = builder.node_ids[edge_index.numpy()]
+    assert list(zip(accounts[0], accounts[1])) == edges
+    np.testing.assert_allclose(edge_attr.numpy(), features, rtol=1e-6)
+
+    aggregate = GraphBuilder({**CONFIG, 'edge_mode': 'aggregate'})
+    _, edge_attr = aggregate.build_graph(data)
+    assert (edge_attr[:, -1] >= 0).all()
+
+
+@pytest.mark.parametrize('edge_mode', GraphBuilder.EDGE_MODES)
+def test_empty_input_builds_empty_graph(edge_mode):
+    """Test every edge mode handles a frame without transactions"""
+    data = _transactions(10, 5).iloc[:0]
+    builder = GraphBuilder({**CONFIG, 'edge_mode': edge_mode})
+
+    edge_index, edge_attr = builder.build_graph(data)
+
+    assert tuple(edge_index.shape) == (2, 0)
+    assert tuple(edge_attr.shape) == (0, len(builder.edge_feature_names))
+    assert len(builder.node_ids) == 0
+    assert len(builder.edge_timestamps) == 0
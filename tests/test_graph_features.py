@@ -0,0 +1,181 @@
+import numpy as np
+import pandas as pd
+import networkx as nx
+import torch
+from rt_fads.data.graph_builder import GraphBuilder
+from rt_fads.data.graph_features import (
+    GraphFeatures,
+    IncrementalGraphFeatures,
+    clustering,
+    pagerank
+)
+from rt_fads.data.graph_store import IncrementalGraphStore
+
+
+def _edges(num_nodes: int, num_edges: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    return rng.integers(0, num_nodes, (2, num_edges))
+
+
+def _digraph(edges: np.ndarray, num_nodes: int) -> nx.DiGraph:
+    graph = nx.DiGraph()
+    graph.add_nodes_from(range(num_nodes))
+    graph.add_edges_from(edges.T.tolist())
+    return graph
+
+
+def test_pagerank_matches_networkx():
+    """Test power iteration matches NetworkX including dangling nodes"""
+    num_nodes = 300
+    edges = np.unique(_edges(num_nodes, 900), axis=1)
+
+    ranks, iterations = pagerank(edges, num_nodes, tol=1e-10)
+
+    expected = nx.pagerank(_digraph(edges, num_nodes), tol=1e-10)
+    np.testing.assert_allclose(
+        ranks,
+        [expected[n] for n in range(num_nodes)],
+        atol=1e-9
+    )
+    assert abs(ranks.sum() - 1) < 1e-9
+    assert iterations > 1
+
+
+def test_clustering_matches_networkx():
+    """Test exact and sampled clustering against NetworkX"""
+    num_nodes = 200
+    edges = _edges(num_nodes, 2000, seed=1)
+    expected = nx.clustering(_digraph(edges, num_nodes).to_undirected())
+    expected = np.array([expected[n] for n in range(num_nodes)])
+
+    exact = clustering(edges, num_nodes, max_wedges=10 ** 6)
+    np.testing.assert_allclose(exact, expected, atol=1e-12)
+
+    sampled = clustering(
+        edges,
+        num_nodes,
+        max_wedges=2000,
+        rng=np.random.default_rng(0)
+    )
+    assert np.abs(sampled - expected).max() < 0.05
+
+
+def test_features_keyed_by_account_and_warm_started():
+    """Test results are indexed by account and reuse previous ranks"""
+    rng = np.random.default_rng(2)
+    data = pd.DataFrame({
+        'source': rng.integers(0, 500, 3000) * 3 + 7,
+        'target': rng.integers(0, 500, 3000) * 3 + 7,
+        'amount': rng.exponential(100.0, 3000)
+    })
+    config = {
+        'source_col': 'source',
+        'target_col': 'target',
+        'amount_col': 'amount',
+        'pagerank_tol': 1e-9
+    }
+    builder = GraphBuilder(config)
+    builder.build_graph(data.iloc[:2900])
+    features = GraphFeatures(config)
+
+    cold = features.compute(builder.edge_index, builder.node_ids)
+    cold_iterations = features.pagerank_iterations
+    assert list(cold.index) == list(builder.node_ids)
+    out_degree = data.iloc[:2900].drop_duplicates(
+        ['source', 'target']
+    )['source'].value_counts()
+    np.testing.assert_array_equal(
+        cold.loc[out_degree.index, 'out_degree'],
+        out_degree
+    )
+
+    builder.build_graph(data)
+    warm = features.compute(builder.edge_index, builder.node_ids)
+    assert features.pagerank_iterations < cold_iterations
+    ranks, _ = pagerank(
+        builder.edge_index.numpy(),
+        len(builder.node_ids),
+        tol=1e-9
+    )
+    np.testing.assert_allclose(warm['pagerank'], ranks, atol=1e-7)
+
+
+def test_builder_graph_features_by_node():
+    """Test GraphBuilder features stay ordered by node ID"""
+    edges = torch.tensor([[0, 1, 2, 2], [1, 2, 0, 1]])
+    builder = GraphBuilder({})
+    builder.edge_index = edges
+    builder.node_ids = np.array(['a', 'b', 'c'])
+
+    features = builder.compute_graph_features()
+
+    np.testing.assert_array_equal(features['in_degree'], [1, 2, 1])
+    np.testing.assert_array_equal(features['out_degree'], [1, 1, 2])
+    np.testing.assert_allclose(features['clustering_coef'], [1, 1, 1])
+
+
+def test_incremental_features_track_stream():
+    """Test streamed degrees and PageRank match a batch recompute"""
+    rng = np.random.default_rng(3)
+    num_rows = 6000
+    # New accounts keep arriving as the window moves
+    drift = np.arange(num_rows) // 1000 * 100
+    data = pd.DataFrame({
+        'source': rng.integers(0, 400, num_rows) + drift,
+        'target': rng.integers(0, 400, num_rows) + drift,
+        'amount': rng.exponential(100.0, num_rows),
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            np.arange(num_rows) * 600, unit='s'
+        )
+    })
+    store = IncrementalGraphStore({
+        'source_col': 'source',
+        'target_col': 'target',
+        'amount_col': 'amount',
+        'timestamp_col': 'timestamp',
+        'window_seconds': 14 * 86400
+    })
+    store.add_transactions(data.iloc[:2000])
+    features = IncrementalGraphFeatures(store, {'pagerank_push_tol': 1e-7})
+
+    for offset in range(2000, num_rows, 250):
+        store.add_transactions(data.iloc[offset:offset + 250])
+        assert features.refresh() > 0
+
+    assert store.num_edges < num_rows - 2000
+    np.testing.assert_array_equal(features.in_degree, store.in_degree)
+    np.testing.assert_array_equal(features.out_degree, store.out_degree)
+
+    expected, _ = pagerank(
+        store.edge_index.numpy(),
+        store.num_nodes,
+        tol=1e-12,
+        max_iter=1000
+    )
+    result = features.compute()
+    assert list(result.index) == list(store.node_ids)
+    np.testing.assert_allclose(result['pagerank'], expected, atol=1e-8)
+
+
+def test_store_features_join_integer_accounts():
+    """Test features keyed by store accounts join back to integer columns"""
+    data = pd.DataFrame({
+        'source': np.array([1001, 1002, 1003, 1001]),
+        'target': np.array([1002, 1003, 1001, 1003]),
+        'amount': [1.0, 2.0, 3.0, 4.0],
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            np.arange(4), unit='s'
+        )
+    })
+    store = IncrementalGraphStore({
+        'source_col': 'source',
+        'target_col': 'target',
+        'amount_col': 'amount',
+        'timestamp_col': 'timestamp'
+    })
+    store.add_transactions(data)
+
+    features = IncrementalGraphFeatures(store, {}).compute()
+    joined = data.join(features, on='source')
+
+    assert joined['out_degree'].tolist() == [2, 1, 1, 2]
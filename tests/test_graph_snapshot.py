@@ -0,0 +1,120 @@
+import numpy as np
+import pandas as pd
+import pytest
+from rt_fads.data.graph_builder import GraphBuilder
+from rt_fads.data.graph_snapshot import load_snapshot
+
+CONFIG = {
+    'source_col': 'source',
+    'target_col': 'target',
+    'amount_col': 'amount',
+    'timestamp_col': 'timestamp'
+}
+
+
+def _builder(accounts, edge_mode: str = 'last') -> GraphBuilder:
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'source': rng.choice(accounts, 1000),
+        'target': rng.choice(accounts, 1000),
+        'amount': rng.exponential(100.0, 1000),
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            rng.integers(0, 86400, 1000), unit='s'
+        )
+    })
+    builder = GraphBuilder({**CONFIG, 'edge_mode': edge_mode})
+    builder.build_graph(data)
+    return builder
+
+
+@pytest.mark.parametrize('accounts', [
+    np.arange(100) * 13 + 5,
+    np.array([f'acct-{i}-é' for i in range(100)], dtype=object)
+])
+def test_snapshot_round_trip(tmp_path, accounts):
+    """Test a loaded snapshot reproduces the built graph"""
+    builder = _builder(accounts, edge_mode='aggregate')
+    path = str(tmp_path / 'graph.snapshot')
+    builder.save_snapshot(path)
+
+    loaded = GraphBuilder.load_snapshot(path, CONFIG, verify=True)
+
+    assert loaded.edge_mode == 'aggregate'
+    assert loaded.edge_index.equal(builder.edge_index)
+    assert loaded.edge_attr.equal(builder.edge_attr)
+    assert list(loaded.node_ids) == list(builder.node_ids)
+    assert loaded.edge_feature_names == builder.edge_feature_names
+    assert loaded.num_transactions == builder.num_transactions
+
+    snapshot = load_snapshot(path)
+    degree = np.bincount(builder.edge_index[0].numpy(),
+                         minlength=len(builder.node_ids))
+    np.testing.assert_array_equal(np.diff(snapshot.indptr.numpy()), degree)
+    assert snapshot.metadata['source_col'] == 'source'
+
+
+def test_snapshot_keeps_edge_timestamps(tmp_path):
+    """Test a loaded builder can still build its temporal index"""
+    builder = _builder(np.arange(50), edge_mode='multi')
+    path = str(tmp_path / 'graph.snapshot')
+    builder.save_snapshot(path)
+
+    loaded = GraphBuilder.load_snapshot(path, CONFIG)
+
+    np.testing.assert_array_equal(
+        loaded.edge_timestamps, builder.edge_timestamps
+    )
+    expected = builder.temporal_index()
+    index = loaded.temporal_index()
+    for name in ('indptr', 'neighbors', 'timestamps', 'edge_ids'):
+        np.testing.assert_array_equal(
+            getattr(index, name), getattr(expected, name)
+        )
+
+
+def test_snapshot_rejects_corruption(tmp_path):
+    """Test checksum, header and version validation"""
+    path = tmp_path / 'graph.snapshot'
+    _builder(np.arange(50)).save_snapshot(str(path))
+    original = path.read_bytes()
+
+    corrupted = bytearray(original)
+    corrupted[len(corrupted) // 2] ^= 0xFF
+    path.write_bytes(bytes(corrupted))
+    load_snapshot(str(path))
+    with pytest.raises(ValueError, match='checksum'):
+        load_snapshot(str(path), verify=True)
+
+    corrupted = bytearray(original)
+    corrupted[30] ^= 0xFF
+    path.write_bytes(bytes(corrupted))
+    with pytest.raises(ValueError, match='header'):
+        load_snapshot(str(path))
+
+    corrupted = bytearray(original)
+    corrupted[8] = 99
+    path.write_bytes(bytes(corrupted))
+    with pytest.raises(ValueError, match='version'):
+        load_snapshot(str(path))
+
+
+def test_snapshot_checks_edge_mode(tmp_path):
+    """Test loading with a different edge mode is rejected"""
+    path = str(tmp_path / 'graph.snapshot')
+    _builder(np.arange(50), edge_mode='multi').save_snapshot(path)
+
+    with pytest.raises(ValueError):
+        GraphBuilder.load_snapshot(path, {**CONFIG, 'edge_mode': 'last'})
+
+
+def test_loaded_arrays_are_copy_on_write(tmp_path):
+    """Test writes to loaded arrays never reach the snapshot file"""
+    builder = _builder(np.arange(50))
+    path = str(tmp_path / 'graph.snapshot')
+    builder.save_snapshot(path)
+
+    loaded = load_snapshot(path, verify=True)
+    loaded.edge_attr.fill_(-1.0)
+
+    reloaded = load_snapshot(path, verify=True)
+    assert reloaded.edge_attr.equal(builder.edge_attr)
@@ -0,0 +1,129 @@
+import numpy as np
+import pandas as pd
+from rt_fads.data.graph_builder import edge_features
+from rt_fads.data.graph_store import IncrementalGraphStore
+
+CONFIG = {
+    'source_col': 'source',
+    'target_col': 'target',
+    'amount_col': 'amount',
+    'timestamp_col': 'timestamp',
+    'edge_features': ['channel'],
+    'window_seconds': 7 * 86400,
+    'initial_capacity': 16
+}
+
+
+def _transactions(num_rows: int, num_accounts: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    return pd.DataFrame({
+        'source': rng.integers(0, num_accounts, num_rows) * 7 + 1000,
+        'target': rng.integers(0, num_accounts, num_rows) * 7 + 1000,
+        'amount': rng.exponential(100.0, num_rows),
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            np.sort(rng.integers(0, 30 * 86400, num_rows)), unit='s'
+        ),
+        'channel': rng.integers(0, 3, num_rows)
+    })
+
+
+def _append(store: IncrementalGraphStore, data: pd.DataFrame, batch: int):
+    for offset in range(0, len(data), batch):
+        store.add_transactions(data.iloc[offset:offset + batch])
+
+
+def _window(data: pd.DataFrame) -> pd.DataFrame:
+    cutoff = data['timestamp'].iloc[-1] - pd.Timedelta(days=7)
+    return data[data['timestamp'] >= cutoff]
+
+
+def test_store_matches_live_window():
+    """Test appended batches equal the transactions inside the window"""
+    data = _transactions(2000, 50)
+    store = IncrementalGraphStore(CONFIG)
+    _append(store, data, 37)
+
+    window = _window(data)
+    assert store.num_edges == len(window)
+
+    accounts = store.node_ids[store.edge_index.numpy()]
+    assert store.node_ids.dtype == np.int64
+    np.testing.assert_array_equal(accounts[0], window['source'])
+    np.testing.assert_array_equal(accounts[1], window['target'])
+
+    features, names = edge_features(window, np.arange(len(window)), CONFIG)
+    np.testing.assert_allclose(store.edge_attr.numpy(), features)
+    assert store.edge_feature_names == names
+
+    sources = pd.Series(accounts[0])
+    np.testing.assert_array_equal(
+        store.out_degree,
+        sources.value_counts().reindex(store.node_ids, fill_value=0)
+    )
+
+
+def test_views_share_memory():
+    """Test edge views are not copies and survive later appends"""
+    data = _transactions(300, 20)
+    store = IncrementalGraphStore(CONFIG)
+    store.add_transactions(data.iloc[:100])
+
+    edge_index = store.edge_index
+    edge_attr = store.edge_attr
+    assert np.shares_memory(edge_index.numpy(), store._edge_index)
+    assert np.shares_memory(edge_attr.numpy(), store._edge_attr)
+
+    snapshot = edge_index.clone()
+    _append(store, data.iloc[100:], 10)
+    assert edge_index.equal(snapshot)
+
+
+def test_adjacency_matches_csr_and_csc():
+    """Test linked adjacency lists and compressed layouts agree"""
+    data = _transactions(1500, 40, seed=1)
+    store = IncrementalGraphStore(CONFIG)
+    _append(store, data, 64)
+
+    csr = store.to_csr()
+    csc = store.to_csc()
+    assert csr is store.to_csr()
+    edge_index = store.edge_index.numpy()
+
+    for node in range(store.num_nodes):
+        out_edges = store.out_edges(node)
+        in_edges = store.in_edges(node)
+        np.testing.assert_array_equal(out_edges[::-1], csr.edges(node))
+        np.testing.assert_array_equal(in_edges[::-1], csc.edges(node))
+        assert (edge_index[0, out_edges] == node).all()
+        assert (edge_index[1, in_edges] == node).all()
+        np.testing.assert_array_equal(
+            csr.neighbors(node),
+            edge_index[1, csr.edges(node)]
+        )
+
+    owners, edges = store.batch_out_edges(np.arange(store.num_nodes))
+    for node in range(store.num_nodes):
+        np.testing.assert_array_equal(
+            edges[owners == node],
+            store.out_edges(node)
+        )
+
+    np.testing.assert_array_equal(csr.degree(), store.out_degree)
+    np.testing.assert_array_equal(csc.degree(), store.in_degree)
+
+
+def test_expire_to_reference_time():
+    """Test explicit expiry drops every edge before the cutoff"""
+    data = _transactions(500, 20)
+    store = IncrementalGraphStore({**CONFIG, 'window_seconds': 86400})
+    store.add_transactions(data)
+
+    now = data['timestamp'].iloc[-1] + pd.Timedelta(hours=12)
+    expired = store.expire(now)
+
+    live = data['timestamp'] >= now - pd.Timedelta(days=1)
+    assert store.num_edges == live.sum()
+    assert expired > 0
+    assert store.out_degree.sum() == live.sum()
+    assert all(len(store.out_edges(n)) == store.out_degree[n]
+               for n in range(store.num_nodes))
@@ -0,0 +1,73 @@
+import json
+import os
+import subprocess
+import sys
+from typing import List, Tuple
+import pytest
+from rt_fads.utils.lazy import lazy_import
+
+# Modules a serving replica imports, and the optional dependencies they
+# must not pull in at import time
+SERVING_MODULES = [
+    'rt_fads.serving.registry',
+    'rt_fads.monitoring.metrics_collector',
+    'rt_fads.data.graph_builder',
+    'rt_fads.data.preprocessing',
+    'rt_fads.utils.metrics'
+]
+OPTIONAL_DEPENDENCIES = [
+    'secretflow', 'captum', 'horovod', 'networkx', 'sklearn',
+    'prometheus_client'
+]
+PRELOAD = ['torch', 'numpy', 'pandas']
+IMPORT_BUDGET_SECONDS = 0.1
+
+
+def _import_in_subprocess(module: str) -> Tuple[float, List[str]]:
+    """Seconds to import ``module`` and the optional dependencies it loads"""
+    script = (
+        ''.join(f'import {name}; ' for name in PRELOAD)
+        + 'import json, sys, time; start = time.perf_counter(); '
+        + f'import {module}; '
+        + 'print(json.dumps([time.perf_counter() - start, '
+        + f'[m for m in {OPTIONAL_DEPENDENCIES!r} if m in sys.modules]]))'
+    )
+    result = subprocess.run(
+        [sys.executable, '-c', script],
+        env=dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path)),
+        capture_output=True,
+        text=True,
+        check=True
+    )
+    seconds, loaded = json.loads(result.stdout.splitlines()[-1])
+    return seconds, loaded
+
+
+@pytest.mark.parametrize('module', SERVING_MODULES)
+def test_import_skips_optional_dependencies(module):
+    """Test importing a module loads no optional dependency"""
+    _, loaded = _import_in_subprocess(module)
+
+    assert loaded == []
+
+
+@pytest.mark.parametrize('module', SERVING_MODULES)
+def test_import_time_budget(module):
+    """Test each module adds little to startup beyond the core libraries"""
+    seconds, _ = _import_in_subprocess(module)
+
+    assert seconds < IMPORT_BUDGET_SECONDS
+
+
+def test_server_import_defers_prometheus():
+    """Test the metrics collector is only created at startup"""
+    _, loaded = _import_in_subprocess('rt_fads.api.server')
+
+    assert 'prometheus_client' not in loaded
+
+
+def test_lazy_import_defers_until_use():
+    """Test a lazy module is imported on first attribute access"""
+    colorsys = lazy_import('colorsys')
+
+    assert colorsys.rgb_to_hsv(1.0, 0.0, 0.0) == (0.0, 1.0, 1.0)
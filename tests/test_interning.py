@@ -0,0 +1,157 @@
+import numpy as np
+import pandas as pd
+import pytest
+from rt_fads.data.graph_builder import GraphBuilder
+from rt_fads.data.graph_store import IncrementalGraphStore
+from rt_fads.data.interning import AccountInterner
+from rt_fads.data.preprocessing import FeatureProcessor
+
+
+def _accounts(num_accounts: int, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    numbers = rng.choice(10 ** 12, num_accounts, replace=False)
+    return np.array([f'ACCT{n:012d}' for n in numbers], dtype=object)
+
+
+def test_encode_matches_first_appearance():
+    """Test batched encoding numbers accounts like one factorize"""
+    accounts = _accounts(3000)
+    rng = np.random.default_rng(1)
+    column = accounts[rng.integers(0, len(accounts), 20000)]
+    # Start tiny so the table is rehashed many times
+    interner = AccountInterner(capacity=4)
+
+    ids = np.concatenate([
+        interner.encode(column[offset:offset + 777])
+        for offset in range(0, len(column), 777)
+    ])
+
+    expected, uniques = pd.factorize(column)
+    np.testing.assert_array_equal(ids, expected)
+    assert ids.dtype == np.int32
+    assert len(interner) == len(uniques)
+    np.testing.assert_array_equal(interner.decode(ids), column)
+    np.testing.assert_array_equal(interner.accounts(), uniques)
+
+
+def test_lookup_and_string_forms():
+    """Test unknown accounts, equal string forms and unicode"""
+    interner = AccountInterner()
+    ids = interner.encode(np.array([12345, 'ünïcode', '12345', 7],
+                                   dtype=object))
+    np.testing.assert_array_equal(ids, [0, 1, 0, 2])
+
+    np.testing.assert_array_equal(
+        interner.lookup(['7', 'missing', 'ünïcode']),
+        [2, -1, 1]
+    )
+    assert len(interner) == 3
+    assert interner.decode([1]).tolist() == ['ünïcode']
+    with pytest.raises(ValueError):
+        interner.encode(['a', None])
+    with pytest.raises(KeyError):
+        interner.decode([3])
+
+
+def test_save_and_load(tmp_path):
+    """Test a reloaded interner keeps its IDs and keeps interning"""
+    accounts = _accounts(5000)
+    interner = AccountInterner(capacity=16)
+    ids = interner.encode(accounts[:4000])
+    path = str(tmp_path / 'accounts.npz')
+    interner.save(path)
+
+    loaded = AccountInterner.load(path)
+    assert len(loaded) == 4000
+    np.testing.assert_array_equal(loaded.lookup(accounts[:4000]), ids)
+    np.testing.assert_array_equal(
+        loaded.encode(accounts),
+        np.arange(5000)
+    )
+    np.testing.assert_array_equal(loaded.accounts(), accounts)
+
+
+def test_integer_accounts_keep_their_dtype(tmp_path):
+    """Test integer accounts decode to integers until a string arrives"""
+    interner = AccountInterner()
+    interner.encode(np.array([1005, 7, 1005]))
+    path = str(tmp_path / 'accounts.npz')
+    interner.save(path)
+
+    loaded = AccountInterner.load(path)
+    for decoded in (interner.accounts(), loaded.accounts()):
+        assert decoded.dtype == np.int64
+        np.testing.assert_array_equal(decoded, [1005, 7])
+
+    # Lookups by string form neither add accounts nor change the dtype
+    assert interner.lookup(['7']).tolist() == [1]
+    assert interner.accounts().dtype == np.int64
+
+    interner.encode(['ACCT1'])
+    assert interner.accounts().tolist() == ['1005', '7', 'ACCT1']
+
+
+def test_empty_save_and_load(tmp_path):
+    """Test a reloaded empty interner can intern accounts"""
+    path = str(tmp_path / 'accounts.npz')
+    AccountInterner().save(path)
+
+    loaded = AccountInterner.load(path)
+    assert len(loaded) == 0
+    np.testing.assert_array_equal(loaded.encode(['x', 'y', 'x']), [0, 1, 0])
+    assert loaded.accounts().tolist() == ['x', 'y']
+
+
+def test_memory_per_account():
+    """Test the measured footprint of interning one million accounts"""
+    accounts = _accounts(1_000_000)
+    interner = AccountInterner()
+    for offset in range(0, len(accounts), 100_000):
+        interner.encode(accounts[offset:offset + 100_000])
+
+    # 16 bytes of hashes, 8 of offset, 16 of string and 8 of slots at
+    # the 0.5 maximum load, plus slack from doubling capacities
+    assert len(interner) == len(accounts)
+    assert interner.memory_bytes / len(interner) < 100
+
+
+def test_shared_node_ids():
+    """Test graph store, builder and features agree on node IDs"""
+    rng = np.random.default_rng(2)
+    accounts = _accounts(200)
+    data = pd.DataFrame({
+        'source': accounts[rng.integers(0, 200, 1000)],
+        'target': accounts[rng.integers(0, 200, 1000)],
+        'amount': rng.exponential(100.0, 1000),
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            np.arange(1000), unit='s'
+        )
+    })
+    config = {
+        'source_col': 'source',
+        'target_col': 'target',
+        'amount_col': 'amount',
+        'timestamp_col': 'timestamp',
+        'numerical_features': ['amount'],
+        'categorical_features': [],
+        'account_features': ['source', 'target']
+    }
+    interner = AccountInterner()
+    processor = FeatureProcessor(config, interner)
+    encoded = processor._process_categorical_features(data, fit=True)
+
+    store = IncrementalGraphStore(config, interner)
+    store.add_transactions(data)
+    builder = GraphBuilder({**config, 'edge_mode': 'multi'}, interner)
+    builder.build_graph(data)
+
+    np.testing.assert_array_equal(
+        store.edge_index.numpy(),
+        encoded.T
+    )
+    rows = np.argsort(encoded[:, 0], kind='stable')
+    np.testing.assert_array_equal(builder.edge_index.numpy(), encoded[rows].T)
+    np.testing.assert_array_equal(
+        store.lookup(data['source']),
+        encoded[:, 0]
+    )
@@ -0,0 +1,185 @@
+import os
+import pickle
+import pytest
+import torch
+from fastapi.testclient import TestClient
+from rt_fads.api import server
+from rt_fads.features.schema import FeatureSchema
+from rt_fads.serving.registry import ModelRegistry, resolve_model_path
+
+
+class ScaledModel(torch.nn.Module):
+    """Stand-in model returning a constant logit"""
+
+    def __init__(self, logit: float):
+        super().__init__()
+        self.logit = logit
+        self.calls = 0
+
+    def forward(self, features, scene_info=None, temporal_info=None):
+        self.calls += 1
+        return torch.full((len(features), 1), self.logit)
+
+
+class Payload:
+    """Arbitrary object that only a full unpickler would rebuild"""
+
+
+@pytest.fixture
+def checkpoints(tmp_path):
+    schema = FeatureSchema(['amount'], ['location'], ['hour'])
+    paths = {}
+    for name in ('v1', 'v2'):
+        path = str(tmp_path / f'{name}.pt')
+        torch.save({
+            'feature_schema': schema.to_dict(),
+            'logit': 1.0 if name == 'v1' else 2.0
+        }, path)
+        paths[name] = path
+    return paths
+
+
+def test_swap_keeps_in_flight_version(checkpoints):
+    """Test a hot swap leaves versions captured by requests untouched"""
+    registry = ModelRegistry(
+        lambda checkpoint: ScaledModel(checkpoint['logit']),
+        warmup_batch_sizes=[1, 4],
+        warmup_rounds=2
+    )
+
+    in_flight = registry.load(checkpoints['v1'])
+    assert in_flight.model.calls == 4
+
+    registry.load_async(checkpoints['v2']).result(timeout=5)
+
+    assert registry.current.version == 'v2'
+    assert in_flight.version == 'v1'
+    assert in_flight.model(torch.zeros(1, 1)).item() == 1.0
+    assert [h['version'] for h in registry.status()['history']] == [
+        'v1', 'v2'
+    ]
+    registry.shutdown()
+
+
+def test_failed_load_keeps_current(checkpoints, tmp_path):
+    """Test a broken checkpoint never replaces the served version"""
+    registry = ModelRegistry(lambda checkpoint: ScaledModel(1.0))
+    registry.load(checkpoints['v1'])
+
+    future = registry.load_async(str(tmp_path / 'missing.pt'))
+
+    with pytest.raises(FileNotFoundError):
+        future.result(timeout=5)
+    assert registry.current.version == 'v1'
+    registry.shutdown()
+
+
+def test_checkpoint_is_read_once(checkpoints, monkeypatch):
+    """Test model, schema and first stage share one checkpoint read"""
+    reads = []
+    load = torch.load
+
+    def counting_load(path, *args, **kwargs):
+        reads.append(path)
+        return load(path, *args, **kwargs)
+
+    monkeypatch.setattr(torch, 'load', counting_load)
+    registry = ModelRegistry(
+        lambda checkpoint: ScaledModel(checkpoint['logit'])
+    )
+
+    model_version = registry.load(checkpoints['v2'])
+
+    assert reads == [checkpoints['v2']]
+    assert model_version.feature_schema.columns['features'] == ['amount']
+    registry.shutdown()
+
+
+def test_checkpoints_load_weights_only(tmp_path):
+    """Test checkpoints holding arbitrary objects are never unpickled"""
+    path = str(tmp_path / 'evil.pt')
+    torch.save({'logit': 1.0, 'payload': Payload()}, path)
+    registry = ModelRegistry(
+        lambda checkpoint: ScaledModel(checkpoint['logit'])
+    )
+
+    with pytest.raises(pickle.UnpicklingError):
+        registry.load(path)
+    with pytest.raises(pickle.UnpicklingError):
+        FeatureSchema.from_checkpoint(path)
+    assert registry.current is None
+    registry.shutdown()
+
+
+def test_resolve_model_path(tmp_path):
+    """Test client paths must stay inside the model directory"""
+    model_dir = tmp_path / 'models'
+    model_dir.mkdir()
+    (model_dir / 'v1.pt').write_bytes(b'')
+    (tmp_path / 'secret.pt').write_bytes(b'')
+    os.symlink(tmp_path / 'secret.pt', model_dir / 'link.pt')
+
+    expected = os.path.realpath(model_dir / 'v1.pt')
+    assert resolve_model_path(str(model_dir), 'v1.pt') == expected
+    assert resolve_model_path(str(model_dir), expected) == expected
+    for path in ('../secret.pt', 'sub/../../secret.pt', 'link.pt',
+                 str(tmp_path / 'secret.pt')):
+        with pytest.raises(ValueError):
+            resolve_model_path(str(model_dir), path)
+
+
+def test_model_routes_require_admin(checkpoints, tmp_path, monkeypatch):
+    """Test hot swaps need the admin token and a path in model_dir"""
+    registry = ModelRegistry(
+        lambda checkpoint: ScaledModel(checkpoint['logit'])
+    )
+    monkeypatch.setattr(server, 'registry', registry)
+    monkeypatch.setattr(server, 'serving_config', {
+        'model_dir': str(tmp_path),
+        'admin_token_env': 'TEST_ADMIN_TOKEN'
+    })
+    monkeypatch.delenv('TEST_ADMIN_TOKEN', raising=False)
+    client = TestClient(server.app)
+    admin = {'Authorization': 'Bearer s3cret'}
+
+    assert client.post(
+        '/models', json={'path': 'v2.pt'}, headers=admin
+    ).status_code == 403
+
+    monkeypatch.setenv('TEST_ADMIN_TOKEN', 's3cret')
+    assert client.post('/models', json={'path': 'v2.pt'}).status_code == 401
+    assert client.post(
+        '/models',
+        json={'path': 'v2.pt'},
+        headers={'Authorization': 'Bearer wrong'}
+    ).status_code == 401
+    assert client.delete('/models/shadow').status_code == 401
+    assert client.post(
+        '/models', json={'path': '../v2.pt'}, headers=admin
+    ).status_code == 400
+    assert client.post(
+        '/models', json={'path': 'missing.pt'}, headers=admin
+    ).status_code == 404
+
+    response = client.post('/models', json={'path': 'v2.pt'}, headers=admin)
+    assert response.status_code == 202
+    registry._loader_pool.shutdown(wait=True)
+    assert registry.current.version == 'v2'
+
+
+def test_model_routes_refuse_disabled_hot_swap(tmp_path, monkeypatch):
+    """Test deployments without hot swaps reject POST /models"""
+    monkeypatch.setattr(server, 'serving_config', {
+        'model_dir': str(tmp_path),
+        'admin_token_env': 'TEST_ADMIN_TOKEN',
+        'hot_swap': False
+    })
+    monkeypatch.setenv('TEST_ADMIN_TOKEN', 's3cret')
+
+    response = TestClient(server.app).post(
+        '/models',
+        json={'path': 'v2.pt'},
+        headers={'Authorization': 'Bearer s3cret'}
+    )
+
+    assert response.status_code == 409
@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+from rt_fads.data.graph_builder import GraphBuilder
+from rt_fads.data.partitioning import (
+    GraphPartitioner,
+    edge_cut,
+    load_assignment,
+    load_shard
+)
+
+
+def _communities(num_groups: int, group_size: int, seed: int = 0):
+    """Dense groups of accounts with a few transfers between groups"""
+    rng = np.random.default_rng(seed)
+    num_edges = num_groups * group_size * 8
+    groups = rng.integers(0, num_groups, num_edges)
+    sources = groups * group_size + rng.integers(0, group_size, num_edges)
+    targets = groups * group_size + rng.integers(0, group_size, num_edges)
+    noise = rng.random(num_edges) < 0.05
+    targets[noise] = rng.integers(0, num_groups * group_size, noise.sum())
+    # Shuffle node IDs so the groups are not contiguous ranges
+    labels = rng.permutation(num_groups * group_size)
+    return np.stack([labels[sources], labels[targets]])
+
+
+@pytest.mark.parametrize('method', ['ldg', 'lpa'])
+def test_partition_balanced_with_low_cut(method):
+    """Test partitions respect capacity and cut far fewer edges than hashing"""
+    edge_index = _communities(8, 250)
+    num_nodes = 2000
+    partitioner = GraphPartitioner({
+        'num_partitions': 4,
+        'method': method,
+        'chunk_size': 64
+    })
+
+    assignment = partitioner.partition(edge_index, num_nodes)
+
+    sizes = np.bincount(assignment, minlength=4)
+    assert sizes.sum() == num_nodes
+    assert sizes.max() <= np.ceil(1.05 * num_nodes / 4)
+    random_cut = edge_cut(edge_index, np.arange(num_nodes) % 4)
+    assert edge_cut(edge_index, assignment) < 0.6 * random_cut
+
+
+def test_partitioner_rejects_balance_below_one():
+    """Test a capacity smaller than the node count is a config error"""
+    with pytest.raises(ValueError, match='balance'):
+        GraphPartitioner({'balance': 0.9})
+
+
+def test_shards_cover_graph(tmp_path):
+    """Test shards own every node once and hold each edge with its halo"""
+    edge_index = _communities(6, 50, seed=1)
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame({
+        'source': [f'acct-{n}' for n in edge_index[0]],
+        'target': [f'acct-{n}' for n in edge_index[1]],
+        'amount': rng.exponential(100.0, edge_index.shape[1])
+    })
+    builder = GraphBuilder({
+        'source_col': 'source',
+        'target_col': 'target',
+        'amount_col': 'amount',
+        'edge_mode': 'multi'
+    })
+    builder.build_graph(data)
+    partitioner = GraphPartitioner({'num_partitions': 3})
+
+    paths = partitioner.write_shards(builder, str(tmp_path))
+    assignment = load_assignment(str(tmp_path))
+    edges = builder.edge_index.numpy()
+    owners = np.zeros(len(builder.node_ids), dtype=np.int64)
+    edge_copies = np.zeros(edges.shape[1], dtype=np.int64)
+
+    for partition, path in enumerate(paths):
+        shard = load_shard(path, verify=True)
+        assert shard.partition == partition
+        global_ids = shard.global_node_ids.numpy()
+        owned = global_ids[:shard.num_owned]
+        halo = global_ids[shard.num_owned:]
+        assert (assignment[owned] == partition).all()
+        assert (assignment[halo] != partition).all()
+        owners[owned] += 1
+
+        edge_ids = shard.edge_ids.numpy()
+        edge_copies[edge_ids] += 1
+        np.testing.assert_array_equal(
+            global_ids[shard.edge_index.numpy()],
+            edges[:, edge_ids]
+        )
+        np.testing.assert_array_equal(
+            shard.node_ids,
+            builder.node_ids[global_ids]
+        )
+        np.testing.assert_array_equal(
+            shard.edge_attr.numpy(),
+            builder.edge_attr.numpy()[edge_ids]
+        )
+
+        boundary = set(global_ids[shard.boundary.numpy()].tolist())
+        crossing = assignment[edges[0]] != assignment[edges[1]]
+        expected = set(edges[:, crossing].ravel().tolist()) & set(
+            owned.tolist()
+        )
+        assert boundary == expected
+
+        # Shards are regular snapshots too
+        loaded = GraphBuilder.load_snapshot(path)
+        assert loaded.edge_index.equal(shard.edge_index)
+
+    assert (owners == 1).all()
+    crossing = assignment[edges[0]] != assignment[edges[1]]
+    np.testing.assert_array_equal(edge_copies, np.where(crossing, 2, 1))
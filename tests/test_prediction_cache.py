@@ -0,0 +1,170 @@
+import asyncio
+import pytest
+import torch
+from fastapi.testclient import TestClient
+from rt_fads.api import server
+from rt_fads.features.schema import FeatureSchema
+from rt_fads.serving.cache import PredictionCache
+from rt_fads.serving.registry import ModelRegistry
+
+
+def test_concurrent_requests_are_coalesced():
+    """Test concurrent lookups for one ID share a single computation"""
+    cache = PredictionCache()
+    calls = []
+
+    async def compute():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return b'{"fraud_probability": 0.1}'
+
+    async def run():
+        return await asyncio.gather(
+            *(cache.get_or_compute('txn-1', compute) for _ in range(5))
+        )
+
+    results = asyncio.run(run())
+
+    assert len(calls) == 1
+    assert {body for body, _ in results} == {b'{"fraud_probability": 0.1}'}
+    assert sorted(result for _, result in results) == [
+        'coalesced', 'coalesced', 'coalesced', 'coalesced', 'miss'
+    ]
+    body, result = asyncio.run(cache.get_or_compute('txn-1', compute))
+    assert result == 'hit' and len(calls) == 1
+    assert cache.hit_rate == pytest.approx(5 / 6)
+
+
+def test_failures_are_shared_but_not_cached():
+    """Test a failed computation reaches waiters and is retried later"""
+    cache = PredictionCache()
+
+    async def fail():
+        await asyncio.sleep(0.01)
+        raise RuntimeError("model error")
+
+    async def run():
+        return await asyncio.gather(
+            cache.get_or_compute('txn-1', fail),
+            cache.get_or_compute('txn-1', fail),
+            return_exceptions=True
+        )
+
+    results = asyncio.run(run())
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert len(cache) == 0
+
+
+def test_cancelled_leader_still_answers_waiters():
+    """Test a disconnecting first caller does not fail coalesced ones"""
+    cache = PredictionCache()
+
+    async def compute():
+        await asyncio.sleep(0.02)
+        return b'{"fraud_probability": 0.1}'
+
+    async def run():
+        leader = asyncio.ensure_future(cache.get_or_compute('txn-1', compute))
+        await asyncio.sleep(0)
+        waiter = asyncio.ensure_future(cache.get_or_compute('txn-1', compute))
+        await asyncio.sleep(0)
+        leader.cancel()
+        return await waiter, leader.cancelled()
+
+    (body, result), leader_cancelled = asyncio.run(run())
+
+    assert leader_cancelled
+    assert (body, result) == (b'{"fraud_probability": 0.1}', 'coalesced')
+    assert cache.get('txn-1') == body
+
+
+def test_key_separates_models_and_explanation_modes():
+    """Test responses are never shared across versions or modes"""
+    keys = {
+        PredictionCache.key('txn-1', version, mode)
+        for version in ('v1', 'v2')
+        for mode in ('none', 'inline')
+    }
+
+    assert len(keys) == 4
+
+
+def test_cache_evicts_lru_and_expired_entries(monkeypatch):
+    """Test the size bound, LRU order and TTL expiry"""
+    now = [0.0]
+    monkeypatch.setattr('time.monotonic', lambda: now[0])
+    cache = PredictionCache(max_entries=2, ttl_seconds=10)
+
+    cache.put('a', b'1')
+    cache.put('b', b'2')
+    assert cache.get('a') == b'1'
+    cache.put('c', b'3')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'1'
+
+    now[0] = 11.0
+    assert cache.get('c') is None
+    assert cache.get('a') is None
+    assert len(cache) == 0 and cache.memory_bytes == 0
+
+
+class ExplainedModel(torch.nn.Module):
+    """Stand-in model with a constant logit and explanation"""
+
+    def forward(self, features, scene_info=None, temporal_info=None):
+        return torch.zeros(len(features), 1)
+
+    def explain_prediction(self, features, scene_info, temporal_info):
+        return {'amount': 1.0}
+
+
+class NullCollector:
+    """Metrics collector discarding every record"""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def test_predict_cache_respects_mode_and_version(tmp_path, monkeypatch):
+    """Test /predict never answers from another mode's or model's result"""
+    path = str(tmp_path / 'v1.pt')
+    torch.save({
+        'feature_schema': FeatureSchema(
+            ['amount'], ['location'], ['hour']
+        ).to_dict()
+    }, path)
+    registry = ModelRegistry(
+        lambda checkpoint: ExplainedModel(),
+        warmup_batch_sizes=[1]
+    )
+    registry.load(path)
+    monkeypatch.setattr(server, 'registry', registry)
+    monkeypatch.setattr(server, 'metrics_collector', NullCollector())
+    monkeypatch.setattr(server, 'serving_config', {'max_wait_ms': 0.1})
+    request = {
+        'transaction_id': 'txn-1',
+        'features': {'amount': 1.0},
+        'scene_info': {'location': 0.0},
+        'temporal_info': {'hour': 9.0}
+    }
+
+    with TestClient(server.app) as client:
+        first = client.post(
+            '/predict',
+            json={**request, 'explanation_mode': 'none'}
+        ).json()
+        inline = client.post(
+            '/predict',
+            json={**request, 'explanation_mode': 'inline'}
+        ).json()
+        registry.load(path, version='v2')
+        swapped = client.post(
+            '/predict',
+            json={**request, 'explanation_mode': 'inline'}
+        ).json()
+
+    assert first['explanation'] is None
+    assert inline['explanation'] == {'amount': 1.0}
+    assert (first['model_version'], swapped['model_version']) == ('v1', 'v2')
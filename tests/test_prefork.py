@@ -0,0 +1,110 @@
+import logging
+import signal
+import threading
+import time
+from types import SimpleNamespace
+import pytest
+import torch
+from rt_fads.serving.prefork import PreforkServer, share_weights
+
+CONFIG = {
+    'deployment': {
+        'host': '127.0.0.1',
+        'port': 0,
+        'workers': 2,
+        'max_worker_restarts': 3
+    }
+}
+
+
+class StubServer(PreforkServer):
+    """Prefork server running ``target`` instead of uvicorn workers"""
+
+    def __init__(self, target):
+        super().__init__('unused.pt', CONFIG)
+        self.target = target
+        self.spawned = 0
+
+    def _load_model(self):
+        return None
+
+    def _run_worker(self, app, sock, index):
+        self.target()
+
+    def _spawn(self, app, sock, index):
+        self.spawned += 1
+        return super()._spawn(app, sock, index)
+
+
+@pytest.fixture(autouse=True)
+def restore_signals():
+    handlers = {
+        signum: signal.getsignal(signum)
+        for signum in (signal.SIGTERM, signal.SIGINT)
+    }
+    yield
+    for signum, handler in handlers.items():
+        signal.signal(signum, handler)
+
+
+def test_share_weights_keeps_outputs(tmp_path):
+    """Test shared weights are frozen and give the same outputs"""
+    model = torch.nn.Linear(8, 2)
+    inputs = torch.randn(4, 8)
+    expected = model(inputs).detach()
+
+    shared = share_weights(model, str(tmp_path / 'weights.pt'))
+
+    assert not any(p.requires_grad for p in shared.parameters())
+    torch.testing.assert_close(shared(inputs), expected)
+
+
+def test_failing_workers_are_restarted_then_reported(caplog):
+    """Test failed workers exit nonzero, are respawned, then give up"""
+    def fail():
+        raise RuntimeError("worker startup failed")
+
+    server = StubServer(fail)
+
+    with caplog.at_level(logging.ERROR):
+        with pytest.raises(RuntimeError):
+            server.run()
+
+    assert server.spawned == 2 + 3
+    assert server.workers == {}
+    assert 'exited unexpectedly with status 1' in caplog.text
+
+
+def test_stop_terminates_workers_without_restart():
+    """Test shutdown reaps every worker and spawns no replacements"""
+    server = StubServer(lambda: time.sleep(30))
+    threading.Timer(0.5, server._stop_workers).start()
+
+    start_time = time.time()
+    server.run()
+
+    assert time.time() - start_time < 10
+    assert server.spawned == 2
+    assert server.workers == {}
+
+
+def test_workers_disable_hot_swap(tmp_path, monkeypatch):
+    """Test preforked workers refuse swaps that would reach one worker"""
+    from rt_fads.api import server
+
+    model = torch.nn.Linear(2, 1)
+    monkeypatch.setattr(server, 'serving_config', {})
+    monkeypatch.setattr(server, 'init_model', lambda path: None)
+    monkeypatch.setattr(
+        server,
+        'registry',
+        SimpleNamespace(current=SimpleNamespace(model=model))
+    )
+    prefork = PreforkServer('unused.pt', {
+        'deployment': {'shared_weights_path': str(tmp_path / 'w.pt')},
+        'serving': {'max_batch_size': 4}
+    })
+
+    prefork._load_model()
+
+    assert server.serving_config == {'max_batch_size': 4, 'hot_swap': False}
@@ -0,0 +1,102 @@
+import time
+import numpy as np
+import torch
+from rt_fads.features.schema import FeatureSchema
+from rt_fads.serving.cascade import FirstStageModel
+from rt_fads.serving.registry import ModelVersion
+from rt_fads.serving.shadow import ShadowScorer
+
+
+class ConstantModel(torch.nn.Module):
+    """Stand-in model returning a constant logit"""
+
+    def __init__(self, logit: float):
+        super().__init__()
+        self.logit = logit
+
+    def forward(self, features, scene_info=None, temporal_info=None):
+        return torch.full((len(features), 1), self.logit)
+
+
+class RecordingCollector:
+    """Collects shadow metric calls"""
+
+    def __init__(self):
+        self.shadow = []
+        self.latency_deltas = []
+        self.dropped = 0
+
+    def record_shadow(self, primary_prob, shadow_prob, latency_delta,
+                      model_version):
+        self.shadow.append((primary_prob, shadow_prob, model_version))
+        self.latency_deltas.append(latency_delta)
+
+    def record_shadow_dropped(self):
+        self.dropped += 1
+
+
+def _candidate(logit: float) -> ModelVersion:
+    return ModelVersion(
+        version='candidate',
+        model=ConstantModel(logit),
+        path='candidate.pt',
+        feature_schema=FeatureSchema(['amount'], ['location'], ['hour'])
+    )
+
+
+def test_shadow_records_agreement():
+    """Test queued requests are scored and compared with the primary"""
+    collector = RecordingCollector()
+    scorer = ShadowScorer(collector, sample_rate=1.0)
+    scorer.start()
+
+    candidate = _candidate(4.0)
+    row = np.zeros(3, dtype=np.float32)
+    for primary_prob in (0.9, 0.1):
+        assert scorer.submit(candidate, row, primary_prob, 0.001)
+
+    deadline = time.time() + 5
+    while len(collector.shadow) < 2 and time.time() < deadline:
+        time.sleep(0.01)
+    scorer.stop()
+
+    assert [(p, v) for p, _, v in collector.shadow] == [
+        (0.9, 'candidate'), (0.1, 'candidate')
+    ]
+    assert all(s > 0.98 for _, s, _ in collector.shadow)
+
+
+def test_shadow_scores_through_candidate_cascade():
+    """Test the candidate is compared as served, stage for stage"""
+    collector = RecordingCollector()
+    scorer = ShadowScorer(collector, sample_rate=1.0, cascade_band=0.3)
+    scorer.start()
+
+    candidate = _candidate(4.0)
+    # Logit -3 puts the first stage below the escalation threshold
+    candidate.first_stage = FirstStageModel(np.zeros(3), -3.0)
+    assert scorer.submit(candidate, np.zeros(3, dtype=np.float32), 0.1, 1.0)
+
+    deadline = time.time() + 5
+    while not collector.shadow and time.time() < deadline:
+        time.sleep(0.01)
+    scorer.stop()
+
+    (_, shadow_prob, _), = collector.shadow
+    assert abs(shadow_prob - 1 / (1 + np.exp(3.0))) < 1e-6
+    # Scoring times are compared, not whole-request latencies
+    assert -1.0 < collector.latency_deltas[0] < -0.5
+
+
+def test_shadow_drops_when_saturated():
+    """Test submit never blocks and drops work once the queue is full"""
+    collector = RecordingCollector()
+    scorer = ShadowScorer(collector, max_queue_size=2)
+
+    candidate = _candidate(0.0)
+    row = np.zeros(3, dtype=np.float32)
+    accepted = [scorer.submit(candidate, row, 0.5, 0.001) for _ in range(5)]
+
+    assert accepted == [True, True, False, False, False]
+    assert collector.dropped == 3
+    assert scorer.queue_depth == 2
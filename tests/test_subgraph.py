@@ -0,0 +1,115 @@
+import numpy as np
+import pandas as pd
+import pytest
+from rt_fads.data.graph_store import IncrementalGraphStore
+from rt_fads.data.subgraph import SubgraphSampler
+
+CONFIG = {
+    'source_col': 'source',
+    'target_col': 'target',
+    'amount_col': 'amount',
+    'timestamp_col': 'timestamp',
+    'window_seconds': 30 * 86400
+}
+
+
+def _store(num_rows: int = 3000, num_accounts: int = 200, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    data = pd.DataFrame({
+        'source': rng.integers(0, num_accounts, num_rows),
+        'target': rng.integers(0, num_accounts, num_rows),
+        'amount': rng.exponential(100.0, num_rows),
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            np.sort(rng.integers(0, 20 * 86400, num_rows)), unit='s'
+        )
+    })
+    store = IncrementalGraphStore(CONFIG)
+    for offset in range(0, num_rows, 500):
+        store.add_transactions(data.iloc[offset:offset + 500])
+    return store
+
+
+def reference_edges(store, seeds, bounds, fanouts, time_respecting):
+    """Breadth-first expansion over the raw edge list"""
+    edge_index = store.edge_index.numpy()
+    timestamps = store.timestamps
+    visited = set(seeds)
+    frontier = {}
+    for seed, bound in zip(seeds, bounds):
+        frontier[seed] = bound
+    edges = set()
+    for fanout in fanouts:
+        next_frontier = {}
+        for node, bound in frontier.items():
+            for side in (0, 1):
+                candidates = [
+                    e for e in np.flatnonzero(edge_index[side] == node)[::-1]
+                    if bound is None or timestamps[e] < bound
+                ][:fanout]
+                for e in candidates:
+                    edges.add(int(e))
+                    neighbor = int(edge_index[1 - side, e])
+                    time = int(timestamps[e]) if time_respecting else None
+                    if neighbor in next_frontier:
+                        old = next_frontier[neighbor]
+                        next_frontier[neighbor] = (
+                            None if old is None or time is None
+                            else max(old, time)
+                        )
+                    elif neighbor not in visited:
+                        visited.add(neighbor)
+                        next_frontier[neighbor] = time
+        frontier = next_frontier
+    return edges
+
+
+@pytest.mark.parametrize('time_respecting', [True, False])
+def test_sample_matches_reference(time_respecting):
+    """Test sampled edges follow fan-out caps and time order"""
+    store = _store()
+    sampler = SubgraphSampler({
+        'fanouts': [5, 3],
+        'time_respecting': time_respecting
+    })
+    seeds = [0, 7, 0]
+    seed_time = pd.Timestamp('2024-03-15')
+
+    subgraph = sampler.sample(store, seeds, [seed_time] * len(seeds))
+
+    bound = seed_time.value if time_respecting else None
+    expected = reference_edges(
+        store, [0, 7], [bound, bound], [5, 3], time_respecting
+    )
+    assert set(subgraph.edge_ids.tolist()) == expected
+    if time_respecting:
+        assert (store.timestamps[subgraph.edge_ids] < bound).all()
+
+
+def test_sample_relabels_edges():
+    """Test local edges map back to the store's edges and features"""
+    store = _store(seed=1)
+    sampler = SubgraphSampler({'fanouts': [10, 10]})
+
+    subgraph = sampler.sample(store, store.lookup([3, 11]))
+
+    assert subgraph.node_ids[subgraph.seed_index].tolist() == (
+        store.lookup([3, 11]).tolist()
+    )
+    np.testing.assert_array_equal(
+        subgraph.node_ids[subgraph.edge_index.numpy()],
+        store.edge_index.numpy()[:, subgraph.edge_ids]
+    )
+    np.testing.assert_array_equal(
+        subgraph.edge_attr.numpy(),
+        store.edge_attr.numpy()[subgraph.edge_ids]
+    )
+    assert subgraph.edge_index.max() < subgraph.num_nodes
+    assert len(np.unique(subgraph.node_ids)) == subgraph.num_nodes
+
+
+def test_sample_rejects_unknown_seeds():
+    """Test accounts missing from the store are rejected as seeds"""
+    store = _store()
+    sampler = SubgraphSampler({'fanouts': [2]})
+    with pytest.raises(ValueError):
+        sampler.sample(store, store.lookup(['missing']))
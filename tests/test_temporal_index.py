@@ -0,0 +1,123 @@
+import numpy as np
+import pandas as pd
+import pytest
+from rt_fads.data.graph_builder import GraphBuilder
+from rt_fads.data.graph_store import IncrementalGraphStore
+from rt_fads.data.temporal_index import TemporalNeighborIndex
+
+CONFIG = {
+    'source_col': 'source',
+    'target_col': 'target',
+    'amount_col': 'amount',
+    'timestamp_col': 'timestamp'
+}
+
+
+def _edges(num_nodes: int, num_edges: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    edge_index = rng.integers(0, num_nodes, (2, num_edges))
+    # Coarse times so many edges of a node share a timestamp
+    timestamps = rng.integers(0, 200, num_edges)
+    return edge_index, timestamps
+
+
+def _reference(edge_index, timestamps, node, before, k, direction):
+    """Brute-force scan of every edge"""
+    edges = pd.DataFrame({
+        'source': edge_index[0],
+        'target': edge_index[1],
+        'timestamp': timestamps,
+        'edge_id': np.arange(edge_index.shape[1])
+    })
+    parts = []
+    if direction in ('out', 'both'):
+        parts.append(edges[edges['source'] == node].assign(
+            neighbor=lambda e: e['target']))
+    if direction in ('in', 'both'):
+        parts.append(edges[edges['target'] == node].assign(
+            neighbor=lambda e: e['source']))
+    edges = pd.concat(parts)
+    if before is not None:
+        edges = edges[edges['timestamp'] < before]
+    edges = edges.sort_values(['timestamp', 'edge_id'], kind='stable')
+    if k is not None:
+        edges = edges.iloc[max(len(edges) - k, 0):]
+    return edges
+
+
+@pytest.mark.parametrize('direction', ['out', 'in', 'both'])
+def test_queries_match_scan(direction):
+    """Test windows and batched queries against a full scan"""
+    num_nodes = 60
+    edge_index, timestamps = _edges(num_nodes, 3000)
+    index = TemporalNeighborIndex.from_edges(
+        edge_index,
+        timestamps,
+        num_nodes,
+        direction
+    )
+
+    rng = np.random.default_rng(1)
+    nodes = rng.integers(0, num_nodes, 200)
+    before = rng.integers(-5, 210, 200)
+    for k in [None, 1, 7]:
+        batch = index.query(nodes, before, k)
+        assert len(batch) == len(nodes)
+        for i, (node, bound) in enumerate(zip(nodes, before)):
+            expected = _reference(edge_index, timestamps, node, bound, k,
+                                  direction)
+            window = index.window(node, bound, k)
+            found = slice(batch.indptr[i], batch.indptr[i + 1])
+            for edge_ids in (index.edge_ids[window], batch.edge_ids[found]):
+                np.testing.assert_array_equal(edge_ids, expected['edge_id'])
+            np.testing.assert_array_equal(
+                batch.neighbors[found],
+                expected['neighbor']
+            )
+            np.testing.assert_array_equal(
+                batch.timestamps[found],
+                expected['timestamp']
+            )
+
+    everything = index.query(np.arange(num_nodes))
+    assert everything.indptr[-1] == len(index.edge_ids)
+
+
+def test_builder_and_store_indexes():
+    """Test indexes built from a graph builder and the live store"""
+    rng = np.random.default_rng(2)
+    data = pd.DataFrame({
+        'source': rng.integers(0, 30, 500),
+        'target': rng.integers(0, 30, 500),
+        'amount': rng.exponential(100.0, 500),
+        'timestamp': pd.Timestamp('2024-03-01') + pd.to_timedelta(
+            rng.integers(0, 86400, 500), unit='s'
+        )
+    })
+    builder = GraphBuilder({**CONFIG, 'edge_mode': 'multi'})
+    builder.build_graph(data)
+    index = builder.temporal_index()
+
+    cutoff = pd.Timestamp('2024-03-01 12:00')
+    node = int(builder.edge_index[0, 0])
+    account = builder.node_ids[node]
+    window = index.window(node, cutoff, k=5)
+    expected = data[
+        (data['source'] == account) & (data['timestamp'] < cutoff)
+    ].sort_values('timestamp', kind='stable').tail(5)
+    np.testing.assert_array_equal(
+        builder.node_ids[index.neighbors[window]],
+        expected['target']
+    )
+
+    store = IncrementalGraphStore({**CONFIG, 'initial_capacity': 16})
+    store.add_transactions(data.sort_values('timestamp'))
+    index = TemporalNeighborIndex.from_store(store, 'in')
+    for node in range(store.num_nodes):
+        np.testing.assert_array_equal(
+            np.sort(index.edge_ids[index.window(node)]),
+            np.sort(store.in_edges(node))
+        )
+
+    with pytest.raises(ValueError):
+        GraphBuilder(CONFIG).temporal_index()
@@ -0,0 +1,107 @@
+import numpy as np
+import pandas as pd
+import pytest
+from rt_fads.data.preprocessing import FeatureProcessor
+
+CONFIG = {
+    'numerical_features': ['amount', 'balance'],
+    'categorical_features': ['category', 'channel'],
+    'account_features': ['source_account', 'target_account'],
+    'scene_features': ['scene', 'device_risk'],
+    'timestamp_col': 'timestamp'
+}
+
+
+def _rows(num_rows: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    start = pd.Timestamp('2024-01-01')
+    rows = []
+    for i in range(num_rows):
+        timestamp = start + pd.Timedelta(
+            seconds=int(rng.integers(0, 365 * 86400)),
+            microseconds=int(rng.integers(0, 10 ** 6))
+        )
+        rows.append({
+            'amount': float(rng.lognormal(4.0, 1.5)),
+            'balance': int(rng.integers(0, 10 ** 7)),
+            'category': str(rng.choice(['food', 'travel', 'fuel'])),
+            'channel': int(rng.integers(0, 5)),
+            'source_account': f'acct-{rng.integers(0, 50)}',
+            'target_account': f'acct-{rng.integers(0, 80)}',
+            'timestamp': timestamp.isoformat(),
+            'prev_timestamp': (
+                timestamp - pd.Timedelta(seconds=int(rng.integers(1, 10 ** 6)))
+            ).isoformat(),
+            'scene': int(rng.integers(0, 3)),
+            'device_risk': float(rng.random()),
+            'node_in_degree': int(rng.integers(0, 20)),
+            'node_out_degree': int(rng.integers(0, 20)),
+            'clustering_coef': float(rng.random()),
+            'pagerank': float(rng.random() * 1e-4)
+        })
+    return rows
+
+
+def _fitted() -> FeatureProcessor:
+    processor = FeatureProcessor(CONFIG)
+    processor.fit_transform(pd.DataFrame(_rows(2000)))
+    return processor
+
+
+def _assert_bitwise_equal(actual: np.ndarray, expected: np.ndarray):
+    assert actual.dtype == np.float32
+    assert actual.shape == expected.shape
+    np.testing.assert_array_equal(actual.view(np.uint32),
+                                  expected.view(np.uint32))
+
+
+def test_plan_matches_dataframe_transform():
+    """Test the plan reproduces transform bit for bit"""
+    processor = _fitted()
+    plan = processor.export_plan()
+    rows = _rows(300, seed=1)
+    # Accounts never seen in fitting encode as -1 on both paths
+    rows[0]['source_account'] = 'acct-new'
+
+    expected = processor.transform(pd.DataFrame(rows)).numpy()
+
+    _assert_bitwise_equal(plan.transform(rows), expected)
+    for i in [0, 1, 150]:
+        _assert_bitwise_equal(plan.transform(rows[i]), expected[i])
+    # Cached account IDs give the same result
+    _assert_bitwise_equal(plan.transform(rows), expected)
+
+
+def test_plan_matches_optional_columns_and_timestamp_types():
+    """Test missing optional columns and non-string timestamps"""
+    processor = _fitted()
+    plan = processor.export_plan()
+    rows = _rows(20, seed=2)
+    for row in rows:
+        for col in ['prev_timestamp', 'device_risk', 'pagerank']:
+            del row[col]
+    batches = [rows[:4], rows[4:8], rows[8:12], rows[12:16]]
+    for row in batches[1]:
+        row['timestamp'] = pd.Timestamp(row['timestamp'])
+    for row in batches[2]:
+        row['timestamp'] = pd.Timestamp(row['timestamp']).value
+    for row in batches[3]:
+        row['timestamp'] = row['timestamp'][:19] + '+02:00'
+        row['prev_timestamp'] = '2024-01-01T09:00:00Z'
+
+    for batch in batches:
+        expected = processor.transform(pd.DataFrame(batch)).numpy()
+        _assert_bitwise_equal(plan.transform(batch), expected)
+
+
+def test_plan_rejects_unseen_categories():
+    """Test unseen categories fail like the label encoders"""
+    processor = _fitted()
+    plan = processor.export_plan()
+    row = _rows(1, seed=3)[0]
+    row['category'] = 'unknown'
+
+    with pytest.raises(ValueError):
+        processor.transform(pd.DataFrame([row]))
+    with pytest.raises(ValueError):
+        plan.transform(row)
@@ -0,0 +1,40 @@
+import pytest
+import numpy as np
+from rt_fads.features.schema import FeatureSchema
+from rt_fads.serving.explanations import ExplanationMode
+from rt_fads.serving.wire_format import decode_frame, encode_frame
+
+
+@pytest.fixture
+def schema():
+    return FeatureSchema(['amount', 'merchant_id'], ['location'], ['hour'])
+
+
+def test_frame_roundtrip(schema):
+    """Test encoding and zero-copy decoding of a frame"""
+    row = np.array([120.5, 7.0, 3.0, 14.0], dtype=np.float32)
+    body = encode_frame('txn-1', row, schema, ExplanationMode.DEFERRED)
+
+    frame = decode_frame(body, schema)
+
+    assert frame.transaction_id == 'txn-1'
+    assert frame.explanation_mode == ExplanationMode.DEFERRED
+    np.testing.assert_array_equal(frame.row, row)
+    assert not frame.row.flags.owndata
+
+
+def test_frame_rejects_other_schema(schema):
+    """Test frames encoded for a different layout are refused"""
+    other = FeatureSchema(['merchant_id', 'amount'], ['location'], ['hour'])
+    body = encode_frame('txn-1', np.zeros(4, dtype=np.float32), other)
+
+    with pytest.raises(ValueError, match="schema"):
+        decode_frame(body, schema)
+
+
+def test_frame_rejects_truncated_body(schema):
+    """Test truncated frames are refused"""
+    body = encode_frame('txn-1', np.zeros(4, dtype=np.float32), schema)
+
+    with pytest.raises(ValueError):
+        decode_frame(body[:-2], schema)